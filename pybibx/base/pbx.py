@@ -13,8 +13,11 @@
 ############################################################################
 
 # Required Libraries
-import chardet
+import gc
 import google.generativeai as genai
+import hashlib
+import json
+import math
 import networkx as nx
 import numpy as np
 import openai
@@ -24,8 +27,13 @@ import plotly.graph_objects as go
 import plotly.subplots as ps
 import plotly.io as pio
 import re
+import shutil
+import tempfile
 import unicodedata
 import textwrap
+import time
+import torch
+import weakref
 
 try:
     import importlib.resources as pkg_resources
@@ -34,16 +42,17 @@ except ImportError:
 from . import stws
 
 from bertopic import BERTopic
-from collections import Counter, defaultdict
+from bertopic.vectorizers import OnlineCountVectorizer
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
 
 # from keybert import KeyBERT
 from gensim.models import FastText
-from itertools import combinations
 from matplotlib import pyplot as plt
 
 plt.style.use("bmh")
-from numba import njit
+from numba import njit, prange
 from numba.typed import List
 
 # from rapidfuzz import fuzz
@@ -51,8 +60,10 @@ from scipy.ndimage import gaussian_filter1d
 from scipy.signal import find_peaks
 from scipy.sparse import coo_matrix
 from scipy.sparse import csr_matrix
+from scipy.sparse import triu
 from sentence_transformers import SentenceTransformer
-from sklearn.cluster import KMeans, HDBSCAN
+from sklearn.cluster import KMeans, HDBSCAN, MiniBatchKMeans
+from sklearn.decomposition import IncrementalPCA
 from sklearn.decomposition import TruncatedSVD as tsvd
 from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -108,11 +119,1178 @@ def build_edges_ref(ref_idx_list):
     return row_indices, col_indices
 
 
+@njit
+def louvain_local_moving(indptr, indices, weights, k, labels, resolution, m2, order):
+    n = k.shape[0]
+    tot = np.zeros(n, dtype=np.float64)
+    for i in range(0, n):
+        tot[labels[i]] = tot[labels[i]] + k[i]
+    neigh_w = np.zeros(n, dtype=np.float64)
+    neigh_c = np.empty(n, dtype=np.int64)
+    seen = np.zeros(n, dtype=np.bool_)
+    improved = False
+    moved = True
+    while moved:
+        moved = False
+        for t in range(0, n):
+            i = order[t]
+            ci = labels[i]
+            cnt = 0
+            for p in range(indptr[i], indptr[i + 1]):
+                j = indices[p]
+                if j == i:
+                    continue
+                c = labels[j]
+                if not seen[c]:
+                    seen[c] = True
+                    neigh_c[cnt] = c
+                    cnt = cnt + 1
+                neigh_w[c] = neigh_w[c] + weights[p]
+            tot[ci] = tot[ci] - k[i]
+            best_c = ci
+            best_gain = neigh_w[ci] - resolution * tot[ci] * k[i] / m2
+            for q in range(0, cnt):
+                c = neigh_c[q]
+                gain = neigh_w[c] - resolution * tot[c] * k[i] / m2
+                if gain > best_gain + 1e-12:
+                    best_gain = gain
+                    best_c = c
+            tot[best_c] = tot[best_c] + k[i]
+            labels[i] = best_c
+            if best_c != ci:
+                moved = True
+                improved = True
+            for q in range(0, cnt):
+                neigh_w[neigh_c[q]] = 0.0
+                seen[neigh_c[q]] = False
+    return labels, improved
+
+
+@njit
+def label_propagation_sweep(indptr, indices, weights, labels, order, max_iter):
+    n = labels.shape[0]
+    neigh_w = np.zeros(n, dtype=np.float64)
+    neigh_c = np.empty(n, dtype=np.int64)
+    seen = np.zeros(n, dtype=np.bool_)
+    for _ in range(0, max_iter):
+        changed = False
+        for t in range(0, n):
+            i = order[t]
+            cnt = 0
+            for p in range(indptr[i], indptr[i + 1]):
+                j = indices[p]
+                if j == i:
+                    continue
+                c = labels[j]
+                if not seen[c]:
+                    seen[c] = True
+                    neigh_c[cnt] = c
+                    cnt = cnt + 1
+                neigh_w[c] = neigh_w[c] + weights[p]
+            if cnt > 0:
+                best_c = labels[i]
+                best_w = neigh_w[best_c] if seen[best_c] else 0.0
+                for q in range(0, cnt):
+                    c = neigh_c[q]
+                    if neigh_w[c] > best_w:
+                        best_w = neigh_w[c]
+                        best_c = c
+                if best_c != labels[i]:
+                    labels[i] = best_c
+                    changed = True
+            for q in range(0, cnt):
+                neigh_w[neigh_c[q]] = 0.0
+                seen[neigh_c[q]] = False
+        if not changed:
+            break
+    return labels
+
+
+# Community Detection over a Symmetric Sparse Adjacency. Method: "louvain" or "lpa"
+def community_labels(adjacency, method="louvain", resolution=1.0, seed=42, max_iter=100):
+    adjacency = csr_matrix(adjacency, dtype=np.float64)
+    n = adjacency.shape[0]
+    rng = np.random.default_rng(seed)
+    membership = np.arange(0, n, dtype=np.int64)
+    if n == 0:
+        return membership
+    if method == "lpa":
+        order = rng.permutation(n).astype(np.int64)
+        membership = label_propagation_sweep(
+            adjacency.indptr, adjacency.indices, adjacency.data, membership, order, max_iter
+        )
+    else:
+        level = adjacency
+        for _ in range(0, max_iter):
+            k = np.asarray(level.sum(axis=1)).ravel()
+            m2 = k.sum()
+            if m2 <= 0:
+                break
+            n_lvl = level.shape[0]
+            labels = np.arange(0, n_lvl, dtype=np.int64)
+            order = rng.permutation(n_lvl).astype(np.int64)
+            labels, improved = louvain_local_moving(
+                level.indptr, level.indices, level.data, k, labels, resolution, m2, order
+            )
+            if not improved:
+                break
+            _, labels = np.unique(labels, return_inverse=True)
+            membership = labels[membership]
+            P = csr_matrix(
+                (np.ones(n_lvl), (np.arange(0, n_lvl), labels)),
+                shape=(n_lvl, labels.max() + 1),
+            )
+            level = (P.T @ level @ P).tocsr()
+    _, membership, sizes = np.unique(membership, return_inverse=True, return_counts=True)
+    rank = np.empty(sizes.shape[0], dtype=np.int64)
+    rank[np.argsort(-sizes, kind="stable")] = np.arange(0, sizes.shape[0])
+    return rank[membership]
+
+
+@njit
+def bh_quadtree(pos, max_depth):
+    n = pos.shape[0]
+    cap = 8 * n + 64
+    children = np.full((cap, 4), -1, dtype=np.int64)
+    leaf = np.ones(cap, dtype=np.bool_)
+    body = np.full(cap, -1, dtype=np.int64)
+    mass = np.zeros(cap, dtype=np.float64)
+    com = np.zeros((cap, 2), dtype=np.float64)
+    center = np.zeros((cap, 2), dtype=np.float64)
+    half = np.zeros(cap, dtype=np.float64)
+    x_min, x_max = pos[:, 0].min(), pos[:, 0].max()
+    y_min, y_max = pos[:, 1].min(), pos[:, 1].max()
+    center[0, 0] = (x_min + x_max) / 2
+    center[0, 1] = (y_min + y_max) / 2
+    half[0] = max(x_max - x_min, y_max - y_min) / 2 + 1e-9
+    count = 1
+    for i in range(0, n):
+        node = 0
+        depth = 0
+        while True:
+            if leaf[node]:
+                if mass[node] == 0.0:
+                    body[node] = i
+                    mass[node] = 1.0
+                    com[node, 0] = pos[i, 0]
+                    com[node, 1] = pos[i, 1]
+                    break
+                if depth >= max_depth or count + 4 > cap:
+                    m = mass[node]
+                    com[node, 0] = (com[node, 0] * m + pos[i, 0]) / (m + 1)
+                    com[node, 1] = (com[node, 1] * m + pos[i, 1]) / (m + 1)
+                    mass[node] = m + 1
+                    break
+                h = half[node] / 2
+                for q in range(0, 4):
+                    children[node, q] = count
+                    center[count, 0] = center[node, 0] + (h if q & 1 else -h)
+                    center[count, 1] = center[node, 1] + (h if q & 2 else -h)
+                    half[count] = h
+                    count = count + 1
+                j = body[node]
+                q = (1 if pos[j, 0] >= center[node, 0] else 0) + (
+                    2 if pos[j, 1] >= center[node, 1] else 0
+                )
+                c = children[node, q]
+                body[c] = j
+                mass[c] = mass[node]
+                com[c, 0] = com[node, 0]
+                com[c, 1] = com[node, 1]
+                leaf[node] = False
+                body[node] = -1
+            else:
+                m = mass[node]
+                com[node, 0] = (com[node, 0] * m + pos[i, 0]) / (m + 1)
+                com[node, 1] = (com[node, 1] * m + pos[i, 1]) / (m + 1)
+                mass[node] = m + 1
+                q = (1 if pos[i, 0] >= center[node, 0] else 0) + (
+                    2 if pos[i, 1] >= center[node, 1] else 0
+                )
+                node = children[node, q]
+                depth = depth + 1
+    return children[:count], leaf[:count], mass[:count], com[:count], half[:count]
+
+
+@njit
+def bh_repulsion(pos, children, leaf, mass, com, half, k2, theta):
+    n = pos.shape[0]
+    disp = np.zeros((n, 2), dtype=np.float64)
+    stack = np.empty(children.shape[0] + 1, dtype=np.int64)
+    theta2 = theta * theta
+    for i in range(0, n):
+        stack[0] = 0
+        top = 1
+        while top > 0:
+            top = top - 1
+            node = stack[top]
+            if mass[node] == 0.0:
+                continue
+            dx = pos[i, 0] - com[node, 0]
+            dy = pos[i, 1] - com[node, 1]
+            d2 = dx * dx + dy * dy
+            if leaf[node] or 4 * half[node] * half[node] < theta2 * d2:
+                if d2 < 1e-18:
+                    continue
+                f = k2 * mass[node] / d2
+                disp[i, 0] = disp[i, 0] + dx * f
+                disp[i, 1] = disp[i, 1] + dy * f
+            else:
+                for q in range(0, 4):
+                    if children[node, q] >= 0:
+                        stack[top] = children[node, q]
+                        top = top + 1
+    return disp
+
+
+@njit
+def bh_force_layout(indptr, indices, weights, pos, k, iterations, theta, max_depth):
+    n = pos.shape[0]
+    t = max(
+        pos[:, 0].max() - pos[:, 0].min(), pos[:, 1].max() - pos[:, 1].min()
+    ) * 0.1
+    dt = t / (iterations + 1)
+    for _ in range(0, iterations):
+        children, leaf, mass, com, half = bh_quadtree(pos, max_depth)
+        disp = bh_repulsion(pos, children, leaf, mass, com, half, k * k, theta)
+        for i in range(0, n):
+            for p in range(indptr[i], indptr[i + 1]):
+                j = indices[p]
+                if j == i:
+                    continue
+                dx = pos[i, 0] - pos[j, 0]
+                dy = pos[i, 1] - pos[j, 1]
+                f = np.sqrt(dx * dx + dy * dy) * weights[p] / k
+                disp[i, 0] = disp[i, 0] - dx * f
+                disp[i, 1] = disp[i, 1] - dy * f
+        for i in range(0, n):
+            length = np.sqrt(disp[i, 0] * disp[i, 0] + disp[i, 1] * disp[i, 1])
+            if length > 1e-12:
+                step = min(length, t) / length
+                pos[i, 0] = pos[i, 0] + disp[i, 0] * step
+                pos[i, 1] = pos[i, 1] + disp[i, 1] * step
+        t = t - dt
+    return pos
+
+
+# Force-Directed Layout (Barnes-Hut Fruchterman-Reingold) over a Sparse Adjacency
+def force_layout(adjacency, seed=42, scale=1, k=None, iterations=50, theta=0.9):
+    adjacency = csr_matrix(adjacency, dtype=np.float64)
+    adjacency = adjacency.maximum(adjacency.T).tocsr()
+    n = adjacency.shape[0]
+    if n < 2:
+        return np.zeros((n, 2))
+    rng = np.random.default_rng(seed)
+    pos = rng.random((n, 2))
+    if k is None:
+        k = np.sqrt(1.0 / n)
+    pos = bh_force_layout(
+        adjacency.indptr, adjacency.indices, adjacency.data, pos, k, iterations, theta, 32
+    )
+    pos = pos - pos.mean(axis=0)
+    lim = np.abs(pos).max()
+    if lim > 0:
+        pos = pos * scale / lim
+    return pos
+
+
+# Graph Hash (Node Labels + CSR Structure and Weights)
+def graph_hash(nodes, adjacency):
+    h = hashlib.sha1()
+    h.update("\x1f".join(str(node) for node in nodes).encode("utf-8"))
+    h.update(np.asarray(adjacency.indptr, dtype=np.int64).tobytes())
+    h.update(np.asarray(adjacency.indices, dtype=np.int64).tobytes())
+    h.update(np.asarray(adjacency.data, dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+@njit
+def dag_topological_order(indptr, indices, n):
+    indeg = np.zeros(n, dtype=np.int64)
+    for p in range(0, indptr[n]):
+        indeg[indices[p]] = indeg[indices[p]] + 1
+    order = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for u in range(0, n):
+        if indeg[u] == 0:
+            order[tail] = u
+            tail = tail + 1
+    while head < tail:
+        u = order[head]
+        head = head + 1
+        for p in range(indptr[u], indptr[u + 1]):
+            v = indices[p]
+            indeg[v] = indeg[v] - 1
+            if indeg[v] == 0:
+                order[tail] = v
+                tail = tail + 1
+    return order, tail
+
+
+@njit
+def search_path_counts(indptr, indices, order):
+    n = order.shape[0]
+    indeg = np.zeros(n, dtype=np.int64)
+    for p in range(0, indptr[n]):
+        indeg[indices[p]] = indeg[indices[p]] + 1
+    spc_minus = np.zeros(n, dtype=np.float64)
+    splc_minus = np.zeros(n, dtype=np.float64)
+    for t in range(0, n):
+        u = order[t]
+        if indeg[u] == 0:
+            spc_minus[u] = spc_minus[u] + 1
+        splc_minus[u] = splc_minus[u] + 1
+        for p in range(indptr[u], indptr[u + 1]):
+            v = indices[p]
+            spc_minus[v] = spc_minus[v] + spc_minus[u]
+            splc_minus[v] = splc_minus[v] + splc_minus[u]
+    n_plus = np.zeros(n, dtype=np.float64)
+    for t in range(n - 1, -1, -1):
+        u = order[t]
+        if indptr[u + 1] == indptr[u]:
+            n_plus[u] = 1.0
+        for p in range(indptr[u], indptr[u + 1]):
+            n_plus[u] = n_plus[u] + n_plus[indices[p]]
+    spc = np.empty(indptr[n], dtype=np.float64)
+    splc = np.empty(indptr[n], dtype=np.float64)
+    for u in range(0, n):
+        for p in range(indptr[u], indptr[u + 1]):
+            spc[p] = spc_minus[u] * n_plus[indices[p]]
+            splc[p] = splc_minus[u] * n_plus[indices[p]]
+    return spc, splc
+
+
+@njit
+def dag_best_paths(indptr, indices, weights, order):
+    n = order.shape[0]
+    best = np.zeros(n, dtype=np.float64)
+    nxt = np.full(n, -1, dtype=np.int64)
+    for t in range(n - 1, -1, -1):
+        u = order[t]
+        for p in range(indptr[u], indptr[u + 1]):
+            v = indices[p]
+            val = weights[p] + best[v]
+            if nxt[u] == -1 or val > best[u]:
+                best[u] = val
+                nxt[u] = v
+    return best, nxt
+
+
+# Citation DAG (CSR, Citing -> Cited) and Topological Order. Edges Closing a Cycle are Dropped
+def citation_dag(src, tgt, n):
+    src = np.asarray(src, dtype=np.int64)
+    tgt = np.asarray(tgt, dtype=np.int64)
+    keep = src != tgt
+    adjacency = csr_matrix(
+        (np.ones(int(keep.sum())), (src[keep], tgt[keep])), shape=(n, n)
+    )
+    adjacency.sum_duplicates()
+    adjacency.data[:] = 1
+    order, n_ord = dag_topological_order(adjacency.indptr, adjacency.indices, n)
+    if n_ord < n:
+        placed = np.zeros(n, dtype=bool)
+        placed[order[:n_ord]] = True
+        order = np.concatenate([order[:n_ord], np.where(~placed)[0]])
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.arange(0, n)
+        coo = adjacency.tocoo()
+        keep = rank[coo.row] < rank[coo.col]
+        adjacency = csr_matrix(
+            (coo.data[keep], (coo.row[keep], coo.col[keep])), shape=(n, n)
+        )
+    adjacency.sort_indices()
+    return adjacency, order
+
+
+@njit
+def k_core_numbers(indptr, indices, n):
+    deg = np.diff(indptr).astype(np.int64)
+    md = 0
+    for v in range(0, n):
+        if deg[v] > md:
+            md = deg[v]
+    bins = np.zeros(md + 1, dtype=np.int64)
+    for v in range(0, n):
+        bins[deg[v]] = bins[deg[v]] + 1
+    start = 0
+    for d in range(0, md + 1):
+        num = bins[d]
+        bins[d] = start
+        start = start + num
+    pos = np.empty(n, dtype=np.int64)
+    vert = np.empty(n, dtype=np.int64)
+    for v in range(0, n):
+        pos[v] = bins[deg[v]]
+        vert[pos[v]] = v
+        bins[deg[v]] = bins[deg[v]] + 1
+    for d in range(md, 0, -1):
+        bins[d] = bins[d - 1]
+    bins[0] = 0
+    for i in range(0, n):
+        v = vert[i]
+        for p in range(indptr[v], indptr[v + 1]):
+            u = indices[p]
+            if deg[u] > deg[v]:
+                du = deg[u]
+                pu = pos[u]
+                pw = bins[du]
+                w = vert[pw]
+                if u != w:
+                    pos[u] = pw
+                    vert[pu] = w
+                    pos[w] = pu
+                    vert[pw] = u
+                bins[du] = bins[du] + 1
+                deg[u] = deg[u] - 1
+    return deg
+
+
+# Ranked Main Paths (Best Weighted Path from each Source of the Citation DAG)
+def ranked_main_paths(adjacency, order, weights, min_path_size=2, topn=-1):
+    indptr, indices = adjacency.indptr, adjacency.indices
+    n = order.shape[0]
+    best, nxt = dag_best_paths(indptr, indices, weights, order)
+    in_deg = np.bincount(indices, minlength=n)
+    sources = np.where((in_deg == 0) & (np.diff(indptr) > 0))[0]
+    sources = sources[np.lexsort((-sources, -best[sources]))]
+    paths = []
+    for source in sources:
+        path = follow_path(nxt, source)
+        if len(path) >= min_path_size:
+            paths.append(path)
+        if topn > 0 and len(paths) >= topn:
+            break
+    return paths
+
+
+# Path Reconstruction from Successor Pointers
+def follow_path(nxt, start):
+    path = [int(start)]
+    while nxt[path[-1]] >= 0:
+        path.append(int(nxt[path[-1]]))
+    return path
+
+
+@njit
+def combination_counts(indptr, group):
+    n_docs = indptr.shape[0] - 1
+    counts = np.zeros(n_docs, dtype=np.int64)
+    for d in range(0, n_docs):
+        n = indptr[d + 1] - indptr[d]
+        c = 1
+        for i in range(0, group):
+            c = c * (n - i) // (i + 1)
+        counts[d] = max(c, 0)
+    return counts
+
+
+@njit
+def combination_keys(indptr, ids, group, base, total, hashed=False):
+    keys = np.empty(total, dtype=np.int64)
+    idx = np.empty(group, dtype=np.int64)
+    pos = 0
+    for d in range(0, indptr.shape[0] - 1):
+        start = indptr[d]
+        n = indptr[d + 1] - start
+        if n < group:
+            continue
+        for t in range(0, group):
+            idx[t] = t
+        while True:
+            if hashed:
+                h = np.uint64(0)
+                for t in range(0, group):
+                    h = splitmix64(h ^ np.uint64(ids[start + idx[t]]))
+                keys[pos] = np.int64(h)
+            else:
+                key = 0
+                for t in range(0, group):
+                    key = key * base + ids[start + idx[t]]
+                keys[pos] = key
+            pos = pos + 1
+            t = group - 1
+            while t >= 0 and idx[t] == n - group + t:
+                t = t - 1
+            if t < 0:
+                break
+            idx[t] = idx[t] + 1
+            for u in range(t + 1, group):
+                idx[u] = idx[u - 1] + 1
+    return keys
+
+
+# Member IDs of every Combination whose Hashed Key is in targets (Sorted)
+@njit
+def combination_members(indptr, ids, group, targets):
+    idx = np.empty(group, dtype=np.int64)
+    members = np.empty((0, group), dtype=np.int64)
+    found = np.empty(0, dtype=np.int64)
+    n_match = 0
+    for stage in range(0, 2):
+        if stage == 1:
+            members = np.empty((n_match, group), dtype=np.int64)
+            found = np.empty(n_match, dtype=np.int64)
+            n_match = 0
+        for d in range(0, indptr.shape[0] - 1):
+            start = indptr[d]
+            n = indptr[d + 1] - start
+            if n < group:
+                continue
+            for t in range(0, group):
+                idx[t] = t
+            while True:
+                h = np.uint64(0)
+                for t in range(0, group):
+                    h = splitmix64(h ^ np.uint64(ids[start + idx[t]]))
+                key = np.int64(h)
+                j = np.searchsorted(targets, key)
+                if j < targets.shape[0] and targets[j] == key:
+                    if stage == 1:
+                        found[n_match] = key
+                        for t in range(0, group):
+                            members[n_match, t] = ids[start + idx[t]]
+                    n_match = n_match + 1
+                t = group - 1
+                while t >= 0 and idx[t] == n - group + t:
+                    t = t - 1
+                if t < 0:
+                    break
+                idx[t] = idx[t] + 1
+                for u in range(t + 1, group):
+                    idx[u] = idx[u - 1] + 1
+    return found, members
+
+
+@njit
+def splitmix64(x):
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+@njit
+def cms_update(table, keys, counts, seeds):
+    width = np.uint64(table.shape[1])
+    for i in range(0, keys.shape[0]):
+        for r in range(0, table.shape[0]):
+            h = splitmix64(np.uint64(keys[i]) ^ seeds[r]) % width
+            table[r, h] = table[r, h] + counts[i]
+
+
+@njit
+def cms_query(table, keys, seeds):
+    width = np.uint64(table.shape[1])
+    est = np.empty(keys.shape[0], dtype=np.int64)
+    for i in range(0, keys.shape[0]):
+        m = np.iinfo(np.int64).max
+        for r in range(0, table.shape[0]):
+            h = splitmix64(np.uint64(keys[i]) ^ seeds[r]) % width
+            if table[r, h] < m:
+                m = table[r, h]
+        est[i] = m
+    return est
+
+
+# Merge (Key, Count) Arrays
+def merge_counts(keys_a, counts_a, keys_b, counts_b):
+    keys, inv = np.unique(np.concatenate([keys_a, keys_b]), return_inverse=True)
+    counts = np.bincount(inv, weights=np.concatenate([counts_a, counts_b]))
+    return keys, counts.astype(np.int64)
+
+
+# Co-Occurrence Counter for one Shard of Documents. Width = 0: Exact; Width > 0: Count-Min Sketch
+def co_occurrence_shard(
+    indptr,
+    ids,
+    group,
+    base,
+    width=0,
+    depth=4,
+    n_cand=1000,
+    max_keys=2**22,
+    hashed=False,
+):
+    seeds = np.arange(1, depth + 1, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    table = np.zeros((depth, max(width, 1)), dtype=np.int64)
+    acc_keys = np.empty(0, dtype=np.int64)
+    acc_counts = np.empty(0, dtype=np.int64)
+    per_doc = combination_counts(indptr, group)
+    cum = np.cumsum(per_doc)
+    bounds = [0]
+    while bounds[-1] < per_doc.shape[0]:
+        a = bounds[-1]
+        done = cum[a - 1] if a > 0 else 0
+        b = int(np.searchsorted(cum, done + max_keys, side="right"))
+        bounds.append(max(b, a + 1))
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        sub_ptr = indptr[a : b + 1] - indptr[a]
+        sub_ids = ids[indptr[a] : indptr[b]]
+        keys = combination_keys(
+            sub_ptr, sub_ids, group, base, int(per_doc[a:b].sum()), hashed
+        )
+        keys, counts = np.unique(keys, return_counts=True)
+        if width > 0:
+            cms_update(table, keys, counts, seeds)
+            keys = np.union1d(acc_keys, keys)
+            counts = cms_query(table, keys, seeds)
+            if keys.shape[0] > n_cand:
+                top = np.argpartition(-counts, n_cand - 1)[:n_cand]
+                keys, counts = keys[top], counts[top]
+            acc_keys, acc_counts = keys, counts
+        else:
+            acc_keys, acc_counts = merge_counts(acc_keys, acc_counts, keys, counts)
+    return acc_keys, acc_counts, table
+
+
+# Sleeping Beauty Coefficients (B, SBI, t_a, c0, cm, t_m) for every Row of a (Refs x Years) Count Matrix
+def sleeping_beauty_coefficients(counts):
+    counts = np.asarray(counts, dtype=np.float64)
+    n_refs, n_years = counts.shape
+    t = np.arange(0, n_years, dtype=np.float64)[None, :]
+    c0 = counts[:, 0] if n_years > 0 else np.zeros(n_refs)
+    cm = counts.max(axis=1) if n_years > 0 else np.zeros(n_refs)
+    t_m = counts.argmax(axis=1) if n_years > 0 else np.zeros(n_refs, dtype=np.int64)
+    valid = t_m > 0
+    t_m_ = np.where(valid, t_m, 1).astype(np.float64)[:, None]
+    slope = (cm - c0)[:, None] / t_m_
+    mask = (t <= t_m_) & valid[:, None]
+    L = slope * t + c0[:, None]
+    B = np.where(mask, (L - counts) / np.maximum(1, counts), 0.0).sum(axis=1)
+    denom = np.sqrt((cm - c0) ** 2 + t_m.astype(np.float64) ** 2)
+    d = np.abs((cm - c0)[:, None] * t - t_m_ * counts + t_m_ * c0[:, None])
+    d = np.where(mask, d / np.maximum(1, denom)[:, None], -np.inf)
+    t_a = np.where(valid, d.argmax(axis=1) if n_years > 0 else 0, 0)
+    SBI = np.where(denom > 0, B / np.where(denom > 0, denom, 1), 0.0)
+    B = np.where(valid, B, 0.0)
+    t_m = np.where(valid, t_m, 0)
+    return B, SBI, t_a, c0, cm, t_m
+
+
+# Strings -> Concatenated Code Points and Offsets
+def encode_strings(strings):
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(item) for item in strings])
+    chars = np.frombuffer("".join(strings).encode("utf-32-le"), dtype=np.uint32)
+    return chars.astype(np.int64), offsets
+
+
+@njit
+def minhash_signatures(chars, offsets, n_gram, seeds):
+    n = offsets.shape[0] - 1
+    sig = np.full((n, seeds.shape[0]), np.iinfo(np.uint64).max, dtype=np.uint64)
+    for i in range(0, n):
+        a, b = offsets[i] - 1, offsets[i + 1] + 1
+        for g in range(a, max(b - n_gram + 1, a + 1)):
+            h = np.uint64(0)
+            for t in range(g, min(g + n_gram, b)):
+                c = chars[t] if t >= offsets[i] and t < offsets[i + 1] else -1
+                h = splitmix64(h ^ np.uint64(c + 1))
+            for r in range(0, seeds.shape[0]):
+                v = splitmix64(h ^ seeds[r])
+                if v < sig[i, r]:
+                    sig[i, r] = v
+    return sig
+
+
+@njit
+def block_pairs(members, starts, max_block, window):
+    total = 0
+    for b in range(0, starts.shape[0] - 1):
+        m = starts[b + 1] - starts[b]
+        if m <= max_block:
+            total = total + m * (m - 1) // 2
+        else:
+            total = total + m * window
+    left = np.empty(total, dtype=np.int64)
+    right = np.empty(total, dtype=np.int64)
+    pos = 0
+    for b in range(0, starts.shape[0] - 1):
+        a, e = starts[b], starts[b + 1]
+        for i in range(a, e):
+            stop = e if e - a <= max_block else min(e, i + 1 + window)
+            for j in range(i + 1, stop):
+                left[pos] = min(members[i], members[j])
+                right[pos] = max(members[i], members[j])
+                pos = pos + 1
+    return left[:pos], right[:pos]
+
+
+@njit(parallel=True)
+def indel_ratios(chars, offsets, left, right, cut):
+    ratio = np.zeros(left.shape[0], dtype=np.float64)
+    for p in prange(left.shape[0]):
+        a0, b0 = offsets[left[p]], offsets[right[p]]
+        la, lb = offsets[left[p] + 1] - a0, offsets[right[p] + 1] - b0
+        if la + lb == 0:
+            ratio[p] = 1.0
+            continue
+        if 2.0 * min(la, lb) / (la + lb) < cut:
+            continue
+        prev = np.zeros(lb + 1, dtype=np.int64)
+        cur = np.zeros(lb + 1, dtype=np.int64)
+        for x in range(0, la):
+            for y in range(0, lb):
+                if chars[a0 + x] == chars[b0 + y]:
+                    cur[y + 1] = prev[y] + 1
+                else:
+                    cur[y + 1] = max(prev[y + 1], cur[y])
+            prev, cur = cur, prev
+        ratio[p] = 2.0 * prev[lb] / (la + lb)
+    return ratio
+
+
+# Fuzzy Candidate Pairs (i < j). Blocking: "lsh" (Character n-gram MinHash + Sorted Window), "window" or "none"
+def fuzzy_candidates(
+    strings, blocking="lsh", n_gram=2, n_bands=30, n_rows=4, window=5, max_block=500
+):
+    n = len(strings)
+    if blocking == "none":
+        left, right = np.triu_indices(n, k=1)
+        return left.astype(np.int64), right.astype(np.int64)
+    chars, offsets = encode_strings(strings)
+    order = np.array(sorted(range(0, n), key=strings.__getitem__), dtype=np.int64)
+    blocks = [(np.zeros(n, dtype=np.uint64), 0)]
+    if blocking == "lsh":
+        seeds = np.arange(1, n_bands * n_rows + 1, dtype=np.uint64) * np.uint64(
+            0x9E3779B97F4A7C15
+        )
+        sig = minhash_signatures(chars, offsets, n_gram, seeds)
+        for b in range(0, n_bands):
+            band = sig[:, b * n_rows : (b + 1) * n_rows]
+            key = np.full(n, np.uint64(b), dtype=np.uint64)
+            for r in range(0, n_rows):
+                key = key * np.uint64(0x100000001B3) ^ band[:, r]
+            blocks.append((key[order], max_block))
+    lefts, rights = [], []
+    for key, block_max in blocks:
+        srt = np.argsort(key, kind="stable")
+        key, member = key[srt], order[srt]
+        starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1], True])
+        left, right = block_pairs(member, starts, block_max, window)
+        lefts.append(left)
+        rights.append(right)
+    pair = np.unique(np.concatenate(lefts) * n + np.concatenate(rights))
+    return pair // n, pair % n
+
+
+# Normalized Title Keys (Lower Case; no Accents, Punctuation or Numbers)
+def normalize_titles(titles):
+    t = pd.Series(titles, dtype=object).fillna("").astype(str).str.lower()
+    t = t.str.replace("’", "'", regex=False).str.normalize("NFKD")
+    t = t.str.encode("ascii", "ignore").str.decode("ascii")
+    t = t.str.replace(r"[^a-z']+", " ", regex=True).str.split().str.join(" ")
+    return t.where(t != "unknown", "").reset_index(drop=True)
+
+
+# Normalized DOI Keys (Lower Case; no Resolver Prefix)
+def normalize_dois(dois):
+    d = pd.Series(dois, dtype=object).fillna("").astype(str).str.strip().str.lower()
+    d = d.str.replace(r"^(https?://)?(dx\.)?doi\.org/|^doi:\s*", "", regex=True)
+    return d.where(d != "unknown", "").reset_index(drop=True)
+
+
+# Index of the First Record Sharing each Key (-1 for Empty Keys)
+def first_occurrence(keys):
+    codes, uniques = pd.factorize(keys)
+    idx = np.arange(codes.shape[0])
+    first = np.zeros(len(uniques), dtype=np.int64)
+    first[codes[::-1]] = idx[::-1]
+    return np.where((keys != "").to_numpy(), first[codes], -1)
+
+
+# Duplicated Records -> Kept Record Index and Match Rule ("doi", "title", "near"). Near: Title MinHash + Indel Ratio
+def duplicate_records(dois, titles, near_dupl=False, cut_ratio=0.90):
+    d_key = normalize_dois(dois)
+    t_key = normalize_titles(titles)
+    idx = np.arange(t_key.shape[0])
+    keep = idx.copy()
+    rule = np.full(idx.shape[0], "", dtype=object)
+    for key, name in [(t_key, "title"), (d_key, "doi")]:
+        first = first_occurrence(key)
+        m = (first >= 0) & (first < idx)
+        keep[m] = first[m]
+        rule[m] = name
+    if near_dupl and idx.shape[0] > 1:
+        strings = t_key.tolist()
+        left, right = fuzzy_candidates(strings, n_gram=4, n_bands=16, n_rows=5, window=2)
+        valid = (t_key != "").to_numpy()
+        m = valid[left] & valid[right]
+        left, right = left[m], right[m]
+        chars, offsets = encode_strings(strings)
+        m = indel_ratios(chars, offsets, left, right, cut_ratio) >= cut_ratio
+        near = idx.copy()
+        np.minimum.at(near, right[m], left[m])
+        m = (keep == idx) & (near < idx)
+        keep[m] = near[m]
+        rule[m] = "near"
+    while True:
+        nxt = keep[keep]
+        if (nxt == keep).all():
+            break
+        keep = nxt
+    return keep, rule
+
+
+# Stopword Files and Encodings (Precomputed) by Language Alias
+stopword_files = {
+    ("ar", "ara", "arabic"): ("Stopwords-Arabic.txt", "utf-8"),
+    ("bn", "ben", "bengali"): ("Stopwords-Bengali.txt", "utf-8-sig"),
+    ("bg", "bul", "bulgarian"): ("Stopwords-Bulgarian.txt", "utf-8"),
+    ("zh", "chi", "chinese"): ("Stopwords-Chinese.txt", "utf-8"),
+    ("cs", "cze", "ces", "czech"): ("Stopwords-Czech.txt", "utf-8"),
+    ("en", "eng", "english"): ("Stopwords-English.txt", "ascii"),
+    ("fi", "fin", "finnish"): ("Stopwords-Finnish.txt", "cp1252"),
+    ("fr", "fre", "fra", "french"): ("Stopwords-French.txt", "iso-8859-1"),
+    ("de", "ger", "deu", "german"): ("Stopwords-German.txt", "cp1252"),
+    ("el", "gre", "greek"): ("Stopwords-Greek.txt", "utf-8"),
+    ("he", "heb", "hebrew"): ("Stopwords-Hebrew.txt", "utf-8"),
+    ("hi", "hin", "hind", "hindi"): ("Stopwords-Hindi.txt", "utf-8"),
+    ("hu", "hun", "hungarian"): ("Stopwords-Hungarian.txt", "utf-8"),
+    ("it", "ita", "italian"): ("Stopwords-Italian.txt", "utf-8"),
+    ("ja", "jpn", "japanese"): ("Stopwords-Japanese.txt", "utf-8"),
+    ("ko", "kor", "korean"): ("Stopwords-Korean.txt", "utf-8"),
+    ("mr", "mar", "marathi"): ("Stopwords-Marathi.txt", "utf-8"),
+    ("fa", "per", "fas", "persian"): ("Stopwords-Persian.txt", "utf-8"),
+    ("pl", "pol", "polish"): ("Stopwords-Polish.txt", "utf-8"),
+    ("pt-br", "por-br", "portuguese-br"): ("Stopwords-Portuguese-br.txt", "ascii"),
+    ("ro", "rum", "ron", "romanian"): ("Stopwords-Romanian.txt", "utf-8"),
+    ("ru", "rus", "russian"): ("Stopwords-Russian.txt", "utf-8-sig"),
+    ("sk", "slo", "slovak"): ("Stopwords-Slovak.txt", "utf-8"),
+    ("es", "spa", "spanish"): ("Stopwords-Spanish.txt", "cp1252"),
+    ("sv", "swe", "swedish"): ("Stopwords-Swedish.txt", "cp1252"),
+    ("th", "tha", "thai"): ("Stopwords-Thai.txt", "utf-8"),
+    ("uk", "ukr", "ukrainian"): ("Stopwords-Ukrainian.txt", "utf-8"),
+}
+stopword_alias = {a: v for k, v in stopword_files.items() for a in k}
+stopword_cache = {}
+
+
+# Stopwords of a Language as a frozenset (Each File is Read and Decoded once per Process)
+def stopword_set(language="en"):
+    if language not in stopword_alias:
+        raise ValueError("Unknown stopword language: " + str(language))
+    name, encoding = stopword_alias[language]
+    if name not in stopword_cache:
+        with pkg_resources.open_text(stws, name, encoding=encoding) as file:
+            content = file.read().split("\n")
+        content = [line.rstrip("\r").rstrip("\n") for line in content]
+        stopword_cache[name] = frozenset(filter(None, content))
+    return stopword_cache[name]
+
+
+# Translation Tables: Bytes other than [a-zA-Z0-9'] -> Space; Digits -> Space
+special_chars_bytes = bytes(
+    c if chr(c).isascii() and (chr(c).isalnum() or chr(c) == "'") else 32
+    for c in range(0, 256)
+)
+numbers_table = str.maketrans("0123456789", " " * 10)
+
+
+# Accent Fold Table for str.translate (NFD, Non-ASCII Dropped). Filled Lazily per Character
+class accent_table(dict):
+    def __missing__(self, key):
+        value = (
+            unicodedata.normalize("NFD", chr(key)).encode("ascii", "ignore").decode()
+        )
+        self[key] = value
+        return value
+
+
+accent_fold = accent_table()
+
+
+# Single-Pass Text Normalization. Options: (lowercase, rmv_special_chars, stopwords, rmv_accents, rmv_numbers)
+def clean_documents(corpus, options):
+    lowercase, rmv_special_chars, stopwords, rmv_accents, rmv_numbers = options
+    cleaned = []
+    for text in corpus:
+        text = str(text)
+        if lowercase:
+            text = text.lower().replace("’", "'")
+        if rmv_special_chars:
+            text = text.encode("ascii", "replace").translate(special_chars_bytes)
+            text = text.decode("ascii")
+        if stopwords:
+            text = " ".join([x for x in text.split() if x not in stopwords])
+        if rmv_accents and not text.isascii():
+            text = text.translate(accent_fold)
+        if rmv_numbers:
+            text = text.translate(numbers_table)
+        cleaned.append(" ".join(text.split()))
+    return cleaned
+
+
+# Minimum Documents per clear_text Worker (Below it, Pickling and Process Start Outweigh the Parallel Gain)
+clean_worker_min = 10000
+
+
+# Model Loaders by Kind: "sentence" (SentenceTransformer), "pegasus" (Tokenizer, Model), "bert_sum" (Extractive Summarizer)
+model_loaders = {
+    "sentence": lambda name: SentenceTransformer(name),
+    "sentence_int8": lambda name: torch.quantization.quantize_dynamic(
+        SentenceTransformer(name, device="cpu"), {torch.nn.Linear}, dtype=torch.qint8
+    ),
+    "sentence_onnx": lambda name: SentenceTransformer(name, backend="onnx"),
+    "pegasus": lambda name: (
+        PegasusTokenizer.from_pretrained(name),
+        PegasusForConditionalGeneration.from_pretrained(name),
+    ),
+    "bert_sum": lambda name: Summarizer(),
+}
+
+
+# Approximate Model Size (MB) from its Parameter Tensors
+def model_size_mb(model, depth=0):
+    if isinstance(model, tuple):
+        return sum(model_size_mb(item, depth) for item in model)
+    if callable(getattr(model, "parameters", None)):
+        try:
+            return sum(p.numel() * p.element_size() for p in model.parameters()) / 2**20
+        except:
+            return 0.0
+    if depth < 3 and hasattr(model, "model"):
+        return model_size_mb(model.model, depth + 1)
+    return 0.0
+
+
+# Process-Wide Model Registry (LRU Eviction Beyond a Memory Budget in MB)
+class model_registry:
+    def __init__(self, budget_mb=4096):
+        self.budget_mb = budget_mb
+        self.models = OrderedDict()
+
+    def get(self, kind="sentence", name="allenai/scibert_scivocab_uncased"):
+        key = (kind, name)
+        if key in self.models:
+            self.models.move_to_end(key)
+        else:
+            model = model_loaders[kind](name)
+            self.models[key] = (model, model_size_mb(model))
+            self.evict()
+        return self.models[key][0]
+
+    def evict(self):
+        while len(self.models) > 1 and self.total_mb() > self.budget_mb:
+            self.models.popitem(last=False)
+        gc.collect()
+
+    def release(self, kind=None, name=None):
+        for key in list(self.models.keys()):
+            if (kind is None or key[0] == kind) and (name is None or key[1] == name):
+                del self.models[key]
+        gc.collect()
+
+    def total_mb(self):
+        return sum(size for _, size in self.models.values())
+
+
+model_cache = model_registry()
+
+
+# On-Disk Embedding Store for one Model (Append-Only, Memory-Mapped .npy Chunks; Keys: SHA-1 Hex of the Encoded Text)
+class embedding_store:
+    def __init__(self, path, model, dtype="float32"):
+        self.path = os.path.join(path, hashlib.sha1(model.encode("utf-8")).hexdigest())
+        self.dtype = dtype
+        self.index = {}
+        self.chunks = []
+        self.next = 0
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, "model.txt"), "w") as file:
+            file.write(model)
+        names = sorted(f for f in os.listdir(self.path) if f.endswith(".keys.npy"))
+        for name in names:
+            self.load_chunk(name[: -len(".keys.npy")])
+
+    def load_chunk(self, name):
+        keys = np.load(os.path.join(self.path, name + ".keys.npy"))
+        vectors = np.load(os.path.join(self.path, name + ".npy"), mmap_mode="r")
+        c = len(self.chunks)
+        self.chunks.append(vectors)
+        self.next = max(self.next, int(name[len("chunk_") :]) + 1)
+        for row, key in enumerate(keys.tolist()):
+            self.index[key] = (c, row)
+
+    def lookup(self, keys):
+        found = [self.index.get(key, (-1, -1)) for key in keys]
+        chunk = np.array([c for c, _ in found], dtype=np.int64)
+        row = np.array([r for _, r in found], dtype=np.int64)
+        dim = self.chunks[0].shape[1] if len(self.chunks) > 0 else 0
+        vectors = np.zeros((len(keys), dim), dtype=np.float32)
+        for c in np.unique(chunk[chunk >= 0]):
+            m = chunk == c
+            vectors[m] = self.chunks[c][row[m]]
+        return vectors, np.flatnonzero(chunk < 0)
+
+    def add(self, keys, vectors):
+        name = "chunk_" + str(self.next).zfill(6)
+        np.save(os.path.join(self.path, name + ".npy"), vectors.astype(self.dtype))
+        np.save(
+            os.path.join(self.path, name + ".keys.npy"), np.array(keys, dtype="U40")
+        )
+        self.load_chunk(name)
+
+
+embedding_stores = {}
+
+
+# Evict Cache Files, Oldest First, until the Cache fits max_mb (max_mb <= 0: Clear All). Files Sharing a Stem are Evicted Together
+def cache_evict(path, max_mb=0):
+    sizes, mtimes, groups = defaultdict(int), defaultdict(float), defaultdict(list)
+    for root, _, files in os.walk(path):
+        for name in files:
+            file = os.path.join(root, name)
+            stat = os.stat(file)
+            key = (root, name.split(".")[0])
+            sizes[key] = sizes[key] + stat.st_size
+            mtimes[key] = max(mtimes[key], stat.st_mtime)
+            groups[key].append(file)
+    total = sum(sizes.values())
+    removed = 0
+    for key in sorted(groups.keys(), key=lambda k: mtimes[k]):
+        if max_mb > 0 and total <= max_mb * 1024 * 1024:
+            break
+        for file in groups[key]:
+            os.remove(file)
+        total = total - sizes[key]
+        removed = removed + sizes[key]
+    for root, dirs, files in os.walk(path, topdown=False):
+        if root != path and len(os.listdir(root)) == 0:
+            os.rmdir(root)
+    for key in [key for key in embedding_stores.keys() if key[0] == path]:
+        del embedding_stores[key]
+    return removed / (1024 * 1024)
+
+
+# Inverted-File (IVF) ANN Index: k-Means Coarse Quantizer over L2-Normalized Vectors; Text Key -> List
+class ivf_index:
+    def __init__(self, centroids=None, keys=[], lists=[]):
+        self.centroids = centroids
+        self.lists = dict(zip(keys, lists))
+
+    def fit(self, vectors, keys, n_lists=0, seed=1001):
+        vectors = normalize_rows(vectors)
+        if n_lists <= 0:
+            n_lists = int(math.sqrt(vectors.shape[0]))
+        n_lists = max(1, min(n_lists, vectors.shape[0]))
+        kmeans = MiniBatchKMeans(
+            n_clusters=n_lists, n_init=1, batch_size=4096, random_state=seed
+        )
+        kmeans.fit(vectors)
+        self.centroids = normalize_rows(kmeans.cluster_centers_)
+        self.lists = {}
+        self.insert(vectors, keys)
+
+    def insert(self, vectors, keys):
+        new = [i for i, key in enumerate(keys) if key not in self.lists]
+        if len(new) > 0:
+            sims = normalize_rows(vectors[new]) @ self.centroids.T
+            for i, c in zip(new, sims.argmax(axis=1).tolist()):
+                self.lists[keys[i]] = c
+        return len(new)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez(
+            path,
+            centroids=self.centroids,
+            keys=np.array(list(self.lists.keys()), dtype="U40"),
+            lists=np.array(list(self.lists.values()), dtype=np.int32),
+        )
+
+    @staticmethod
+    def load(path):
+        data = np.load(path)
+        return ivf_index(
+            data["centroids"], data["keys"].tolist(), data["lists"].tolist()
+        )
+
+
+# Row-Wise L2 Normalization
+def normalize_rows(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+# UMAP with Memoized Fit (Same Embeddings -> Same Fitted Model and Reduced Vectors)
+class cached_umap:
+    def __init__(self, **params):
+        self.params = params
+        self.model = -1
+        self.key = b""
+        self.x_key = b""
+        self.reduced = -1
+
+    @staticmethod
+    def fingerprint(X, y=None):
+        digest = hashlib.sha1(np.ascontiguousarray(X).tobytes())
+        if y is not None:
+            digest.update(np.ascontiguousarray(y).tobytes())
+        return digest.digest()
+
+    def fit(self, X, y=None):
+        key = cached_umap.fingerprint(X, y)
+        if key != self.key:
+            self.model = UMAP(**self.params)
+            self.reduced = self.model.fit_transform(X, y=y)
+            self.key = key
+            self.x_key = cached_umap.fingerprint(X)
+        return self
+
+    def transform(self, X):
+        if cached_umap.fingerprint(X) == self.x_key:
+            return self.reduced
+        return self.model.transform(X)
+
+
+# Restartable Token Stream over a Corpus File (One Document per Line; Indexable by Document)
+class token_stream:
+    def __init__(self, path):
+        self.path = path
+        offsets = [0]
+        with open(path, "rb") as f:
+            for line in f:
+                offsets.append(offsets[-1] + len(line))
+        self.offsets = np.array(offsets, dtype=np.int64)
+
+    def __iter__(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                yield line.split()
+
+    def __len__(self):
+        return self.offsets.shape[0] - 1
+
+    def __getitem__(self, i):
+        i = range(0, len(self))[i]
+        with open(self.path, "rb") as f:
+            f.seek(self.offsets[i])
+            line = f.readline()
+        return line.decode("utf-8").split()
+
+
 # pbx Class
 class pbx_probe:
-    def __init__(self, file_bib, db="scopus", del_duplicated=True):
+    def __init__(self, file_bib, db="scopus", del_duplicated=True, near_dupl=False):
         db = db.lower()
         self.database = db
+        self.layout_cache = {}
+        self.ann = -1
+        self.embds_keys = []
+        self.embds_model = -1
+        self.topic_umap = -1
+        self.topic_dist = -1
+        self.topic_opts = {}
+        self.topic_keys = []
+        self.topic_idx = -1
+        self.word_idx = -1
+        self.topics = []
+        self.key_idx = -1
+        self.ref_match = {}
+        self.ref_seen = set()
         self.institution_names = [
             "acad",
             "academy",
@@ -2871,34 +4049,22 @@ class pbx_probe:
             "#f9bc08",
             "#c7c10c",
         ]
-        self.data, self.entries = self.__read_bib(file_bib, db, del_duplicated)
+        self.dupl_report = -1
+        self.data, self.entries = self.__read_bib(
+            file_bib, db, del_duplicated, near_dupl
+        )
         self.__make_bib()
 
     # Function: Prepare .bib File
     def __make_bib(self, verbose=True):
-        self.ask_gpt_ap = -1
-        self.ask_gpt_cp = -1
-        self.ask_gpt_ip = -1
-        self.ask_gpt_sp = -1
-        self.ask_gpt_bp = -1
-        self.ask_gpt_ct = -1
-        self.ask_gpt_ep = -1
-        self.ask_gpt_ng = -1
-        self.ask_gpt_rt = -1
-        self.ask_gpt_sk = -1
-        self.ask_gpt_wd = -1
+        self.__reset_caches()
         self.author_country_map = -1
         self.corr_a_country_map = -1
         self.frst_a_country_map = -1
         self.author_inst_map = -1
         self.corr_a_inst_map = -1
         self.frst_a_inst_map = -1
-        self.top_y_x = -1
-        self.heat_y_x = -1
-        self.top_refs = -1
-        self.rpys_pk = -1
-        self.rpys_rs = -1
-        self.top_co_c = -1
+        self.entity_idx = {}
         self.data["year"] = self.data["year"].replace("UNKNOWN", "0")
         self.dy = pd.to_numeric(self.data["year"], downcast="float")
         self.date_str = int(self.dy.min())
@@ -2966,6 +4132,7 @@ class pbx_probe:
         self.dy_c_year = self.__get_collaboration_year()
         self.u_ref = [ref for ref in self.u_ref if ref.lower() != "unknown"]
         self.dy_ref = self.__get_ref_year()
+        self.ref_year = (self.date_end, dict(zip(self.u_ref, self.dy_ref)))
         self.u_ref_id = self.__get_ref_id()
         ref_map = dict(zip(self.u_ref, self.u_ref_id))
         self.ref_id = []
@@ -2984,9 +4151,196 @@ class pbx_probe:
                 print(self.vb[i])
         return
 
-    # Function: Document ID
-    def __id_document(self):
-        doc_list = [str(i) for i in range(0, self.data.shape[0])]
+    # Function: Cached Analyses and AI Answers (Invalidated when the Database Changes)
+    def __reset_caches(self):
+        self.ask_gpt_ap = -1
+        self.ask_gpt_cp = -1
+        self.ask_gpt_ip = -1
+        self.ask_gpt_sp = -1
+        self.ask_gpt_bp = -1
+        self.ask_gpt_ct = -1
+        self.ask_gpt_ep = -1
+        self.ask_gpt_ng = -1
+        self.ask_gpt_rt = -1
+        self.ask_gpt_sk = -1
+        self.ask_gpt_wd = -1
+        self.top_y_x = -1
+        self.heat_y_x = -1
+        self.top_refs = -1
+        self.rpys_pk = -1
+        self.rpys_rs = -1
+        self.top_co_c = -1
+        self.ref_enc = -1
+        self.ref_cube = -1
+        self.ref_post = -1
+        self.ref_links = -1
+        self.topic_dist = -1
+        return
+
+    # Function: Extend Vocabularies, Counts, Author Maps and Indices with the Rows from start on (Same Results as __make_bib)
+    def __extend_bib(self, start, verbose=True):
+        n = self.data.shape[0]
+        if start >= n:
+            return
+        self.__reset_caches()
+        self.entity_idx.pop("ref_id", None)
+        self.data["year"] = self.data["year"].replace("UNKNOWN", "0")
+        self.dy = pd.to_numeric(self.data["year"], downcast="float")
+        self.date_str = int(self.dy.min())
+        self.date_end = int(self.dy.max())
+        self.doc_types = self.data["document_type"].value_counts().sort_index()
+        self.av_d_year = self.dy.value_counts().sort_index()
+        self.av_d_year = round(self.av_d_year.mean(), 2)
+        self.citation.extend(self.__get_citations(self.data["note"].iloc[start:]))
+        self.av_c_doc = round(sum(self.citation) / n, 2)
+        ref, u_ref = self.__get_str(
+            entry="references", s=";", lower=False, sorting=True, start=start
+        )
+        self.ref.extend(ref)
+        self.u_ref = sorted(set(self.u_ref).union(u_ref))
+        aut, u_aut = self.__get_str(
+            entry="author", s=" and ", lower=True, sorting=True, start=start
+        )
+        self.aut.extend(aut)
+        old_aut = self.u_aut
+        self.u_aut = sorted(set(old_aut).union(u_aut))
+        for paper_idx in range(start, n):
+            for author in self.aut[paper_idx]:
+                self.author_to_papers[author].append(paper_idx)
+        metrics = dict(
+            zip(old_aut, zip(self.aut_h, self.aut_g, self.aut_e, self.t_c, self.s_c))
+        )
+        for author in u_aut:
+            metrics[author] = self.__author_metrics(author)
+        metrics = [metrics[author] for author in self.u_aut]
+        self.aut_h, self.aut_g, self.aut_e, self.t_c, self.s_c = [
+            list(item) for item in zip(*metrics)
+        ]
+        self.aut_docs.extend(len(item) for item in aut)
+        self.aut_single = self.aut_single + len([item for item in aut if len(item) == 1])
+        self.aut_multi.extend(len(item) for item in aut if len(item) > 1)
+        self.aut_cit = self.__extend_entity_counts(
+            old_aut, self.aut_cit, self.u_aut, self.aut, start, self.citation
+        )
+        for field, entry, s in [
+            ("kid", "keywords", ";"),
+            ("auk", "author_keywords", ";"),
+            ("jou", "abbrev_source_title", ";"),
+            ("lan", "language", "."),
+        ]:
+            e, u_e = self.__get_str(entry=entry, s=s, lower=True, sorting=True, start=start)
+            getattr(self, field).extend(e)
+            u_old = getattr(self, "u_" + field)
+            u_e, e_count = self.__extend_counts(
+                u_old,
+                getattr(self, field + "_count"),
+                u_e,
+                e,
+                sorting=True,
+                simple=field == "lan",
+            )
+            setattr(self, "u_" + field, u_e)
+            setattr(self, field + "_count", e_count)
+            if field == "jou":
+                self.jou_cit = self.__extend_entity_counts(
+                    u_old, self.jou_cit, u_e, self.jou, start, self.citation
+                )
+        for field, get in [("ctr", self.__get_countries), ("uni", self.__get_institutions)]:
+            e, u_e = get(start)
+            e = self.replace_unknowns(e)
+            getattr(self, field).extend(e)
+            u_old = getattr(self, "u_" + field)
+            u_e, e_count = self.__extend_counts(
+                u_old, getattr(self, field + "_count"), u_e, e, sorting=False, simple=True
+            )
+            setattr(self, "u_" + field, u_e)
+            setattr(self, field + "_count", e_count)
+            e_cit = self.__extend_entity_counts(
+                u_old, getattr(self, field + "_cit"), u_e, getattr(self, field), start, self.citation
+            )
+            setattr(self, field + "_cit", e_cit)
+        self.doc_aut = self.__extend_entity_counts(
+            old_aut, self.doc_aut, self.u_aut, self.aut, start
+        )
+        self.av_doc_aut = round(sum(self.doc_aut) / len(self.doc_aut), 2)
+        self.r_c = [self.s_c[i] / max(self.t_c[i], 1) for i in range(0, len(self.t_c))]
+        self.dy_c_year = self.__get_collaboration_year(start)
+        self.u_ref = [ref for ref in self.u_ref if ref.lower() != "unknown"]
+        date_end, known = self.ref_year
+        self.dy_ref = self.__get_ref_year(known if date_end == self.date_end else {})
+        self.ref_year = (self.date_end, dict(zip(self.u_ref, self.dy_ref)))
+        self.u_ref_id = self.__get_ref_id()
+        ref_map = dict(zip(self.u_ref, self.u_ref_id))
+        self.ref_id = [[ref_map.get(ref, ref) for ref in ref_list] for ref_list in self.ref]
+        for field, index in self.entity_idx.items():
+            items = getattr(self, field)
+            for i in range(start, n):
+                for item in dict.fromkeys(items[i]):
+                    index.setdefault(item, []).append(i)
+        self.__id_document(start)
+        self.__id_author()
+        self.__id_source()
+        self.__id_institution()
+        self.__id_country()
+        self.__id_kwa()
+        self.__id_kwp()
+        if verbose:
+            for i in range(0, len(self.vb)):
+                print(self.vb[i])
+        return
+
+    # Function: Extend Unique Entries and Counts (Same Order as filter_list; sorting = False: New Entries after the Old Ones)
+    def __extend_counts(self, u_e, e_count, u_new, e_new, sorting=True, simple=False):
+        counts = dict(zip(u_e, e_count))
+        for item in u_new:
+            counts.setdefault(item, 0)
+        for sublist in e_new:
+            for item in sublist:
+                if item in counts:
+                    counts[item] = counts[item] + 1
+        u_e = sorted(counts) if sorting else list(counts)
+        if not simple:
+            u_e = [item for item in u_e if item.lower() != "unknown"]
+            u_e = sorted(u_e, key=lambda item: (counts[item], item), reverse=True)
+        e_count = [counts[item] for item in u_e]
+        return u_e, e_count
+
+    # Function: Extend __get_counts Results (Aligned with u_old) with the Rows from start on
+    def __extend_entity_counts(self, u_old, counts_old, u_ent, ent, start, acc=[]):
+        counts = dict(zip(u_old, counts_old))
+        for j in range(start, len(ent)):
+            for item in set(ent[j]):
+                counts[item] = counts.get(item, 0) + (acc[j] if acc else 1)
+        return [counts.get(item, 0) for item in u_ent]
+
+    # Function: H-Index, G-Index, E-Index, Total and Self Citations of one Author
+    def __author_metrics(self, author):
+        papers = self.author_to_papers.get(author, [])
+        citations = sorted((self.citation[i] for i in papers), reverse=True)
+        h = 0
+        for idx, citation in enumerate(citations):
+            if citation >= idx + 1:
+                h = idx + 1
+            else:
+                break
+        g = 0
+        cumulative_sum = 0
+        for idx, citation in enumerate(citations):
+            cumulative_sum = cumulative_sum + citation
+            if cumulative_sum >= (idx + 1) ** 2:
+                g = idx + 1
+            else:
+                break
+        excess_sum = sum(citation - h for citation in citations[:h] if citation > h)
+        author_lower = author.lower()
+        self_citations = sum(
+            1 for i in papers for ref in self.ref[i] if author_lower in ref.lower()
+        )
+        return h, g, np.sqrt(excess_sum), sum(citations), self_citations
+
+    # Function: Document ID (start > 0: Appends the Rows from start on)
+    def __id_document(self, start=0):
+        doc_list = [str(i) for i in range(start, self.data.shape[0])]
         docs = [
             self.data.loc[i, "author"]
             + " ("
@@ -2998,14 +4352,27 @@ class pbx_probe:
             + ". doi:"
             + self.data.loc[i, "doi"]
             + ". "
-            for i in range(0, self.data.shape[0])
+            for i in range(start, self.data.shape[0])
         ]
-        self.table_id_doc = pd.DataFrame(
-            zip(doc_list, docs), columns=["ID", "Document"]
-        )
-        self.dict_id_doc = dict(zip(doc_list, docs))
+        table = pd.DataFrame(zip(doc_list, docs), columns=["ID", "Document"])
+        if start > 0:
+            table = pd.concat([self.table_id_doc, table], ignore_index=True)
+            self.dict_id_doc.update(zip(doc_list, docs))
+        else:
+            self.dict_id_doc = dict(zip(doc_list, docs))
+        self.table_id_doc = table
         return
 
+    # Function: Entity -> Document Indices (Fields: "aut", "ctr", "uni", "jou", "kid", "auk", "lan", "ref", "ref_id")
+    def __entity_index(self, field="aut"):
+        if field not in self.entity_idx:
+            index = defaultdict(list)
+            for i, items in enumerate(getattr(self, field)):
+                for item in dict.fromkeys(items):
+                    index[item].append(i)
+            self.entity_idx[field] = dict(index)
+        return self.entity_idx[field]
+
     # Function: Author ID
     def __id_author(self):
         aut_list = ["a_" + str(i) for i in range(0, len(self.u_aut))]
@@ -3126,11 +4493,10 @@ class pbx_probe:
             self.data = self.data.reset_index(drop=True)
             self.__make_bib(verbose=False)
         if len(sources) > 0:
+            src_index = self.__entity_index("jou")
             src_idx = []
             for source in sources:
-                for i in range(0, len(self.jou)):
-                    if source == self.jou[i][0]:
-                        src_idx.append(i)
+                src_idx.extend(src_index.get(source, []))
             if len(src_idx) > 0:
                 self.data = self.data.iloc[src_idx, :]
                 self.data = self.data.reset_index(drop=True)
@@ -3164,11 +4530,10 @@ class pbx_probe:
             self.data = self.data.reset_index(drop=True)
             self.__make_bib(verbose=False)
         if len(country) > 0:
-            ctr_idx = [
-                i
-                for i in range(0, len(self.ctr))
-                if any(x in country for x in self.ctr[i])
-            ]
+            ctr_index = self.__entity_index("ctr")
+            ctr_idx = sorted(
+                set(i for item in set(country) for i in ctr_index.get(item, []))
+            )
             if len(ctr_idx) > 0:
                 self.data = self.data.iloc[ctr_idx, :]
                 self.data = self.data.reset_index(drop=True)
@@ -3199,34 +4564,142 @@ class pbx_probe:
         return cleaned_doi
 
     # Function: Fuzzy String Matcher # Entry = self.u_aut, self.u_inst, or list with Unique items
-    def fuzzy_matcher(self, entry, tgt=[], cut_ratio=0.80):
+    def fuzzy_matcher(
+        self, entry, tgt=[], cut_ratio=0.80, blocking="lsh", scorer="indel", window=5
+    ):
         u_lst = [item for item in entry]
         matches = {item: [] for item in u_lst}
+        chars, offsets = encode_strings(u_lst)
         if tgt:
+            position = {item: i for i, item in enumerate(u_lst)}
             for target in tgt:
-                if target not in u_lst:
+                if target not in position:
                     continue
-                for other in u_lst:
-                    if other == target:
-                        continue
-                    ratio = SequenceMatcher(None, target, other).ratio()
-                    # ratio = fuzz.ratio(target, other)/100
-                    if cut_ratio <= ratio < 1:
-                        matches[target].append(other)
-                        matches[other].append(target)
+                t = position[target]
+                right = np.array(
+                    [i for i in range(0, len(u_lst)) if u_lst[i] != target],
+                    dtype=np.int64,
+                )
+                left = np.full(right.shape[0], t, dtype=np.int64)
+                ratio = indel_ratios(chars, offsets, left, right, cut_ratio)
+                for i, r in zip(right, ratio):
+                    if scorer == "sm" and cut_ratio <= r:
+                        r = SequenceMatcher(None, target, u_lst[i]).ratio()
+                    if cut_ratio <= r < 1:
+                        matches[target].append(u_lst[i])
+                        matches[u_lst[i]].append(target)
         else:
-            for i, j in combinations(range(0, len(u_lst)), 2):
+            left, right = fuzzy_candidates(u_lst, blocking=blocking, window=window)
+            ratio = indel_ratios(chars, offsets, left, right, cut_ratio)
+            keep = (ratio >= cut_ratio) & (ratio < 1)
+            for i, j in zip(left[keep], right[keep]):
                 str1, str2 = u_lst[i], u_lst[j]
-                ratio = SequenceMatcher(None, str1, str2).ratio()
-                # ratio      = fuzz.ratio(str1, str2)/100
-                if cut_ratio <= ratio < 1:
-                    matches[str1].append(str2)
-                    matches[str2].append(str1)
+                if scorer == "sm":
+                    if not cut_ratio <= SequenceMatcher(None, str1, str2).ratio() < 1:
+                        continue
+                matches[str1].append(str2)
+                matches[str2].append(str1)
         matches = {k: v for k, v in matches.items() if v}
         return matches
 
-    # Function: Merge Database
-    def merge_database(self, file_bib, db, del_duplicated):
+    # Function: Remove Duplicated Documents (Report: Removed Row -> Kept Row, Match Rule)
+    def __deduplicate(self, data, near_dupl=False):
+        data = data.reset_index(drop=True)
+        keep, rule = duplicate_records(data["doi"], data["title"], near_dupl)
+        removed = np.flatnonzero(keep != np.arange(keep.shape[0]))
+        report = pd.DataFrame(
+            {
+                "Removed": removed,
+                "Kept": keep[removed],
+                "Match": rule[removed],
+                "Removed Title": data["title"].to_numpy()[removed],
+                "Kept Title": data["title"].to_numpy()[keep[removed]],
+            }
+        )
+        data = data[keep == np.arange(keep.shape[0])]
+        data = data.reset_index(drop=True)
+        return data, report
+
+    # Function: Normalized DOI and Title Keys -> First Row of the Working Database (Cached per DataFrame)
+    def __key_index(self):
+        if isinstance(self.key_idx, int) or self.key_idx[0] is not self.data:
+            idx = list(range(0, self.data.shape[0]))[::-1]
+            doi = dict(zip(normalize_dois(self.data["doi"])[::-1], idx))
+            title = dict(zip(normalize_titles(self.data["title"])[::-1], idx))
+            doi.pop("", None)
+            title.pop("", None)
+            self.key_idx = (self.data, doi, title)
+        return self.key_idx
+
+    # Function: Remove New Documents Already in the Working Database or Repeated within the Batch (Extends the Key Index)
+    def __deduplicate_new(self, data, near_dupl=False, cut_ratio=0.90):
+        _, doi, title = self.__key_index()
+        data = data.reset_index(drop=True)
+        base = self.data.shape[0]
+        n = data.shape[0]
+        d_key = normalize_dois(data["doi"])
+        t_key = normalize_titles(data["title"])
+        kept_d = d_key.map(doi).to_numpy()
+        kept_t = t_key.map(title).to_numpy()
+        match = np.full(n, -1, dtype=np.int64)
+        rule = np.full(n, "", dtype=object)
+        for kept, name in [(kept_t, "title"), (kept_d, "doi")]:
+            m = pd.notna(kept)
+            match[m] = kept[m].astype(np.int64)
+            rule[m] = name
+        if near_dupl and n > 0 and base > 0:
+            old = normalize_titles(self.data["title"])
+            strings = old.tolist() + t_key.tolist()
+            left, right = fuzzy_candidates(
+                strings, n_gram=4, n_bands=16, n_rows=5, window=2
+            )
+            m = (left < base) & (right >= base)
+            left, right = left[m], right[m]
+            valid = np.array([item != "" for item in strings], dtype=bool)
+            m = valid[left] & valid[right]
+            left, right = left[m], right[m]
+            chars, offsets = encode_strings(strings)
+            m = indel_ratios(chars, offsets, left, right, cut_ratio) >= cut_ratio
+            near = np.full(n, base, dtype=np.int64)
+            np.minimum.at(near, right[m] - base, left[m])
+            m = (match < 0) & (near < base)
+            match[m] = near[m]
+            rule[m] = "near"
+        keep, batch_rule = duplicate_records(
+            data["doi"], data["title"], near_dupl, cut_ratio
+        )
+        for j in range(0, n):
+            if match[j] < 0 and keep[j] != j:
+                k = keep[j]
+                match[j] = match[k] if match[k] >= 0 else base + k
+                rule[j] = batch_rule[j]
+        removed = np.flatnonzero(match >= 0)
+        kept = match[removed]
+        titles = np.concatenate(
+            [self.data["title"].to_numpy(), data["title"].to_numpy()]
+        )
+        report = pd.DataFrame(
+            {
+                "Removed": removed + base,
+                "Kept": kept,
+                "Match": rule[removed],
+                "Removed Title": data["title"].to_numpy()[removed],
+                "Kept Title": titles[kept],
+            }
+        )
+        mask = match < 0
+        data = data[mask].reset_index(drop=True)
+        for i, (d, t) in enumerate(zip(d_key[mask], t_key[mask])):
+            if d:
+                doi.setdefault(d, base + i)
+            if t:
+                title.setdefault(t, base + i)
+        return data, report
+
+    # Function: Merge Database (incremental = True: the New Batch is Deduplicated against the Cached Keys and within Itself, then Vocabularies, Counts, Maps and Indices are Extended in Place)
+    def merge_database(
+        self, file_bib, db, del_duplicated, near_dupl=False, incremental=False
+    ):
         old_vb = [item for item in self.vb]
         old_size = self.data.shape[0]
         print(
@@ -3244,33 +4717,21 @@ class pbx_probe:
         print("")
         print("Added Database")
         print("")
-        data, _ = self.__read_bib(file_bib, db, del_duplicated)
-        self.data = pd.concat([self.data, data])
-        self.data = self.data.reset_index(drop=True)
-        self.data = self.data.fillna("UNKNOWN")
-        duplicated = self.data["doi"].duplicated()
-        title = self.data["title"]
-        title = title.to_list()
-        title = self.clear_text(
-            title,
-            stop_words=[],
-            lowercase=True,
-            rmv_accents=True,
-            rmv_special_chars=True,
-            rmv_numbers=True,
-            rmv_custom_words=[],
-        )
-        t_dupl = pd.Series(title).duplicated()
-        for i in range(0, duplicated.shape[0]):
-            if self.data.loc[i, "doi"] == "UNKNOWN":
-                duplicated[i] = False
-            if t_dupl[i]:
-                duplicated[i] = True
-        idx = list(duplicated.index[duplicated])
-        self.data.drop(idx, axis=0, inplace=True)
-        self.data = self.data.reset_index(drop=True)
+        data, _ = self.__read_bib(file_bib, db, del_duplicated, near_dupl)
+        if incremental:
+            data, self.dupl_report = self.__deduplicate_new(data, near_dupl)
+            self.data = pd.concat([self.data, data])
+            self.data = self.data.reset_index(drop=True)
+            self.data = self.data.fillna("UNKNOWN")
+            self.key_idx = (self.data,) + self.key_idx[1:]
+            self.__extend_bib(old_size, verbose=True)
+        else:
+            self.data = pd.concat([self.data, data])
+            self.data = self.data.reset_index(drop=True)
+            self.data = self.data.fillna("UNKNOWN")
+            self.data, self.dupl_report = self.__deduplicate(self.data, near_dupl)
+            self.__make_bib(verbose=True)
         size = self.data.shape[0]
-        self.__make_bib(verbose=True)
         dt = self.data["document_type"].value_counts()
         dt = dt.sort_index(axis=0)
         self.vb = []
@@ -3291,8 +4752,8 @@ class pbx_probe:
         self.vb.append("A Total of " + str(size) + " Documents were Found")
         print("")
         for i in range(0, dt.shape[0]):
-            print(dt.index[i], " = ", dt[i])
-            self.vb.append(dt.index[i] + " = " + str(dt[i]))
+            print(dt.index[i], " = ", dt.iloc[i])
+            self.vb.append(dt.index[i] + " = " + str(dt.iloc[i]))
         print("")
         print(
             "############################################################################"
@@ -3301,96 +4762,88 @@ class pbx_probe:
 
     # Function: Save Working Database
     def save_database(self, sep="\t", name="data.csv"):
-        self.data.to_csv(name, index=False)
+        data = self.data
+        if len(self.topics) == data.shape[0]:
+            data = data.assign(topic=[str(topic) for topic in self.topics])
+        data.to_csv(name, index=False)
         return
 
     # Function: Load Working Database
     def load_database(self, name="data.csv"):
         data = pd.read_csv(name, dtype=str)
+        topics = []
+        if "topic" in data.columns:
+            topics = [int(topic) for topic in data.pop("topic")]
         self.data = data.copy(deep=True)
         self.__make_bib(verbose=False)
+        if len(topics) > 0:
+            self.topics = topics
+        return
+
+    # Function: Merge Entities. Mapping: {variant: canonical} or fuzzy_matcher Output; Entity: "aut", "uni", "ctr", "lan", "jou", "ref"
+    def merge_entities(self, mapping={}, entity="aut"):
+        columns = {
+            "aut": "author",
+            "uni": "affiliation",
+            "ctr": "affiliation",
+            "lan": "language",
+            "jou": "abbrev_source_title",
+            "ref": "references",
+        }
+        canon = {}
+        for key, value in mapping.items():
+            if isinstance(value, str):
+                canon[key] = value
+            else:
+                root = canon.setdefault(key, key)
+                for item in value:
+                    canon.setdefault(item, root)
+        repl = {k.lower(): v for k, v in canon.items() if k.lower() != v}
+        if len(repl) > 0:
+            col = columns[entity]
+            pattern = re.compile(
+                "|".join(re.escape(k) for k in sorted(repl, key=len, reverse=True))
+            )
+            text = self.data[col]
+            if entity in ["uni", "ctr"] and "affiliation_" in self.data.columns:
+                wos = self.data["source"].str.lower() == "wos"
+                text = text.where(~wos, self.data["affiliation_"])
+            text = text.str.lower()
+            mask = text.str.contains(pattern)
+            self.data.loc[mask, col] = text[mask].str.replace(
+                pattern, lambda m: repl[m.group(0)], regex=True
+            )
+        self.__make_bib(verbose=False)
         return
 
     # Function: Merge Author
     def merge_author(self, get=[], replace_for="name"):
-        for name in get:
-            for i in range(0, self.data.shape[0]):
-                target = self.data.loc[i, "author"].lower()
-                if name.lower() in target:
-                    self.data.loc[i, "author"] = target.replace(
-                        name.lower(), replace_for
-                    )
-        self.__make_bib(verbose=False)
+        self.merge_entities({name: replace_for for name in get}, entity="aut")
         return
 
     # Function: Merge Institution
     def merge_institution(self, get=[], replace_for="name"):
-        for name in get:
-            for i in range(0, self.data.shape[0]):
-                if (
-                    self.data.loc[i, "source"].lower() == "scopus"
-                    or self.data.loc[i, "source"].lower() == "pubmed"
-                ):
-                    target = self.data.loc[i, "affiliation"].lower()
-                elif self.data.loc[i, "source"].lower() == "wos":
-                    target = self.data.loc[i, "affiliation_"].lower()
-                if name.lower() in target:
-                    self.data.loc[i, "affiliation"] = target.replace(name, replace_for)
-        self.__make_bib(verbose=False)
+        self.merge_entities({name: replace_for for name in get}, entity="uni")
         return
 
     # Function: Merge Country
     def merge_country(self, get=[], replace_for="name"):
-        for name in get:
-            for i in range(0, self.data.shape[0]):
-                if (
-                    self.data.loc[i, "source"].lower() == "scopus"
-                    or self.data.loc[i, "source"].lower() == "pubmed"
-                ):
-                    target = self.data.loc[i, "affiliation"].lower()
-                elif self.data.loc[i, "source"].lower() == "wos":
-                    target = self.data.loc[i, "affiliation_"].lower()
-                if name.lower() in target:
-                    self.data.loc[i, "affiliation"] = target.replace(
-                        name.lower(), replace_for
-                    )
-        self.__make_bib(verbose=False)
+        self.merge_entities({name: replace_for for name in get}, entity="ctr")
         return
 
     # Function: Merge Language
     def merge_language(self, get=[], replace_for="name"):
-        for name in get:
-            for i in range(0, self.data.shape[0]):
-                target = self.data.loc[i, "language"].lower()
-                if name.lower() in target:
-                    self.data.loc[i, "language"] = target.replace(
-                        name.lower(), replace_for
-                    )
-        self.__make_bib(verbose=False)
+        self.merge_entities({name: replace_for for name in get}, entity="lan")
         return
 
     # Function: Merge Source
     def merge_source(self, get=[], replace_for="name"):
-        for name in get:
-            for i in range(0, self.data.shape[0]):
-                target = self.data.loc[i, "abbrev_source_title"].lower()
-                if name.lower() in target:
-                    self.data.loc[i, "abbrev_source_title"] = target.replace(
-                        name.lower(), replace_for
-                    )
-        self.__make_bib(verbose=False)
+        self.merge_entities({name: replace_for for name in get}, entity="jou")
         return
 
     # Function: Merge Reference
     def merge_reference(self, get=[], replace_for="name"):
-        for name in get:
-            for i in range(0, self.data.shape[0]):
-                target = self.data.loc[i, "references"].lower()
-                if name.lower() in target:
-                    self.data.loc[i, "references"] = target.replace(
-                        name.lower(), replace_for
-                    )
-        self.__make_bib(verbose=False)
+        self.merge_entities({name: replace_for for name in get}, entity="ref")
         return
 
     # Function: Replace Keyword Plus
@@ -3530,7 +4983,7 @@ class pbx_probe:
     ##############################################################################
 
     # Function: Read .bib File
-    def __read_bib(self, bib, db="scopus", del_duplicated=True):
+    def __read_bib(self, bib, db="scopus", del_duplicated=True, near_dupl=False):
         # ----------------------------------------------------------------------
 
         def assign_authors_to_affiliations(authors_str, affiliations_str):
@@ -4144,34 +5597,14 @@ class pbx_probe:
         )
 
         if del_duplicated and "doi" in entries:
-            duplicated = data["doi"].duplicated()
-            title = data["title"]
-            title = title.to_list()
-            title = self.clear_text(
-                title,
-                stop_words=[],
-                lowercase=True,
-                rmv_accents=True,
-                rmv_special_chars=True,
-                rmv_numbers=True,
-                rmv_custom_words=[],
-            )
-            t_dupl = pd.Series(title).duplicated()
-            for i in range(0, duplicated.shape[0]):
-                if data.loc[i, "doi"] == "UNKNOWN" or pd.isnull(data.loc[i, "doi"]):
-                    duplicated[i] = False
-                if t_dupl[i]:
-                    duplicated[i] = True
-            idx = list(duplicated.index[duplicated])
-            data.drop(idx, axis=0, inplace=True)
-            data = data.reset_index(drop=True)
+            data, self.dupl_report = self.__deduplicate(data, near_dupl)
             string_vb = (
                 "A Total of "
-                + str(doc - len(idx))
+                + str(data.shape[0])
                 + " Documents were Found ( "
                 + str(doc)
                 + " Documents and "
-                + str(len(idx))
+                + str(self.dupl_report.shape[0])
                 + " Duplicates )"
             )
             self.vb.append(string_vb)
@@ -4268,9 +5701,9 @@ class pbx_probe:
 
     ##############################################################################
 
-    # Function: Get Entries
-    def __get_str(self, entry="references", s=";", lower=True, sorting=True):
-        column = self.data[entry]
+    # Function: Get Entries (Rows from start on)
+    def __get_str(self, entry="references", s=";", lower=True, sorting=True, start=0):
+        column = self.data[entry].iloc[start:]
         info = [
             [
                 " ".join(item.split()).lower() if lower else " ".join(item.split())
@@ -4331,8 +5764,8 @@ class pbx_probe:
         c_count_ = list(year_to_count.values())
         return c_year_, c_count_
 
-    # Function: Get Countries
-    def __get_countries(self):
+    # Function: Get Countries (Rows from start on; start > 0 Extends the Author Maps)
+    def __get_countries(self, start=0):
         # ----------------------------------------------------------------------
 
         def preprocess_affiliation(row):
@@ -4345,13 +5778,8 @@ class pbx_probe:
             return "UNKNOWN"
 
         def get_additional_country_data():
-            unique_countries = set()
-            for country_data in self.author_country_map.values():
-                for _, country in country_data:
-                    unique_countries.add(country)
-            u_ctr = list(unique_countries)
             ctr = []
-            for index, row in self.data.iterrows():
+            for index, row in self.data.iloc[start:].iterrows():
                 row_countries = []
                 for author in self.aut[index]:
                     if author in self.author_country_map:
@@ -4359,8 +5787,10 @@ class pbx_probe:
                             if row_idx == index:
                                 row_countries.append(country)
                 ctr.append(row_countries)
-            self.corr_a_country_map = {}
-            for index, row in self.data.iterrows():
+            u_ctr = list({country for row_countries in ctr for country in row_countries})
+            if start == 0:
+                self.corr_a_country_map = {}
+            for index, row in self.data.iloc[start:].iterrows():
                 if self.database.lower() == "wos":
                     if "Corresponding Author" in row["affiliation_"]:
                         corresponding_author = next(
@@ -4395,8 +5825,9 @@ class pbx_probe:
                         self.corr_a_country_map[corresponding_author] = (
                             self.author_country_map[corresponding_author]
                         )
-            self.frst_a_country_map = {}
-            for index, row in self.data.iterrows():
+            if start == 0:
+                self.frst_a_country_map = {}
+            for index, row in self.data.iloc[start:].iterrows():
                 if self.aut[index]:
                     first_author = self.aut[index][0]
                     if first_author in self.author_country_map:
@@ -4407,7 +5838,7 @@ class pbx_probe:
 
         # ----------------------------------------------------------------------
 
-        data = self.data.copy(deep=True)
+        data = self.data.iloc[start:].copy(deep=True)
         data["processed_affiliation"] = data.apply(
             preprocess_affiliation, axis=1
         ).str.lower()
@@ -4446,7 +5877,10 @@ class pbx_probe:
         data["processed_affiliation"] = data["processed_affiliation"].replace(
             country_replacements, regex=True
         )
-        self.author_country_map = {author: [] for author in self.u_aut}
+        if start == 0:
+            self.author_country_map = {}
+        for author in self.u_aut:
+            self.author_country_map.setdefault(author, [])
         for index, row in data.iterrows():
             affiliations = row["processed_affiliation"].split(";")
             authors = self.aut[row.name]
@@ -4483,8 +5917,8 @@ class pbx_probe:
             new_list.append(new_sublist)
         return new_list
 
-    # Function: Get Institutions
-    def __get_institutions(self):
+    # Function: Get Institutions (Rows from start on; start > 0 Extends the Author Maps)
+    def __get_institutions(self, start=0):
         # ----------------------------------------------------------------------
 
         def extract_top_institution_with_priority(text, institution_names):
@@ -4508,21 +5942,22 @@ class pbx_probe:
 
         # ----------------------------------------------------------------------
 
-        sources = self.data["source"].str.lower()
+        rows = self.data.iloc[start:]
+        sources = rows["source"].str.lower()
         affiliations = (
-            self.data["affiliation"].fillna("").str.lower()
-            if "affiliation" in self.data.columns
-            else pd.Series([""] * len(self.data))
+            rows["affiliation"].fillna("").str.lower()
+            if "affiliation" in rows.columns
+            else pd.Series([""] * len(rows))
         )
         affiliations_wos = (
-            self.data["affiliation_"].fillna("").str.lower()
-            if "affiliation_" in self.data.columns
-            else pd.Series([""] * len(self.data))
+            rows["affiliation_"].fillna("").str.lower()
+            if "affiliation_" in rows.columns
+            else pd.Series([""] * len(rows))
         )
         affiliations_wos = (
-            self.data["affiliation_"].fillna("").str.lower()
-            if "affiliation_" in self.data.columns
-            else pd.Series([""] * len(self.data))
+            rows["affiliation_"].fillna("").str.lower()
+            if "affiliation_" in rows.columns
+            else pd.Series([""] * len(rows))
         )
         processed_affiliations = np.where(
             sources.isin(["scopus", "pubmed"]),
@@ -4542,22 +5977,25 @@ class pbx_probe:
         u_inst = list(set(flattened_institutions))
         u_inst = [re.sub(r"^(?:[A-Za-z]\.\s?)+", "", name) for name in u_inst]
         u_inst = list(set(u_inst))
-        self.author_inst_map = {author: [] for author in self.u_aut}
-        for index, institutions in enumerate(inst):
+        if start == 0:
+            self.author_inst_map = {}
+        for author in self.u_aut:
+            self.author_inst_map.setdefault(author, [])
+        for k, institutions in enumerate(inst):
+            index = start + k
             for author in self.aut[index]:
-                for institution in inst[index]:
-                    for _, aff in enumerate(processed_affiliations[index].split(";")):
+                for institution in inst[k]:
+                    for _, aff in enumerate(processed_affiliations[k].split(";")):
                         if author in aff and institution in aff:
                             self.author_inst_map[author].append(
                                 (index, re.sub(r"^(?:[A-Za-z]\.\s?)+", "", institution))
                             )
                 if len(self.author_inst_map[author]) == 0:
                     self.author_inst_map[author].append((index, "UNKNOWN"))
-        self.author_inst_map = {
-            k: list(set(v)) for k, v in self.author_inst_map.items()
-        }
+        for author in {author for authors in self.aut[start:] for author in authors}:
+            self.author_inst_map[author][:] = list(set(self.author_inst_map[author]))
         inst = []
-        for index, row in self.data.iterrows():
+        for index, row in rows.iterrows():
             row_inst = []
             for author in self.aut[index]:
                 if author in self.author_inst_map:
@@ -4565,8 +6003,9 @@ class pbx_probe:
                         if row_idx == index:
                             row_inst.append(re.sub(r"^(?:[A-Za-z]\.\s?)+", "", uni))
             inst.append(row_inst)
-        self.corr_a_inst_map = {}
-        for index, row in self.data.iterrows():
+        if start == 0:
+            self.corr_a_inst_map = {}
+        for index, row in rows.iterrows():
             if self.database == "wos":
                 if "corresponding author" in row["affiliation_"].lower():
                     corresponding_author = next(
@@ -4602,8 +6041,9 @@ class pbx_probe:
                         self.corr_a_inst_map[corresponding_author] = (
                             self.author_inst_map[corresponding_author]
                         )
-        self.frst_a_inst_map = {}
-        for index, row in self.data.iterrows():
+        if start == 0:
+            self.frst_a_inst_map = {}
+        for index, row in rows.iterrows():
             if self.aut[index]:
                 first_author = self.aut[index][0]
                 if first_author in self.author_inst_map:
@@ -4637,8 +6077,8 @@ class pbx_probe:
                     df_counts.iloc[i, k] = df_counts.iloc[i, k] + 1
         return df_counts
 
-    # Function: Get Collaboration Year
-    def __get_collaboration_year(self):
+    # Function: Get Collaboration Year (start > 0: Counts of the Previous Table plus the Rows from start on)
+    def __get_collaboration_year(self, start=0):
         max_aut = list(set([str(item) for item in self.aut_docs]))
         max_aut = sorted(max_aut, key=self.natsort)
         n_collaborators = ["n = " + i for i in max_aut]
@@ -4651,7 +6091,10 @@ class pbx_probe:
             index=years,
             columns=n_collaborators,
         )
-        for k in range(0, len(self.aut)):
+        if start > 0:
+            counts = self.dy_c_year.iloc[:-1, :-1]
+            dy_collab_year.loc[counts.index, counts.columns] = counts.to_numpy()
+        for k in range(start, len(self.aut)):
             i = str(int(self.dy[k]))
             j = ["n = " + str(len(self.aut[k]))]
             dy_collab_year.loc[i, j] = dy_collab_year.loc[i, j] + 1
@@ -4668,12 +6111,15 @@ class pbx_probe:
                 dy_collab_year.iloc[i, -1] = round(ci / dy_collab_year.iloc[i, -1], 2)
         return dy_collab_year
 
-    # Function: Get Reference Year
-    def __get_ref_year(self):
+    # Function: Get Reference Year (Years in known are Reused)
+    def __get_ref_year(self, known={}):
         date_end = self.date_end
         year_pattern = re.compile(r"(?<!\d)(\d{4})(?!\d)")
         extracted_years = []
         for ref in self.u_ref:
+            if ref in known:
+                extracted_years.append(known[ref])
+                continue
             matches = year_pattern.findall(ref)
             valid_years = [
                 int(year) for year in matches if 1665 <= int(year) <= date_end
@@ -4681,9 +6127,8 @@ class pbx_probe:
             extracted_years.append(max(valid_years) if valid_years else -1)
         return extracted_years
 
-    # Function: Get Reference ID
-    def __get_ref_id(self):
-        labels_r = ["r_" + str(i) for i in range(0, len(self.u_ref))]
+    # Function: Match Documents to References (Regex Results Cached; only New References are Searched for Known Keys)
+    def __match_local_refs(self):
         sources = self.data["source"].str.lower()
         keys_1 = (
             self.data["title"]
@@ -4698,27 +6143,51 @@ class pbx_probe:
             keys_1,
             np.where(sources == "wos", keys_2, None),
         )
-        corpus = " ".join(ref.lower() for ref in self.u_ref)
-        matched_indices = []
+        u_ref_lower = [ref.lower() for ref in self.u_ref]
+        position = {}
+        for j, ref in enumerate(u_ref_lower):
+            position.setdefault(ref, j)
+        all_refs = list(range(0, len(u_ref_lower)))
+        new_refs = [j for j in all_refs if u_ref_lower[j] not in self.ref_seen]
+        corpus = " ".join(u_ref_lower)
+        corpus_new = " ".join(u_ref_lower[j] for j in new_refs)
+        ref_match = {}
+        insd_r = []
+        insd_t = []
         for i, key in enumerate(keys):
-            if key and key.strip():
+            if not (key and key.strip()):
+                continue
+            if key not in ref_match:
+                hit = self.ref_match.get(key, -1)
+                if hit == -1 or (hit is not None and hit not in position):
+                    hit, search_refs, search_corpus = None, all_refs, corpus
+                else:
+                    search_refs, search_corpus = new_refs, corpus_new
                 try:
                     compiled_regex = re.compile(key)
-                    if re.search(compiled_regex, corpus):
-                        matched_indices.append(i)
+                    if re.search(compiled_regex, search_corpus):
+                        for j in search_refs:
+                            if re.search(compiled_regex, u_ref_lower[j]):
+                                if hit is None or j < position[hit]:
+                                    hit = u_ref_lower[j]
+                                break
                 except:
                     pass
-        insd_r = []
-        insd_t = []
-        u_ref_lower = [ref.lower() for ref in self.u_ref]
-        for i in matched_indices:
-            key = keys[i]
-            for j, ref in enumerate(u_ref_lower):
-                if re.search(key, ref):
-                    insd_r.append(f"r_{j}")
-                    insd_t.append(str(i))
-                    self.dy_ref[j] = int(self.dy[i])
-                    break
+                ref_match[key] = hit
+            hit = ref_match[key]
+            if hit is not None:
+                j = position[hit]
+                insd_r.append(f"r_{j}")
+                insd_t.append(str(i))
+                self.dy_ref[j] = int(self.dy[i])
+        self.ref_match = ref_match
+        self.ref_seen = set(u_ref_lower)
+        return insd_r, insd_t
+
+    # Function: Get Reference ID
+    def __get_ref_id(self):
+        labels_r = ["r_" + str(i) for i in range(0, len(self.u_ref))]
+        insd_r, insd_t = self.__match_local_refs()
         dict_lbs = dict(zip(insd_r, insd_t))
         dict_lbs.update({label: label for label in labels_r if label not in dict_lbs})
         labels_r = [dict_lbs.get(label, label) for label in labels_r]
@@ -4786,7 +6255,7 @@ class pbx_probe:
         rmv_custom_words=[],
         wordsn=15,
     ):
-        sw_full = []
+        sw_full = set()
         if view == "browser":
             pio.renderers.default = "browser"
         if entry == "kwp":
@@ -4799,79 +6268,17 @@ class pbx_probe:
             corpora = self.data["title"]
         if len(stop_words) > 0:
             for sw_ in stop_words:
-                if sw_ == "ar" or sw_ == "ara" or sw_ == "arabic":
-                    name = "Stopwords-Arabic.txt"
-                elif sw_ == "bn" or sw_ == "ben" or sw_ == "bengali":
-                    name = "Stopwords-Bengali.txt"
-                elif sw_ == "bg" or sw_ == "bul" or sw_ == "bulgarian":
-                    name = "Stopwords-Bulgarian.txt"
-                elif sw_ == "zh" or sw_ == "chi" or sw_ == "chinese":
-                    name = "Stopwords-Chinese.txt"
-                elif sw_ == "cs" or sw_ == "cze" or sw_ == "ces" or sw_ == "czech":
-                    name = "Stopwords-Czech.txt"
-                elif sw_ == "en" or sw_ == "eng" or sw_ == "english":
-                    name = "Stopwords-English.txt"
-                elif sw_ == "fi" or sw_ == "fin" or sw_ == "finnish":
-                    name = "Stopwords-Finnish.txt"
-                elif sw_ == "fr" or sw_ == "fre" or sw_ == "fra" or sw_ == "french":
-                    name = "Stopwords-French.txt"
-                elif sw_ == "de" or sw_ == "ger" or sw_ == "deu" or sw_ == "german":
-                    name = "Stopwords-German.txt"
-                elif sw_ == "el" or sw_ == "gre" or sw_ == "greek":
-                    name = "Stopwords-Greek.txt"
-                elif sw_ == "he" or sw_ == "heb" or sw_ == "hebrew":
-                    name = "Stopwords-Hebrew.txt"
-                elif sw_ == "hi" or sw_ == "hin" or sw_ == "hind":
-                    name = "Stopwords-Hind.txt"
-                elif sw_ == "hu" or sw_ == "hun" or sw_ == "hungarian":
-                    name = "Stopwords-Hungarian.txt"
-                elif sw_ == "it" or sw_ == "ita" or sw_ == "italian":
-                    name = "Stopwords-Italian.txt"
-                elif sw_ == "ja" or sw_ == "jpn" or sw_ == "japanese":
-                    name = "Stopwords-Japanese.txt"
-                elif sw_ == "ko" or sw_ == "kor" or sw_ == "korean":
-                    name = "Stopwords-Korean.txt"
-                elif sw_ == "mr" or sw_ == "mar" or sw_ == "marathi":
-                    name = "Stopwords-Marathi.txt"
-                elif sw_ == "fa" or sw_ == "per" or sw_ == "fas" or sw_ == "persian":
-                    name = "Stopwords-Persian.txt"
-                elif sw_ == "pl" or sw_ == "pol" or sw_ == "polish":
-                    name = "Stopwords-Polish.txt"
-                elif sw_ == "pt-br" or sw_ == "por-br" or sw_ == "portuguese-br":
-                    name = "Stopwords-Portuguese-br.txt"
-                elif sw_ == "ro" or sw_ == "rum" or sw_ == "ron" or sw_ == "romanian":
-                    name = "Stopwords-Romanian.txt"
-                elif sw_ == "ru" or sw_ == "rus" or sw_ == "russian":
-                    name = "Stopwords-Russian.txt"
-                elif sw_ == "sk" or sw_ == "slo" or sw_ == "slovak":
-                    name = "Stopwords-Slovak.txt"
-                elif sw_ == "es" or sw_ == "spa" or sw_ == "spanish":
-                    name = "Stopwords-Spanish.txt"
-                elif sw_ == "sv" or sw_ == "swe" or sw_ == "swedish":
-                    name = "Stopwords-Swedish.txt"
-                elif sw_ == "th" or sw_ == "tha" or sw_ == "thai":
-                    name = "Stopwords-Thai.txt"
-                elif sw_ == "uk" or sw_ == "ukr" or sw_ == "ukrainian":
-                    name = "Stopwords-Ukrainian.txt"
-                with pkg_resources.open_binary(stws, name) as file:
-                    raw_data = file.read()
-                result = chardet.detect(raw_data)
-                encoding = result["encoding"]
-                with pkg_resources.open_text(stws, name, encoding=encoding) as file:
-                    content = file.read().split("\n")
-                content = [line.rstrip("\r").rstrip("\n") for line in content]
-                sw = list(filter(None, content))
-                sw_full.extend(sw)
+                sw_full.update(stopword_set(sw_))
         if len(rmv_custom_words) > 0:
-            sw_full.extend(rmv_custom_words)
+            sw_full.update(rmv_custom_words)
         try:
             vec = CountVectorizer(
                 stop_words=frozenset(sw_full), ngram_range=(ngrams, ngrams)
             ).fit(corpora)
         except:
-            vec = CountVectorizer(stop_words=sw_full, ngram_range=(ngrams, ngrams)).fit(
-                corpora
-            )
+            vec = CountVectorizer(
+                stop_words=list(sw_full), ngram_range=(ngrams, ngrams)
+            ).fit(corpora)
         bag_of_words = vec.transform(corpora)
         sum_words = bag_of_words.sum(axis=0)
         words_freq = [
@@ -4987,7 +6394,7 @@ class pbx_probe:
         Ye = []
         for n in range(0, len(key)):
             name = key[n]
-            docs = [i for i in range(0, len(self.aut)) if name in self.aut[i]]
+            docs = self.__entity_index("aut").get(name, [])
             for i in docs:
                 j = dicty[int(self.data.loc[i, "year"])]
                 productivity.iloc[n, j] = productivity.iloc[n, j] + 1
@@ -6452,7 +7859,7 @@ class pbx_probe:
 
     #############################################################################
 
-    # Function: Text Pre-Processing
+    # Function: Text Pre-Processing (n_jobs > 1: Process Pool, only with at least clean_worker_min Documents per Worker)
     def clear_text(
         self,
         corpus,
@@ -6463,161 +7870,41 @@ class pbx_probe:
         rmv_numbers=True,
         rmv_custom_words=[],
         verbose=False,
+        n_jobs=1,
     ):
-        sw_full = []
-        if lowercase:
-            if verbose:
-                print("Lower Case: Working...")
-            corpus = [str(x).lower().replace("’", "'") for x in corpus]
-            if verbose:
-                print("Lower Case: Done!")
-        if rmv_special_chars:
-            if verbose:
-                print("Removing Special Characters: Working...")
-            corpus = [re.sub(r"[^a-zA-Z0-9']+", " ", i) for i in corpus]
-            if verbose:
-                print("Removing Special Characters: Done!")
-        if len(stop_words) > 0:
-            for sw_ in stop_words:
-                if sw_ == "ar" or sw_ == "ara" or sw_ == "arabic":
-                    name = "Stopwords-Arabic.txt"
-                elif sw_ == "bn" or sw_ == "ben" or sw_ == "bengali":
-                    name = "Stopwords-Bengali.txt"
-                elif sw_ == "bg" or sw_ == "bul" or sw_ == "bulgarian":
-                    name = "Stopwords-Bulgarian.txt"
-                elif sw_ == "zh" or sw_ == "chi" or sw_ == "chinese":
-                    name = "Stopwords-Chinese.txt"
-                elif sw_ == "cs" or sw_ == "cze" or sw_ == "ces" or sw_ == "czech":
-                    name = "Stopwords-Czech.txt"
-                elif sw_ == "en" or sw_ == "eng" or sw_ == "english":
-                    name = "Stopwords-English.txt"
-                elif sw_ == "fi" or sw_ == "fin" or sw_ == "finnish":
-                    name = "Stopwords-Finnish.txt"
-                elif sw_ == "fr" or sw_ == "fre" or sw_ == "fra" or sw_ == "french":
-                    name = "Stopwords-French.txt"
-                elif sw_ == "de" or sw_ == "ger" or sw_ == "deu" or sw_ == "german":
-                    name = "Stopwords-German.txt"
-                elif sw_ == "el" or sw_ == "gre" or sw_ == "greek":
-                    name = "Stopwords-Greek.txt"
-                elif sw_ == "he" or sw_ == "heb" or sw_ == "hebrew":
-                    name = "Stopwords-Hebrew.txt"
-                elif sw_ == "hi" or sw_ == "hin" or sw_ == "hind":
-                    name = "Stopwords-Hind.txt"
-                elif sw_ == "hu" or sw_ == "hun" or sw_ == "hungarian":
-                    name = "Stopwords-Hungarian.txt"
-                elif sw_ == "it" or sw_ == "ita" or sw_ == "italian":
-                    name = "Stopwords-Italian.txt"
-                elif sw_ == "ja" or sw_ == "jpn" or sw_ == "japanese":
-                    name = "Stopwords-Japanese.txt"
-                elif sw_ == "ko" or sw_ == "kor" or sw_ == "korean":
-                    name = "Stopwords-Korean.txt"
-                elif sw_ == "mr" or sw_ == "mar" or sw_ == "marathi":
-                    name = "Stopwords-Marathi.txt"
-                elif sw_ == "fa" or sw_ == "per" or sw_ == "fas" or sw_ == "persian":
-                    name = "Stopwords-Persian.txt"
-                elif sw_ == "pl" or sw_ == "pol" or sw_ == "polish":
-                    name = "Stopwords-Polish.txt"
-                elif sw_ == "pt-br" or sw_ == "por-br" or sw_ == "portuguese-br":
-                    name = "Stopwords-Portuguese-br.txt"
-                elif sw_ == "ro" or sw_ == "rum" or sw_ == "ron" or sw_ == "romanian":
-                    name = "Stopwords-Romanian.txt"
-                elif sw_ == "ru" or sw_ == "rus" or sw_ == "russian":
-                    name = "Stopwords-Russian.txt"
-                elif sw_ == "sk" or sw_ == "slo" or sw_ == "slovak":
-                    name = "Stopwords-Slovak.txt"
-                elif sw_ == "es" or sw_ == "spa" or sw_ == "spanish":
-                    name = "Stopwords-Spanish.txt"
-                elif sw_ == "sv" or sw_ == "swe" or sw_ == "swedish":
-                    name = "Stopwords-Swedish.txt"
-                elif sw_ == "th" or sw_ == "tha" or sw_ == "thai":
-                    name = "Stopwords-Thai.txt"
-                elif sw_ == "uk" or sw_ == "ukr" or sw_ == "ukrainian":
-                    name = "Stopwords-Ukrainian.txt"
-                with pkg_resources.open_binary(stws, name) as file:
-                    raw_data = file.read()
-                result = chardet.detect(raw_data)
-                encoding = result["encoding"]
-                with pkg_resources.open_text(stws, name, encoding=encoding) as file:
-                    content = file.read().split("\n")
-                content = [line.rstrip("\r").rstrip("\n") for line in content]
-                sw = list(filter(None, content))
-                sw_full.extend(sw)
-            if verbose:
-                print("Removing Stopwords: Working...")
-            for i in range(0, len(corpus)):
-                text = corpus[i].split()
-                text = [
-                    x.replace(" ", "")
-                    for x in text
-                    if x.replace(" ", "") not in sw_full
-                ]
-                corpus[i] = " ".join(text)
-                if verbose:
-                    print(
-                        "Removing Stopwords: " + str(i + 1) + " of " + str(len(corpus))
-                    )
-            if verbose:
-                print("Removing Stopwords: Done!")
-        if len(rmv_custom_words) > 0:
-            if verbose:
-                print("Removing Custom Words: Working...")
-            for i in range(0, len(corpus)):
-                text = corpus[i].split()
-                text = [
-                    x.replace(" ", "")
-                    for x in text
-                    if x.replace(" ", "") not in rmv_custom_words
-                ]
-                corpus[i] = " ".join(text)
-                if verbose:
-                    print(
-                        "Removing Custom Words: "
-                        + str(i + 1)
-                        + " of "
-                        + str(len(corpus))
-                    )
-            if verbose:
-                print("Removing Custom Word: Done!")
-        if rmv_accents:
-            if verbose:
-                print("Removing Accents: Working...")
-            for i in range(0, len(corpus)):
-                text = corpus[i]
-                try:
-                    text = unicode(text, "utf-8")
-                except NameError:
-                    pass
-                text = (
-                    unicodedata.normalize("NFD", text)
-                    .encode("ascii", "ignore")
-                    .decode("utf-8")
+        sw_full = set(rmv_custom_words)
+        for sw_ in stop_words:
+            sw_full.update(stopword_set(sw_))
+        options = (lowercase, rmv_special_chars, sw_full, rmv_accents, rmv_numbers)
+        if verbose:
+            print("Cleaning Text: Working...")
+        n_jobs = max(1, min(n_jobs, len(corpus) // clean_worker_min))
+        if n_jobs > 1:
+            cuts = np.linspace(0, len(corpus), n_jobs * 4 + 1).astype(np.int64)
+            chunks = [list(corpus[a:b]) for a, b in zip(cuts[:-1], cuts[1:])]
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                results = executor.map(
+                    clean_documents, chunks, [options] * len(chunks)
                 )
-                corpus[i] = str(text)
-            if verbose:
-                print("Removing Accents: Done!")
-        # Remove Numbers
-        if rmv_numbers:
-            if verbose:
-                print("Removing Numbers: Working...")
-            corpus = [re.sub("[0-9]", " ", i) for i in corpus]
-            if verbose:
-                print("Removing Numbers: Done!")
-        for i in range(0, len(corpus)):
-            corpus[i] = " ".join(corpus[i].split())
+                corpus = [text for chunk in results for text in chunk]
+        else:
+            corpus = clean_documents(corpus, options)
+        if verbose:
+            print("Cleaning Text: Done!")
         return corpus
 
-    # Function: TF-IDF
-    def dtm_tf_idf(self, corpus):
+    # Function: TF-IDF. Returns (CSR Matrix, Tokens); dense = True: DataFrame
+    def dtm_tf_idf(self, corpus, dense=False):
         vectorizer = TfidfVectorizer(norm="l2")
         tf_idf = vectorizer.fit_transform(corpus)
         try:
             tokens = vectorizer.get_feature_names_out()
         except:
             tokens = vectorizer.get_feature_names()
-        values = tf_idf.todense()
-        values = values.tolist()
-        dtm = pd.DataFrame(values, columns=tokens)
-        return dtm
+        if dense:
+            dtm = pd.DataFrame(tf_idf.toarray(), columns=tokens)
+            return dtm
+        return tf_idf.tocsr(), list(tokens)
 
     # Function: Projection
     def docs_projection(
@@ -6641,6 +7928,7 @@ class pbx_probe:
         cluster_method="kmeans",
         min_size=5,
         max_size=15,
+        cache_dir="",
     ):
         if corpus_type == "abs":
             corpus = self.data["abstract"]
@@ -6675,11 +7963,10 @@ class pbx_probe:
         if view == "browser":
             pio.renderers.default = "browser"
         if embeddings:
-            model = SentenceTransformer(
-                model
+            embds = self.__embed(
+                corpus, model, cache_dir
             )  # 'allenai/scibert_scivocab_uncased'; 'all-MiniLM-L6-v2'
-            embds = model.encode(corpus)
-        dtm = self.dtm_tf_idf(corpus)
+        dtm, _ = self.dtm_tf_idf(corpus)
         if method.lower() == "umap":
             decomposition = UMAP(n_components=n_components, random_state=1001)
         else:
@@ -6695,16 +7982,23 @@ class pbx_probe:
             transformed = np.copy(custom_projection)
         if len(custom_label) == 0:
             if cluster_method == "kmeans":
-                cluster = KMeans(
-                    n_clusters=n_clusters,
-                    init="k-means++",
-                    n_init=100,
-                    max_iter=10,
-                    random_state=1001,
-                )
                 if tf_idf and not embeddings:
+                    cluster = MiniBatchKMeans(
+                        n_clusters=n_clusters,
+                        init="k-means++",
+                        n_init=10,
+                        batch_size=2048,
+                        random_state=1001,
+                    )
                     cluster.fit(dtm)
                 else:
+                    cluster = KMeans(
+                        n_clusters=n_clusters,
+                        init="k-means++",
+                        n_init=100,
+                        max_iter=10,
+                        random_state=1001,
+                    )
                     cluster.fit(transformed)
                 labels = cluster.labels_
                 n = len(set(labels.tolist()))
@@ -6794,45 +8088,85 @@ class pbx_probe:
 
     #############################################################################
 
+    # Function: Citation Cube (Sparse u_ref x Citing Year Counts)
+    def __citation_cube(self):
+        if isinstance(self.ref_cube, int):
+            valid_years = [int(year) for year in self.dy if year != -1]
+            min_year, max_year = min(valid_years), max(valid_years)
+            x_range = list(range(min_year, max_year + 1))
+            ref_pos = {ref: i for i, ref in enumerate(self.u_ref_id)}
+            rows = []
+            cols = []
+            for i, pub_year in enumerate(self.dy):
+                if pub_year == -1:
+                    continue
+                col = int(pub_year) - min_year
+                for r in self.ref_id[i]:
+                    if r in ref_pos:
+                        rows.append(ref_pos[r])
+                        cols.append(col)
+            cube = csr_matrix(
+                (np.ones(len(rows), dtype=np.int64), (rows, cols)),
+                shape=(len(self.u_ref_id), len(x_range)),
+            )
+            cube.sum_duplicates()
+            self.ref_cube = (cube, x_range)
+        return self.ref_cube
+
+    # Function: Citation Link Table (int32 doc, int32 ref, int16 year; Sorted by Year)
+    def __citation_links(self):
+        if isinstance(self.ref_links, int):
+            ref_map = {r: i for i, r in enumerate(self.u_ref)}
+            doc, ref = [], []
+            for article_idx, ref_names in enumerate(self.ref):
+                codes = {ref_map.get(r, -1) for r in ref_names}
+                codes.discard(-1)
+                doc.extend([article_idx] * len(codes))
+                ref.extend(codes)
+            doc = np.asarray(doc, dtype=np.int32)
+            ref = np.asarray(ref, dtype=np.int32)
+            year = self.dy.to_numpy().astype(np.int16)[doc]
+            order = np.lexsort((ref, doc, year))
+            self.ref_links = (doc[order], ref[order], year[order])
+        return self.ref_links
+
     # Function: References Citations
     def ref_citation_matrix(self, tgt_ref_id=[], date_start=None, date_end=None):
-        citation_records = []
-        for article_idx, pub_year in enumerate(self.dy):
-            year = int(pub_year)
-            if (date_start is not None and year < date_start) or (
-                date_end is not None and year > date_end
-            ):
-                continue
-            ref_names = self.ref[article_idx]
-            ref_ids = self.ref_id[article_idx]
-            for ref_name, ref_id in zip(ref_names, ref_ids):
-                if ref_name.lower() == "unknown":
-                    continue
-                if tgt_ref_id and ref_id not in tgt_ref_id:
-                    continue
-                citation_records.append(
-                    {
-                        "Reference": ref_name,
-                        "Reference ID": ref_id,
-                        "Citing Articles": (article_idx, year),
-                    }
+        doc, ref, year = self.__citation_links()
+        lo = 0 if date_start is None else np.searchsorted(year, date_start, side="left")
+        hi = (
+            year.shape[0]
+            if date_end is None
+            else np.searchsorted(year, date_end, side="right")
+        )
+        doc, ref, year = doc[lo:hi], ref[lo:hi], year[lo:hi]
+        if tgt_ref_id:
+            tgt = set(tgt_ref_id)
+            codes = [i for i, r in enumerate(self.u_ref_id) if r in tgt]
+            keep = np.isin(ref, np.asarray(codes, dtype=np.int32))
+            doc, ref, year = doc[keep], ref[keep], year[keep]
+        order = np.argsort(ref, kind="stable")
+        doc, ref, year = doc[order], ref[order], year[order]
+        codes, starts = np.unique(ref, return_index=True)
+        bounds = np.append(starts, ref.shape[0])
+        citing = [
+            list(
+                zip(
+                    doc[bounds[i] : bounds[i + 1]].tolist(),
+                    year[bounds[i] : bounds[i + 1]].tolist(),
                 )
-        df = pd.DataFrame(citation_records)
-        result_df = (
-            df.groupby("Reference")
-            .agg(
-                {
-                    "Reference ID": lambda x: x.iloc[0],
-                    "Citing Articles": lambda x: list(set(x)),
-                }
             )
-            .reset_index()
-        )
-        ref_year_dict = dict(zip(self.u_ref, self.dy_ref))
-        result_df["Reference Year"] = result_df["Reference"].map(ref_year_dict)
-        return result_df[
-            ["Reference", "Reference ID", "Reference Year", "Citing Articles"]
+            for i in range(0, codes.shape[0])
         ]
+        result_df = pd.DataFrame(
+            {
+                "Reference": [self.u_ref[c] for c in codes],
+                "Reference ID": [self.u_ref_id[c] for c in codes],
+                "Reference Year": [self.dy_ref[c] for c in codes],
+                "Citing Articles": citing,
+            }
+        )
+        return result_df
 
     # Function: Top References
     def plot_top_refs(
@@ -6938,24 +8272,17 @@ class pbx_probe:
         elif ref_ids:
             selected_refs = ref_ids
             use_names = False
-        valid_years = [int(year) for year in self.dy if year != -1]
-        min_year, max_year = min(valid_years), max(valid_years)
-        x_range = list(range(min_year, max_year + 1))
-        citation_trajectory = {
-            ref: {year: 0 for year in x_range} for ref in selected_refs
-        }
-        for i, pub_year in enumerate(self.dy):
-            if pub_year == -1:
-                continue
-            article_refs = self.ref[i] if use_names else self.ref_id[i]
-            c = 0
-            for r in article_refs:
-                c = c + 1
-                if r in selected_refs:
-                    if pub_year in citation_trajectory[r]:
-                        citation_trajectory[r][pub_year] = (
-                            citation_trajectory[r][pub_year] + 1
-                        )
+        cube, x_range = self.__citation_cube()
+        ref_keys = self.u_ref if use_names else self.u_ref_id
+        ref_pos = {ref: i for i, ref in enumerate(ref_keys)}
+        citation_trajectory = {}
+        for ref in selected_refs:
+            row = (
+                cube[ref_pos[ref]].toarray().ravel()
+                if ref in ref_pos
+                else np.zeros(len(x_range), dtype=np.int64)
+            )
+            citation_trajectory[ref] = dict(zip(x_range, row.tolist()))
         fig = go.Figure()
         for idx, ref in enumerate(selected_refs):
             x_values = [year for year in x_range if citation_trajectory[ref][year] != 0]
@@ -7009,13 +8336,19 @@ class pbx_probe:
         return
 
     # Function: RPYS (Reference Publication Year Spectroscopy) with Gaussian Filter to Find Peaks
-    def plot_rpys(self, view="browser", peaks_only=False):
+    def plot_rpys(self, view="browser", peaks_only=False, weighted=False):
         if view == "browser":
             pio.renderers.default = "browser"
-        publication_years = [item for item in self.dy_ref if item != -1]
-        year_counts = Counter(publication_years)
-        years = sorted(year_counts.keys())
-        counts = np.array([year_counts[year] for year in years])
+        cube, _ = self.__citation_cube()
+        ref_years = np.asarray(self.dy_ref, dtype=np.int64)
+        if weighted:
+            ref_weights = np.asarray(cube.sum(axis=1)).ravel()
+        else:
+            ref_weights = np.ones(ref_years.shape[0], dtype=np.int64)
+        keep = ref_years != -1
+        years, inv = np.unique(ref_years[keep], return_inverse=True)
+        counts = np.bincount(inv, weights=ref_weights[keep]).astype(np.int64)
+        years = years.tolist()
         smoothed_counts = gaussian_filter1d(counts, sigma=1)
         peaks, properties = find_peaks(smoothed_counts, height=1)
         peak_years = np.array(years)[peaks]
@@ -7086,25 +8419,102 @@ class pbx_probe:
         fig.show()
         return
 
-    # Function: Top Cited Co-References
-    def top_cited_co_references(self, group=2, topn=10):
-        co_cited_groups = []
-        for refs in self.ref_id:
-            refs = list(set(refs))
-            for combo in combinations(refs, group):
-                co_cited_groups.append(tuple(sorted(combo)))
-        group_counts = Counter(co_cited_groups)
-        top_groups = group_counts.most_common(topn)
+    # Function: Integer Encoding of ref_id (Sorted Labels; CSR Rows of Sorted Unique Codes)
+    def __encode_refs(self):
+        if isinstance(self.ref_enc, int):
+            vocab = sorted({r for refs in self.ref_id for r in refs})
+            code = {r: i for i, r in enumerate(vocab)}
+            rows = [np.unique([code[r] for r in refs]) for refs in self.ref_id]
+            indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+            indptr[1:] = np.cumsum([len(r) for r in rows])
+            ids = (
+                np.concatenate(rows).astype(np.int64)
+                if len(rows) > 0
+                else np.empty(0, dtype=np.int64)
+            )
+            self.ref_enc = (vocab, indptr, ids)
+        return self.ref_enc
+
+    # Function: Inverted Index ref_id -> Citing Document Indices (CSR Postings)
+    def __ref_postings(self):
+        if isinstance(self.ref_post, int):
+            vocab, indptr, ids = self.__encode_refs()
+            doc_ref = csr_matrix(
+                (np.ones(ids.shape[0], dtype=np.int8), ids, indptr),
+                shape=(len(indptr) - 1, len(vocab)),
+            )
+            ref_doc = doc_ref.T.tocsr()
+            ref_doc.sort_indices()
+            code = {r: i for i, r in enumerate(vocab)}
+            self.ref_post = (code, ref_doc.indptr, ref_doc.indices.astype(np.int64))
+        return self.ref_post
+
+    # Function: Top Cited Co-References. Method: "exact" or "sketch" (Count-Min, Approximate)
+    def top_cited_co_references(
+        self, group=2, topn=10, method="exact", n_jobs=1, width=2**20, depth=4
+    ):
+        vocab, indptr, ids = self.__encode_refs()
+        base = max(len(vocab), 1)
+        hashed = group * math.log2(base) >= 63
+        width = width if method == "sketch" else 0
+        n_cand = max(topn * 20, 1000)
+        n_jobs = max(1, min(n_jobs, len(indptr) - 1))
+        cuts = np.linspace(0, len(indptr) - 1, n_jobs + 1).astype(np.int64)
+        shards = [
+            (indptr[a : b + 1] - indptr[a], ids[indptr[a] : indptr[b]])
+            for a, b in zip(cuts[:-1], cuts[1:])
+        ]
+        args = [
+            (ptr, sub, group, base, width, depth, n_cand, 2**22, hashed)
+            for ptr, sub in shards
+        ]
+        if n_jobs > 1:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                results = list(executor.map(co_occurrence_shard, *zip(*args)))
+        else:
+            results = [co_occurrence_shard(*arg) for arg in args]
+        keys = np.empty(0, dtype=np.int64)
+        counts = np.empty(0, dtype=np.int64)
+        if width > 0:
+            seeds = np.arange(1, depth + 1, dtype=np.uint64) * np.uint64(
+                0x9E3779B97F4A7C15
+            )
+            table = sum(result[2] for result in results)
+            for result in results:
+                keys = np.union1d(keys, result[0])
+            counts = cms_query(table, keys, seeds)
+        else:
+            for result in results:
+                keys, counts = merge_counts(keys, counts, result[0], result[1])
+        if hashed:
+            cand = np.lexsort((keys, -counts))[:n_cand]
+            targets = np.sort(keys[cand])
+            _, members = combination_members(indptr, ids, group, targets)
+            combos = Counter(map(tuple, members.tolist()))
+            ranked = sorted(combos.items(), key=lambda item: (-item[1], item[0]))
+            top_groups = [
+                (tuple(vocab[code] for code in combo), count)
+                for combo, count in ranked[:topn]
+            ]
+        else:
+            order = np.lexsort((keys, -counts))[:topn]
+            top_groups = []
+            for key, count in zip(keys[order], counts[order]):
+                combo = []
+                for _ in range(0, group):
+                    key, code = divmod(int(key), base)
+                    combo.append(vocab[code])
+                top_groups.append((tuple(reversed(combo)), int(count)))
         df = pd.DataFrame(top_groups, columns=["Reference ID Sets", "Count"])
         return df
 
     # Function: Plot Co-Citation
-    def plot_co_citation_network(self, view="browser", target_ref_id="", topn=10):
+    def plot_co_citation_network(
+        self, view="browser", target_ref_id="", topn=10, layout="spring"
+    ):
         if view == "browser":
             pio.renderers.default = "browser"
-        citing_articles = [
-            idx for idx, refs in enumerate(self.ref_id) if target_ref_id in refs
-        ]
+        citing_articles = self.__entity_index("ref_id").get(target_ref_id, [])
         co_cited_refs = []
         for article_idx in citing_articles:
             co_cited_refs.extend(self.ref_id[article_idx])
@@ -7148,7 +8558,7 @@ class pbx_probe:
             )
         for source, target, weight in edges:
             G.add_edge(source, target, weight=weight)
-        pos = nx.spring_layout(G, seed=42, k=0.6, iterations=100)
+        pos = self.__graph_layout(G, layout, seed=42, k=0.6, iterations=100)
         edge_x, edge_y, edge_weights = [], [], []
         for edge in G.edges(data=True):
             x0, y0 = pos[edge[0]]
@@ -7347,119 +8757,58 @@ class pbx_probe:
         return result, top_by_decade_a, top_by_decade_h
 
     # Function: Detect Sleeping Beauties. Based on < https://doi.org/10.1007/s41109-021-00389-0 >
-    def detect_sleeping_beauties(self, topn=10, min_count=10):
-        valid_years = [int(year) for year in self.dy if year != -1]
-        min_year, max_year = min(valid_years), max(valid_years)
-        x_range = list(range(min_year, max_year + 1))
-        citation_trajectory = {
-            ref: {year: 0 for year in x_range} for ref in self.u_ref_id
-        }
-        for i, pub_year in enumerate(self.dy):
-            if pub_year == -1:
-                continue
-            article_refs = self.ref_id[i]
-            c = 0
-            for r in article_refs:
-                c = c + 1
-                if r in self.u_ref_id:
-                    if pub_year in citation_trajectory[r]:
-                        citation_trajectory[r][pub_year] = (
-                            citation_trajectory[r][pub_year] + 1
-                        )
-        metrics = {}
-        for ref, counts_dict in citation_trajectory.items():
-            years = sorted(counts_dict.keys())
-            if not years:
-                continue
-            pub_year = years[0]
-            t_values = [year - pub_year for year in years]
-            citations = [counts_dict[year] for year in years]
-            total_citations = sum(citations)
-            if total_citations < min_count:
-                metrics[ref] = {
-                    "B": 0.0,
-                    "t_a": 0,
-                    "c0": citations[0],
-                    "cm": max(citations),
-                    "t_m": 0,
-                }
-                continue
-            c0 = citations[0]
-            cm = max(citations)
-            t_m_index = citations.index(cm)
-            t_m = t_values[t_m_index]
-            if t_m == 0:
-                metrics[ref] = {"B": 0.0, "t_a": 0, "c0": c0, "cm": cm, "t_m": 0}
-                continue
-
-            def L(t):
-                return ((cm - c0) / t_m) * t + c0
-
-            B = 0.0
-            for t, c in zip(t_values, citations):
-                if t > t_m:
-                    break
-                B = B + (L(t) - c) / max(1, c)
-            denom = np.sqrt((cm - c0) ** 2 + t_m**2)
-            d_values = []
-            for t, c in zip(t_values, citations):
-                if t > t_m:
-                    break
-                d = abs((cm - c0) * t - t_m * c + t_m * c0) / np.maximum(1, denom)
-                d_values.append(d)
-            if d_values:
-                max_idx = np.argmax(d_values)
-                t_a = t_values[max_idx]
-            else:
-                t_a = 0
-            metrics[ref] = {
+    def detect_sleeping_beauties(self, topn=10, min_count=10, block_size=4096):
+        cube, _ = self.__citation_cube()
+        totals = np.asarray(cube.sum(axis=1)).ravel()
+        rows = np.where(totals >= min_count)[0]
+        parts = [
+            sleeping_beauty_coefficients(cube[rows[i : i + block_size]].toarray())
+            for i in range(0, rows.shape[0], block_size)
+        ]
+        if len(parts) == 0:
+            parts = [sleeping_beauty_coefficients(np.zeros((0, cube.shape[1])))]
+        B, SBI, t_a, c0, cm, t_m = [np.concatenate(item) for item in zip(*parts)]
+        metrics = pd.DataFrame(
+            {
+                "ref": [self.u_ref_id[i] for i in rows],
                 "B": B,
-                "SBI": B / denom if denom > 0 else 0.0,
+                "SBI": SBI,
                 "t_a": t_a,
-                "c0": c0,
-                "cm": cm,
+                "c0": c0.astype(np.int64),
+                "cm": cm.astype(np.int64),
                 "t_m": t_m,
             }
-        metrics = sorted(metrics.items(), key=lambda item: item[1]["B"], reverse=True)
-        metrics = [item for item in metrics if item[1]["B"] > 0][:topn]
-        metrics = pd.DataFrame([{"ref": ref, **vals} for ref, vals in metrics])
+        )
+        metrics = metrics[metrics["B"] > 0]
+        metrics = metrics.sort_values("B", ascending=False, kind="stable").head(topn)
+        metrics = metrics.reset_index(drop=True)
         return metrics
 
     # Function: Detect Princes. Based on < https://doi.org/10.1007/s41109-021-00389-0 >
     def detect_princes(self, metrics):
+        code, indptr, docs = self.__ref_postings()
+        valid = (self.dy != -1).to_numpy()
+        in_citers = np.zeros(len(valid), dtype=bool)
         results = []
-        for _, row in metrics.iterrows():
-            sb_id = row["ref"]
-            citing_indices = [
-                idx for idx, refs in enumerate(self.ref_id) if sb_id in refs
-            ]
-            sb_citers = []
-            for idx in citing_indices:
-                pub_year = self.dy[idx]
-                if pub_year == -1:
-                    continue
-                sb_citers.append(
-                    {
-                        "id": self.table_id_doc["ID"][idx],
-                        "pub_year": int(pub_year),
-                        "references": self.ref_id[idx],
-                    }
-                )
-            candidates = [p for p in sb_citers]
-            co_citation_counts = {}
-            for candidate in candidates:
-                cid = candidate["id"]
-                count = sum(1 for p in sb_citers if cid in p.get("references", []))
-                co_citation_counts[cid] = count
-            if co_citation_counts:
-                prince_id = max(co_citation_counts, key=co_citation_counts.get)
-                prince = next(p for p in candidates if p["id"] == prince_id)
+        for sb_id in metrics["ref"]:
+            c = code.get(sb_id, -1)
+            citers = docs[indptr[c] : indptr[c + 1]] if c >= 0 else docs[:0]
+            citers = citers[valid[citers]]
+            in_citers[citers] = True
+            counts = np.zeros(citers.shape[0], dtype=np.int64)
+            for k, cid in enumerate(citers):
+                r = code.get(str(cid), -1)
+                if r >= 0:
+                    counts[k] = in_citers[docs[indptr[r] : indptr[r + 1]]].sum()
+            in_citers[citers] = False
+            if citers.shape[0] > 0:
+                k = int(np.argmax(counts))
                 results.append(
                     {
                         "SB_id": sb_id,
-                        "PR_id": prince_id,
-                        "PR_pub_year": prince["pub_year"],
-                        "co_citation_count": co_citation_counts[prince_id],
+                        "PR_id": str(citers[k]),
+                        "PR_pub_year": int(self.dy[citers[k]]),
+                        "co_citation_count": int(counts[k]),
                     }
                 )
             else:
@@ -7664,41 +9013,7 @@ class pbx_probe:
             sparse_matrix, columns=self.u_ref
         )
         self.labels_r = [f"r_{i}" for i in range(0, num_cols)]
-        sources = self.data["source"].str.lower()
-        keys_1 = (
-            self.data["title"]
-            .str.lower()
-            .str.replace("[", "", regex=False)
-            .str.replace("]", "", regex=False)
-            .tolist()
-        )
-        keys_2 = self.data["doi"].str.lower().tolist()
-        keys = np.where(
-            sources.isin(["scopus", "pubmed"]),
-            keys_1,
-            np.where(sources == "wos", keys_2, None),
-        )
-        corpus = " ".join(ref.lower() for ref in self.u_ref)
-        matched_indices = []
-        for i, key in enumerate(keys):
-            if key and key.strip():
-                try:
-                    compiled_regex = re.compile(key)
-                    if re.search(compiled_regex, corpus):
-                        matched_indices.append(i)
-                except:
-                    pass
-        insd_r = []
-        insd_t = []
-        u_ref_lower = [ref.lower() for ref in self.u_ref]
-        for i in matched_indices:
-            key = keys[i]
-            for j, ref in enumerate(u_ref_lower):
-                if re.search(key, ref):
-                    insd_r.append(f"r_{j}")
-                    insd_t.append(str(i))
-                    self.dy_ref[j] = int(self.dy[i])
-                    break
+        insd_r, insd_t = self.__match_local_refs()
         self.dict_lbs = dict(zip(insd_r, insd_t))
         self.dict_lbs.update(
             {label: label for label in self.labels_r if label not in self.dict_lbs}
@@ -7738,6 +9053,84 @@ class pbx_probe:
             self.__adjacency_matrix_ref(min_count, local_nodes)
             return self.matrix_r
 
+    # Function: Similarity Matrix (Upper Triangular, Sparse)
+    def __similarity_matrix(self, sim_type="coup", cut=0.3):
+        self.__adjacency_matrix_ref(1, False)
+        adjacency = self.matrix_r.sparse.to_coo().tocsr()
+        adjacency.data = np.ones_like(adjacency.data)
+        if sim_type == "coup":
+            sim_matrix = cosine_similarity(adjacency, dense_output=False)
+        elif sim_type == "cocit":
+            sim_matrix = adjacency @ adjacency.T
+        sim_matrix = triu(sim_matrix, k=1).tocsr()
+        sim_matrix.data[sim_matrix.data < cut] = 0
+        sim_matrix.eliminate_zeros()
+        return sim_matrix
+
+    # Function: Community Partition of the Given Nodes
+    def __community_partition(self, adjacency, nodes, community="louvain", resolution=1.0):
+        sub_matrix = csr_matrix(adjacency)[nodes, :][:, nodes]
+        sub_matrix = sub_matrix.maximum(sub_matrix.T)
+        partition = community_labels(
+            sub_matrix, method=community, resolution=resolution
+        )
+        return partition.tolist()
+
+    # Function: Graph Layout. Layout: "spring" (networkx), "bh" (Barnes-Hut), or "circular"
+    def __graph_layout(self, G, layout="spring", seed=42, scale=1, **kwargs):
+        nodes = list(G.nodes)
+        adjacency = nx.to_scipy_sparse_array(G, nodelist=nodes, format="csr")
+        key = (
+            graph_hash(nodes, adjacency),
+            seed,
+            layout,
+            scale,
+            tuple(sorted(kwargs.items())),
+        )
+        if key not in self.layout_cache:
+            if layout == "bh":
+                coords = force_layout(adjacency, seed=seed, scale=scale, **kwargs)
+                pos = {node: coords[i] for i, node in enumerate(nodes)}
+            elif layout == "circular":
+                pos = nx.circular_layout(G, scale=scale)
+            else:
+                pos = nx.spring_layout(G, seed=seed, scale=scale, **kwargs)
+            if len(self.layout_cache) >= 32:
+                self.layout_cache.pop(next(iter(self.layout_cache)))
+            self.layout_cache[key] = pos
+        return self.layout_cache[key]
+
+    # Function: Network Communities (Partition Labels without Plotting)
+    def network_communities(
+        self,
+        adj_type="aut",
+        min_count=2,
+        community="louvain",
+        resolution=1.0,
+        cut_coup=0.3,
+        cut_cocit=5,
+    ):
+        if adj_type == "coup" or adj_type == "cocit":
+            cut = cut_coup if adj_type == "coup" else cut_cocit
+            adjacency = self.__similarity_matrix(adj_type, cut)
+            adjacency = adjacency.maximum(adjacency.T)
+            nodes = np.unique(adjacency.nonzero()[0]).tolist()
+            ids = [str(node) for node in nodes]
+            names = [self.dict_id_doc[item] for item in ids]
+        else:
+            self.make_matrix(entry=adj_type, min_count=min_count)
+            adjacency = self.matrix_a.sparse.to_coo().tocsr()
+            nodes = np.unique(adjacency.nonzero()[1]).tolist()
+            ids = [self.labels_a[node] for node in nodes]
+            names = [self.matrix_a.columns[node] for node in nodes]
+        partition = self.__community_partition(adjacency, nodes, community, resolution)
+        self.table_comm = pd.DataFrame(
+            zip(ids, names, partition), columns=["ID", "Name", "Cluster"]
+        )
+        self.table_comm = self.table_comm.sort_values("Cluster", kind="stable")
+        self.table_comm = self.table_comm.reset_index(drop=True)
+        return self.table_comm
+
     # Function: Network Collab
     def network_collab(
         self,
@@ -7756,6 +9149,7 @@ class pbx_probe:
         nd_b="#008000",
         nd_c="#808080",
         verbose=False,
+        layout="spring",
     ):
         if entry == "aut":
             self.__adjacency_matrix_aut(0)
@@ -7817,7 +9211,7 @@ class pbx_probe:
                 G.add_edge(target, conn_target, color=color)
             node_colors = [G.nodes[n]["color"] for n in G.nodes()]
             edge_colors = [G[u][v]["color"] for u, v in G.edges()]
-            pos = nx.spring_layout(G, seed=42)
+            pos = self.__graph_layout(G, layout, seed=42)
             label_pos = {k: (v[0], v[1] + tspace) for k, v in pos.items()}
             labels = {
                 node: "" if G.nodes[node]["color"] == nd_a else node
@@ -7857,6 +9251,9 @@ class pbx_probe:
         node_labels=False,
         cut_coup=0.3,
         cut_cocit=5,
+        community="gn",
+        resolution=1.0,
+        layout="spring",
     ):
         sim = ""
         if sim_type == "coup":
@@ -7879,26 +9276,10 @@ class pbx_probe:
         elif not node_labels and node_size > 0:
             mode = "markers"
             size = node_size
-        self.__adjacency_matrix_ref(1, False)
-        adjacency_matrix = self.matrix_r.values
-        if sim_type == "coup":
-            adjacency_matrix = cosine_similarity(adjacency_matrix)
-        elif sim_type == "cocit":
-            x = pd.DataFrame(
-                np.zeros((adjacency_matrix.shape[0], adjacency_matrix.shape[0]))
-            )
-            for i in range(0, adjacency_matrix.shape[0]):
-                for j in range(0, adjacency_matrix.shape[0]):
-                    if i != j:
-                        ct = adjacency_matrix[i, :] + adjacency_matrix[j, :]
-                        ct = ct.tolist()
-                        vl = ct.count(2.0)
-                        if vl > 0:
-                            x.iloc[i, j] = vl
-            adjacency_matrix = x
-        adjacency_matrix = np.triu(adjacency_matrix, k=1)
+        adjacency_matrix = self.__similarity_matrix(sim_type, cut)
         S = nx.Graph()
-        rows, cols = np.where(adjacency_matrix >= cut)
+        sim_coo = adjacency_matrix.tocoo()
+        rows, cols, weights = sim_coo.row, sim_coo.col, sim_coo.data
         edges = list(zip(rows.tolist(), cols.tolist()))
         u_rows = list(set(rows.tolist()))
         u_rows = [str(item) for item in u_rows]
@@ -7951,23 +9332,38 @@ class pbx_probe:
             srt_ = str(srt)
             end_ = str(end)
             if end_ != "-1":
-                wght = round(adjacency_matrix[srt, end], 3)
+                wght = round(float(weights[i]), 3)
                 S.add_edge(srt_, end_, weight=wght)
                 self.sim_table.iloc[i, 0] = "(" + srt_ + "," + end_ + ")"
                 self.sim_table.iloc[i, 1] = wght
                 self.ask_gpt_sim.iloc[i, 0] = "Paper ID: " + srt_
                 self.ask_gpt_sim.iloc[i, 1] = "Paper ID: " + end_
                 self.ask_gpt_sim.iloc[i, 2] = wght
-        generator = nx.algorithms.community.girvan_newman(S)
-        community = next(generator)
-        community_list = sorted(map(sorted, community))
-        for com in community_list:
-            community_list.index(com)
-            for node in com:
-                S.nodes[node]["color"] = self.color_names[community_list.index(com)]
-                S.nodes[node]["n_cls"] = community_list.index(com)
+        if community == "gn":
+            generator = nx.algorithms.community.girvan_newman(S)
+            community_ = next(generator)
+            community_list = sorted(map(sorted, community_))
+            for com in community_list:
+                community_list.index(com)
+                for node in com:
+                    S.nodes[node]["color"] = self.color_names[
+                        community_list.index(com) % len(self.color_names)
+                    ]
+                    S.nodes[node]["n_cls"] = community_list.index(com)
+        else:
+            nodes = [int(node) for node in S.nodes()]
+            partition = self.__community_partition(
+                adjacency_matrix, nodes, community, resolution
+            )
+            for node, n_cls in zip(S.nodes(), partition):
+                S.nodes[node]["color"] = self.color_names[n_cls % len(self.color_names)]
+                S.nodes[node]["n_cls"] = n_cls
+        self.table_comm = pd.DataFrame(
+            [[node, S.nodes[node]["n_cls"]] for node in S.nodes()],
+            columns=["ID", "Cluster"],
+        )
         color = [S.nodes[n]["color"] for n in S.nodes()]
-        pos_s = nx.spring_layout(S, seed=42, scale=1)
+        pos_s = self.__graph_layout(S, layout, seed=42, scale=1)
         node_list_s = list(S.nodes)
         edge_list_s = list(S.edges)
         nids_list_s = [S.nodes[n]["n_id"] for n in S.nodes()]
@@ -8335,9 +9731,17 @@ class pbx_probe:
         node_labels=False,
         label_type="id",
         centrality=None,
+        community="gn",
+        resolution=1.0,
+        layout="spring",
     ):
         adj_ = ""
-        cen_ = "Girvan-Newman Community Algorithm"
+        com_names = {
+            "gn": "Girvan-Newman Community Algorithm",
+            "louvain": "Louvain Community Algorithm",
+            "lpa": "Label Propagation Community Algorithm",
+        }
+        cen_ = com_names[community]
         if view == "browser":
             pio.renderers.default = "browser"
         if node_labels:
@@ -8354,30 +9758,31 @@ class pbx_probe:
             size = node_size
         if adj_type == "aut":
             self.__adjacency_matrix_aut(min_count)
-            adjacency_matrix = self.matrix_a.values
+            adjacency_matrix = self.matrix_a.sparse.to_coo().tocsr()
             dict_ = self.dict_id_aut
             adj_ = "Author"
         elif adj_type == "cout":
             self.__adjacency_matrix_ctr(min_count)
-            adjacency_matrix = self.matrix_a.values
+            adjacency_matrix = self.matrix_a.sparse.to_coo().tocsr()
             dict_ = self.dict_id_ctr
             adj_ = "Country"
         elif adj_type == "inst":
             self.__adjacency_matrix_inst(min_count)
-            adjacency_matrix = self.matrix_a.values
+            adjacency_matrix = self.matrix_a.sparse.to_coo().tocsr()
             dict_ = self.dict_id_uni
             adj_ = "Institution"
         elif adj_type == "kwa":
             self.__adjacency_matrix_kwa(min_count)
-            adjacency_matrix = self.matrix_a.values
+            adjacency_matrix = self.matrix_a.sparse.to_coo().tocsr()
             dict_ = self.dict_id_kwa
             adj_ = "Author Keywords"
         elif adj_type == "kwp":
             self.__adjacency_matrix_kwp(min_count)
-            adjacency_matrix = self.matrix_a.values
+            adjacency_matrix = self.matrix_a.sparse.to_coo().tocsr()
             dict_ = self.dict_id_kwp
             adj_ = "Keywords Plus"
-        rows, cols = np.where(adjacency_matrix >= 1)
+        adjacency_matrix.sort_indices()
+        rows, cols = (adjacency_matrix >= 1).nonzero()
         edges = list(zip(rows.tolist(), cols.tolist()))
         u_cols = list(set(cols.tolist()))
         self.H = nx.Graph()
@@ -8569,22 +9974,42 @@ class pbx_probe:
             dict_cen = dict(
                 zip(self.table_centr.iloc[:, -2], self.table_centr.iloc[:, -1])
             )
-        else:
+        elif community == "gn":
             generator = nx.algorithms.community.girvan_newman(self.H)
-            community = next(generator)
-            community_list = sorted(map(sorted, community))
+            community_ = next(generator)
+            community_list = sorted(map(sorted, community_))
             for com in community_list:
                 community_list.index(com)
                 for node in com:
                     self.H.nodes[node]["color"] = self.color_names[
-                        community_list.index(com)
+                        community_list.index(com) % len(self.color_names)
                     ]
                     self.H.nodes[node]["n_cls"] = community_list.index(com)
             color = [self.H.nodes[n]["color"] for n in self.H.nodes()]
-        self.pos_a = nx.spring_layout(self.H, seed=42, scale=1000)
+        else:
+            label_to_idx = {self.labels_a[i]: i for i in u_cols}
+            nodes = [label_to_idx[n] for n in self.H.nodes()]
+            partition = self.__community_partition(
+                adjacency_matrix, nodes, community, resolution
+            )
+            for node, n_cls in zip(self.H.nodes(), partition):
+                self.H.nodes[node]["color"] = self.color_names[
+                    n_cls % len(self.color_names)
+                ]
+                self.H.nodes[node]["n_cls"] = n_cls
+            color = [self.H.nodes[n]["color"] for n in self.H.nodes()]
+        if cen_ in com_names.values():
+            self.table_comm = pd.DataFrame(
+                [
+                    [n, dict_[n], self.H.nodes[n]["n_cls"]]
+                    for n in self.H.nodes()
+                ],
+                columns=["ID", "Name", "Cluster"],
+            )
+        self.pos_a = self.__graph_layout(self.H, layout, seed=42, scale=1000)
         self.node_list_a = list(self.H.nodes)
         self.edge_list_a = list(self.H.edges)
-        if cen_ == "Girvan-Newman Community Algorithm":
+        if cen_ in com_names.values():
             self.ask_gpt_adj = pd.DataFrame(
                 (np.zeros((len(self.H.edges), 4))),
                 columns=[
@@ -8604,7 +10029,7 @@ class pbx_probe:
                     "Node 2" + " (" + cen_ + ")",
                 ],
             )
-        if cen_ == "Girvan-Newman Community Algorithm":
+        if cen_ in com_names.values():
             for i in range(0, self.ask_gpt_adj.shape[0]):
                 srt, end = list(self.H.edges)[i]
                 self.ask_gpt_adj.iloc[i, 0] = "ID: " + srt
@@ -9095,6 +10520,77 @@ class pbx_probe:
         fig_.show()
         return
 
+    # Function: Citation History Graph (Integer Arrays, no Plotting)
+    def hist_graph(self, min_links=0, k_core=0, main_path=0, weight="spc", dist=1.2):
+        n = self.data.shape[0]
+        years = self.dy.to_numpy().astype(np.int64)
+        src = []
+        tgt = []
+        for i, refs in enumerate(self.ref_id):
+            for r in refs:
+                if r.isdigit():
+                    src.append(i)
+                    tgt.append(int(r))
+        src = np.asarray(src, dtype=np.int64)
+        tgt = np.asarray(tgt, dtype=np.int64)
+        adjacency = csr_matrix(
+            (np.ones(src.shape[0], dtype=np.int8), (src, tgt)), shape=(n, n)
+        )
+        adjacency.sum_duplicates()
+        adjacency.data[:] = 1
+        out_deg = np.diff(adjacency.indptr)
+        seeds = out_deg >= min_links
+        if min_links > 0:
+            held = seeds.copy()
+            held[adjacency[np.where(seeds)[0], :].indices] = True
+        else:
+            held = np.ones(n, dtype=bool)
+        coo = adjacency.tocoo()
+        a, b = coo.row.astype(np.int64), coo.col.astype(np.int64)
+        mask = held[a] & held[b] & (a != b)
+        a, b = a[mask], b[mask]
+        if k_core > 0:
+            sym = csr_matrix((np.ones(a.shape[0]), (a, b)), shape=(n, n))
+            sym = sym.maximum(sym.T).tocsr()
+            sym.sort_indices()
+            core = k_core_numbers(sym.indptr, sym.indices, n)
+            held = held & (core >= k_core)
+            mask = held[a] & held[b]
+            a, b = a[mask], b[mask]
+        flip = years[b] > years[a]
+        paper = np.where(flip, b, a)
+        reference = np.where(flip, a, b)
+        edges = np.unique(np.column_stack([paper, reference]), axis=0)
+        self.hist_paths = []
+        if main_path > 0 and edges.shape[0] > 0:
+            dag, order = citation_dag(edges[:, 0], edges[:, 1], n)
+            spc, splc = search_path_counts(dag.indptr, dag.indices, order)
+            ones = np.ones(dag.indices.shape[0], dtype=np.float64)
+            w = {"spc": spc, "splc": splc, "length": ones}[weight]
+            self.hist_paths = ranked_main_paths(dag, order, w, 2, main_path)
+            on_path = np.zeros(n, dtype=bool)
+            for path in self.hist_paths:
+                on_path[path] = True
+            held = held & on_path
+            mask = held[edges[:, 0]] & held[edges[:, 1]]
+            edges = edges[mask]
+        ids = np.where(held)[0]
+        yrs = years[ids]
+        order = np.lexsort((ids, yrs))
+        ids, yrs = ids[order], yrs[order]
+        rank = np.arange(0, ids.shape[0]) - np.searchsorted(yrs, yrs, side="left")
+        self.hist_nodes = pd.DataFrame(
+            {
+                "id": ids,
+                "year": yrs,
+                "x_pos": yrs,
+                "y_pos": rank * dist,
+                "n_m": seeds[ids],
+            }
+        )
+        self.hist_edges = edges
+        return self.hist_nodes, self.hist_edges
+
     # Function: Citation History Network
     def network_hist(
         self,
@@ -9106,125 +10602,54 @@ class pbx_probe:
         font_size=10,
         node_labels=True,
         dist=1.2,
+        k_core=0,
+        main_path=0,
+        weight="spc",
     ):
-        # ----------------------------------------------------------------------
-
-        def filter_matrix_by_citations(matrix_r, min_links):
-            filtered_matrix = matrix_r.copy()
-            row_sums = filtered_matrix.sum(axis=1)
-            row_sums_sorted = row_sums.sort_values(ascending=False)
-            hold_list = set()
-            node_min = []
-            for node, link_count in row_sums_sorted.items():
-                if link_count >= min_links:
-                    hold_list.add(node)
-                    node_min.append(node)
-                    linked_nodes = filtered_matrix.loc[node][
-                        filtered_matrix.loc[node] > 0
-                    ].index
-                    linked_nodes = [int(item) for item in linked_nodes]
-                    hold_list.update(linked_nodes)
-            node_min = [str(item) for item in node_min]
-            all_nodes = set(filtered_matrix.index)
-            dropped_indices = list(all_nodes - hold_list)
-            hold_list = list(hold_list)
-            filtered_matrix = filtered_matrix.loc[hold_list, :]
-            return filtered_matrix, dropped_indices, node_min
-
-        # ----------------------------------------------------------------------
-
         if view == "browser":
             pio.renderers.default = "browser"
         if node_labels:
             mode = "markers+text"
         else:
             mode = "markers"
-        if len(chain) > 0:
-            chain = [str(c) for c in chain]
-        articles = self.data[["author", "title", "journal", "doi"]]
-        articles["id"] = self.table_id_doc.iloc[:, 0]
-        articles["year"] = self.data["year"].astype(int)
-        self.__adjacency_matrix_ref(0, True)
-        matrix, idx, n_m = filter_matrix_by_citations(self.matrix_r, min_links)
-        rows, cols = np.where(matrix >= 1)
-        row_map = {idx: int(row_name) for idx, row_name in enumerate(matrix.index)}
-        col_map = {idx: int(col_name) for idx, col_name in enumerate(matrix.columns)}
-        citations = [(row_map[r], col_map[c]) for (r, c) in zip(rows, cols)]
-        rev = [(tgt, src) for (src, tgt) in citations]
-        citations = citations + rev
-        citations = [tup for tup in citations if tup[0] != tup[1]]
-        articles = articles.drop(index=idx, errors="ignore")
-        articles = articles.sort_values(by="year").reset_index(drop=True)
-        articles["x_pos"] = articles["year"]
+        nodes, edges = self.hist_graph(min_links, k_core, main_path, weight, dist)
+        n = self.data.shape[0]
+        if len(chain) == 0 and len(self.hist_paths) > 0:
+            chain = self.hist_paths[0]
+            path = True
+        chain_list = [int(c) for c in chain if str(c).isdigit() and int(c) < n]
+        chain = set(str(c) for c in chain)
+        articles = self.data.loc[nodes["id"], ["author", "title", "journal", "doi"]]
+        articles = articles.reset_index(drop=True)
+        articles["id"] = nodes["id"].astype(str).values
+        articles["year"] = nodes["year"].values
+        articles["x_pos"] = nodes["x_pos"].values
+        articles["y_pos"] = nodes["y_pos"].values
+        n_m = set(articles["id"][nodes["n_m"].values])
         years = sorted(articles["year"].unique())
-        y_offsets = {}
-        for yr in years:
-            indices = articles.index[articles["year"] == yr].tolist()
-            indices = sorted(
-                indices, key=lambda x: self.natsort(str(articles.loc[x, "id"]))
-            )
-            count = len(indices)
-            offsets = [i * dist for i in range(0, count)]
-            for idx, art_idx in enumerate(indices):
-                y_offsets[art_idx] = offsets[idx]
-        articles["y_pos"] = [y_offsets[i] for i in articles.index]
         hover_texts = []
-        articles = articles.sort_values(by="x_pos")
-        for i, row in articles.iterrows():
-            txt = f"id: {row['id']}<br>"
-            meta = f"{row['author']} ({row['year']}). {row['title']}. {row['journal']}. doi:{row['doi']}"
+        for row in articles.itertuples(index=False):
+            txt = f"id: {row.id}<br>"
+            meta = f"{row.author} ({row.year}). {row.title}. {row.journal}. doi:{row.doi}"
             wrapped_meta = "<br>".join(textwrap.wrap(meta, width=50))
             txt = txt + wrapped_meta
             hover_texts.append(txt)
-        node_trace = go.Scatter(
-            x=articles["x_pos"],
-            y=articles["y_pos"],
-            mode=mode,
-            marker=dict(
-                symbol="circle-dot",
-                size=node_size,
-                color="blue",
-                line=dict(color="rgb(50, 50, 50)", width=0.15),
-            ),
-            text=articles["id"] if node_labels else None,
-            hoverinfo="text",
-            hovertext=hover_texts,
-            name="",
-        )
-        Xa, Ya = [], []
-        article_dict = articles.set_index("id").to_dict(orient="index")
-        for src, tgt in citations:
-            if str(src) in article_dict and str(tgt) in article_dict:
-                Xa.append(article_dict[str(src)]["x_pos"])
-                Ya.append(article_dict[str(src)]["y_pos"])
-                Xa.append(article_dict[str(tgt)]["x_pos"])
-                Ya.append(article_dict[str(tgt)]["y_pos"])
-                Xa.append(None)
-                Ya.append(None)
-        edge_trace = go.Scatter(
-            x=Xa,
-            y=Ya,
-            mode="lines",
-            line=dict(color="rgba(0, 0, 0, 0.15)", width=0.5, dash="dot"),
-            hoverinfo="none",
-            name="",
-        )
+        x_pos = np.zeros(n)
+        y_pos = np.zeros(n)
+        x_pos[nodes["id"].values] = nodes["x_pos"].values
+        y_pos[nodes["id"].values] = nodes["y_pos"].values
+        citations = [(int(p), int(r)) for p, r in edges]
         if len(chain) > 0:
-            chain = [str(c) for c in chain]
-            adjacency_list = {}
-            for src, tgt in citations:
-                src_str, tgt_str = str(src), str(tgt)
-                adjacency_list.setdefault(src_str, []).append(tgt_str)
+            in_chain = np.zeros(n, dtype=bool)
+            in_chain[chain_list] = True
+            src_in = in_chain[edges[:, 0]]
+            tgt_in = in_chain[edges[:, 1]]
             neighbors = set()
             if not path:
-                for c in chain:
-                    if c in adjacency_list:
-                        for neigh in adjacency_list[c]:
-                            if neigh not in chain:
-                                neighbors.add(neigh)
+                neighbors.update(str(c) for c in edges[src_in & ~tgt_in, 1])
+                neighbors.update(str(c) for c in edges[tgt_in & ~src_in, 0])
             node_colors = []
-            for i, row in articles.iterrows():
-                art_id_str = str(row["id"])
+            for art_id_str in articles["id"]:
                 if art_id_str in chain:
                     node_colors.append("green")
                 elif art_id_str in neighbors:
@@ -9233,54 +10658,34 @@ class pbx_probe:
                     node_colors.append("rgba(50, 50, 50, 0.15)")
                 else:
                     node_colors.append("rgba(0, 0, 255, 0.15)")
-            Xa_chain, Ya_chain = [], []
-            Xa_other, Ya_other = [], []
             if not path:
-                for src, tgt in citations:
-                    src_str, tgt_str = str(src), str(tgt)
-                    if src_str in article_dict and tgt_str in article_dict:
-                        x1 = article_dict[src_str]["x_pos"]
-                        y1 = article_dict[src_str]["y_pos"]
-                        x2 = article_dict[tgt_str]["x_pos"]
-                        y2 = article_dict[tgt_str]["y_pos"]
-                        if src_str in chain:
-                            Xa_chain.extend([x1, x2, None])
-                            Ya_chain.extend([y1, y2, None])
-                        else:
-                            Xa_other.extend([x1, x2, None])
-                            Ya_other.extend([y1, y2, None])
+                chain_edges = edges[src_in | tgt_in]
+                other_edges = edges[~(src_in | tgt_in)]
             else:
-                for i in range(0, len(chain) - 1):
-                    src_str, tgt_str = str(chain[i]), str(chain[i + 1])
-                    if src_str in article_dict and tgt_str in article_dict:
-                        x1 = article_dict[src_str]["x_pos"]
-                        y1 = article_dict[src_str]["y_pos"]
-                        x2 = article_dict[tgt_str]["x_pos"]
-                        y2 = article_dict[tgt_str]["y_pos"]
-                        Xa_chain.extend([x1, x2, None])
-                        Ya_chain.extend([y1, y2, None])
-                for src, tgt in citations:
-                    src_str, tgt_str = str(src), str(tgt)
-                    if src_str in article_dict and tgt_str in article_dict:
-                        x1 = article_dict[src_str]["x_pos"]
-                        y1 = article_dict[src_str]["y_pos"]
-                        x2 = article_dict[tgt_str]["x_pos"]
-                        y2 = article_dict[tgt_str]["y_pos"]
-                        if src_str not in chain:
-                            Xa_other.extend([x1, x2, None])
-                            Ya_other.extend([y1, y2, None])
-
+                chain_edges = np.array(
+                    [
+                        (chain_list[i], chain_list[i + 1])
+                        for i in range(0, len(chain_list) - 1)
+                    ],
+                    dtype=np.int64,
+                ).reshape(-1, 2)
+                held = np.zeros(n, dtype=bool)
+                held[nodes["id"].values] = True
+                chain_edges = chain_edges[
+                    held[chain_edges[:, 0]] & held[chain_edges[:, 1]]
+                ]
+                other_edges = edges[~(src_in & tgt_in)]
             edge_trace_other = go.Scatter(
-                x=Xa_other,
-                y=Ya_other,
+                x=self.__segments(x_pos, other_edges),
+                y=self.__segments(y_pos, other_edges),
                 mode="lines",
                 line=dict(color="rgba(0, 0, 0, 0.15)", width=0.5, dash="dot"),
                 hoverinfo="none",
                 name="",
             )
             edge_trace_chain = go.Scatter(
-                x=Xa_chain,
-                y=Ya_chain,
+                x=self.__segments(x_pos, chain_edges),
+                y=self.__segments(y_pos, chain_edges),
                 mode="lines",
                 line=dict(color="black", width=1, dash="solid"),
                 hoverinfo="none",
@@ -9303,17 +10708,18 @@ class pbx_probe:
             )
             data = [edge_trace_other, edge_trace_chain, node_trace]
         else:
-            node_colors = []
-            for i, row in articles.iterrows():
-                art_id_str = str(row["id"])
-                if art_id_str in n_m:
-                    if min_links > 0:
-                        node_colors.append("rgb(50, 50, 50)")
-                    else:
-                        node_colors.append("blue")
-                else:
-                    node_colors.append("blue")
-            Xa_chain, Ya_chain = [], []
+            edge_trace = go.Scatter(
+                x=self.__segments(x_pos, edges),
+                y=self.__segments(y_pos, edges),
+                mode="lines",
+                line=dict(color="rgba(0, 0, 0, 0.15)", width=0.5, dash="dot"),
+                hoverinfo="none",
+                name="",
+            )
+            node_colors = [
+                "rgb(50, 50, 50)" if art_id_str in n_m and min_links > 0 else "blue"
+                for art_id_str in articles["id"]
+            ]
             node_trace = go.Scatter(
                 x=articles["x_pos"],
                 y=articles["y_pos"],
@@ -9351,78 +10757,57 @@ class pbx_probe:
         )
         fig.update_traces(textfont_size=font_size, textfont_color="yellow")
         fig.show()
+        year_of = dict(zip(nodes["id"].tolist(), nodes["year"].tolist()))
         self.ask_gpt_hist = pd.DataFrame(
-            citations, columns=["Paper ID", "Reference ID"]
-        )
-        self.ask_gpt_hist["Paper ID"] = self.ask_gpt_hist["Paper ID"].astype(str)
-        self.ask_gpt_hist = self.ask_gpt_hist.merge(
-            articles[["id", "year"]], left_on="Paper ID", right_on="id", how="left"
-        )
-        self.ask_gpt_hist.rename(columns={"year": "Paper_Year"}, inplace=True)
-        self.ask_gpt_hist.drop("id", axis=1, inplace=True)
-        self.ask_gpt_hist["Reference ID"] = self.ask_gpt_hist["Reference ID"].astype(
-            str
-        )
-        self.ask_gpt_hist = self.ask_gpt_hist.merge(
-            articles[["id", "year"]], left_on="Reference ID", right_on="id", how="left"
+            [
+                [f"{p} ({year_of[p]})", f"{r} ({year_of[r]})"]
+                for p, r in citations
+            ],
+            columns=["Paper ID (Year)", "Reference ID (Year)"],
         )
-        self.ask_gpt_hist.rename(columns={"year": "Reference_Year"}, inplace=True)
-        self.ask_gpt_hist = self.ask_gpt_hist[
-            self.ask_gpt_hist["Reference_Year"] <= self.ask_gpt_hist["Paper_Year"]
-        ]
-        condition = (
-            self.ask_gpt_hist["Reference_Year"] == self.ask_gpt_hist["Paper_Year"]
-        )
-        indexes_to_drop = []
-        for idx, row in self.ask_gpt_hist.loc[condition].iterrows():
-            paper_id = int(row["Paper ID"])
-            ref_id = str(row["Reference ID"])
-            if ref_id not in matrix.columns:
-                indexes_to_drop.append(idx)
-            else:
-                if matrix.loc[paper_id, ref_id] == 0:
-                    indexes_to_drop.append(idx)
-        self.ask_gpt_hist.drop(index=indexes_to_drop, inplace=True)
-        self.ask_gpt_hist["Paper ID (Year)"] = self.ask_gpt_hist.apply(
-            lambda row: f"{row['Paper ID']} ({row['Paper_Year']})", axis=1
-        )
-        self.ask_gpt_hist["Reference ID (Year)"] = self.ask_gpt_hist.apply(
-            lambda row: f"{row['Reference ID']} ({row['Reference_Year']})", axis=1
-        )
-        citations = [
-            (int(r), int(c))
-            for (r, c) in zip(
-                self.ask_gpt_hist["Paper ID"], self.ask_gpt_hist["Reference ID"]
-            )
-        ]
-        self.ask_gpt_hist = self.ask_gpt_hist[
-            ["Paper ID (Year)", "Reference ID (Year)"]
-        ]
         return citations
 
-    # Function: Analyze Citations
-    def analyze_hist_citations(self, citations, min_path_size=2):
-        G = nx.DiGraph(citations)
-        most_referenced_paper = max(G.in_degree, key=lambda x: x[1], default=(None, 0))
-        most_citing_paper = max(G.out_degree, key=lambda x: x[1], default=(None, 0))
-        recent_to_old_paths = []
-        sources = sorted({src for src, tgt in citations}, reverse=True)
-        targets = sorted({tgt for src, tgt in citations})
-        for source in sources:
-            for target in targets:
-                if nx.has_path(G, source, target):
-                    path = nx.shortest_path(G, source=source, target=target)
-                    if len(path) >= min_path_size:
-                        recent_to_old_paths.append(path)
-        recent_to_old_paths = sorted(recent_to_old_paths, key=len, reverse=True)
-        filtered_paths = []
-        for path in recent_to_old_paths:
-            if not any(
-                set(path).issubset(set(existing_path))
-                for existing_path in filtered_paths
-            ):
-                filtered_paths.append(path)
-        recent_to_old_paths = filtered_paths
+    # Function: Line Segments (x0, x1, None, ...) for Plotly Edge Traces
+    def __segments(self, coords, edges):
+        segments = np.full((edges.shape[0], 3), None, dtype=object)
+        segments[:, 0] = coords[edges[:, 0]]
+        segments[:, 1] = coords[edges[:, 1]]
+        return segments.ravel().tolist()
+
+    # Function: Analyze Citations (Main Path Analysis). Weight: "spc", "splc", or "length"
+    def analyze_hist_citations(self, citations, min_path_size=2, weight="spc", topn=-1):
+        if len(citations) == 0:
+            return []
+        nodes, edges = np.unique(
+            np.asarray(citations, dtype=np.int64).reshape(-1, 2), return_inverse=True
+        )
+        edges = edges.reshape(-1, 2)
+        n = nodes.shape[0]
+        u_edges = np.unique(edges, axis=0)
+        in_deg = np.bincount(u_edges[:, 1], minlength=n)
+        out_deg = np.bincount(u_edges[:, 0], minlength=n)
+        most_referenced_paper = (int(nodes[np.argmax(in_deg)]), int(in_deg.max()))
+        most_citing_paper = (int(nodes[np.argmax(out_deg)]), int(out_deg.max()))
+        adjacency, order = citation_dag(edges[:, 0], edges[:, 1], n)
+        indptr, indices = adjacency.indptr, adjacency.indices
+        spc, splc = search_path_counts(indptr, indices, order)
+        ones = np.ones(indices.shape[0], dtype=np.float64)
+        rows = np.repeat(np.arange(0, n), np.diff(indptr))
+        self.table_spc = pd.DataFrame(
+            {
+                "Paper ID": nodes[rows],
+                "Reference ID": nodes[indices],
+                "SPC": spc,
+                "SPLC": splc,
+            }
+        )
+        self.table_spc = self.table_spc.sort_values("SPC", ascending=False)
+        self.table_spc = self.table_spc.reset_index(drop=True)
+        w = {"spc": spc, "splc": splc, "length": ones}[weight]
+        chain, nxt_chain = dag_best_paths(indptr, indices, ones, order)
+        longest_path = [int(nodes[i]) for i in follow_path(nxt_chain, np.argmax(chain))]
+        paths = ranked_main_paths(adjacency, order, w, min_path_size, topn)
+        recent_to_old_paths = [[int(nodes[i]) for i in path] for path in paths]
         print(
             "Most Referenced Paper ID:",
             most_referenced_paper[0],
@@ -9437,52 +10822,287 @@ class pbx_probe:
             most_citing_paper[1],
             "Papers",
         )
+        if len(longest_path) >= min_path_size:
+            print("Paper IDs of Longest Citation Path:", longest_path)
         if len(recent_to_old_paths) > 0:
-            print("Paper IDs of Longest Citation Path:", recent_to_old_paths[0])
+            print(
+                "Paper IDs of Main Path (" + weight.upper() + "):",
+                recent_to_old_paths[0],
+            )
         return recent_to_old_paths
 
     ############################################################################
 
-    # Function: Sentence Embeddings # 'abs', 'title', 'kwa', 'kwp'
+    # Function: Load Models into the Process-Wide Registry. Models: [(kind, name)]; kind = "sentence", "pegasus", "bert_sum"
+    def models_warmup(
+        self, models=[("sentence", "allenai/scibert_scivocab_uncased")], budget_mb=-1
+    ):
+        if budget_mb > 0:
+            model_cache.budget_mb = budget_mb
+            model_cache.evict()
+        for kind, name in models:
+            model_cache.get(kind, name)
+        return
+
+    # Function: Release Models from the Process-Wide Registry (All Models if kind and name are None)
+    def models_release(self, kind=None, name=None):
+        model_cache.release(kind, name)
+        return
+
+    # Function: Shrink an Embedding or FastText cache_dir to max_mb, Least Recently Written First (max_mb <= 0: Delete Everything). Returns the MB Removed
+    def cache_clear(self, cache_dir, max_mb=0):
+        path = os.path.expanduser(cache_dir)
+        if not cache_dir or not os.path.isdir(path):
+            return 0
+        return cache_evict(path, max_mb)
+
+    # Function: Encode Texts through the Embedding Store (only Texts not yet Stored are Encoded). Quantize: "", "int8" or "onnx"
+    def __embed(
+        self,
+        corpus,
+        model,
+        cache_dir="",
+        batch_size=32,
+        n_jobs=1,
+        quantize="",
+        verbose=False,
+        live=False,
+        clean=None,
+    ):
+        corpus = [str(text) for text in corpus]
+        kind = "sentence_" + quantize if quantize else "sentence"
+        variant = model + "#" + quantize if quantize else model
+        keys = [hashlib.sha1(text.encode("utf-8")).hexdigest() for text in corpus]
+        if live:
+            self.embds_keys = keys
+            self.embds_model = (model, quantize, cache_dir, clean)
+        store = None
+        if cache_dir:
+            path = os.path.expanduser(cache_dir)
+            if (path, variant) not in embedding_stores:
+                embedding_stores[(path, variant)] = embedding_store(path, variant)
+            store = embedding_stores[(path, variant)]
+            vectors, missing = store.lookup(keys)
+        else:
+            vectors, missing = np.zeros((len(corpus), 0)), np.arange(0, len(corpus))
+        texts = {}
+        for i in missing:
+            texts.setdefault(keys[i], []).append(i)
+        if len(texts) == 0:
+            return vectors
+        encoder = model_cache.get(kind, model)
+        if vectors.shape[1] == 0:
+            dim = encoder.get_sentence_embedding_dimension()
+            vectors = np.zeros((len(corpus), dim), dtype=np.float32)
+        if live:
+            self.embds = vectors
+        order = sorted(texts.keys(), key=lambda k: -len(corpus[texts[k][0]]))
+        pool = None
+        if n_jobs > 1:
+            pool = encoder.start_multi_process_pool(target_devices=["cpu"] * n_jobs)
+        block = max(batch_size * 64, 1)
+        start = time.time()
+        try:
+            for a in range(0, len(order), block):
+                part = order[a : a + block]
+                docs = [corpus[texts[key][0]] for key in part]
+                if pool is not None:
+                    new = encoder.encode_multi_process(docs, pool, batch_size=batch_size)
+                else:
+                    new = encoder.encode(docs, batch_size=batch_size)
+                new = np.asarray(new, dtype=np.float32)
+                if store is not None:
+                    store.add(part, new)
+                for key, vector in zip(part, new):
+                    vectors[texts[key]] = vector
+                if verbose:
+                    done = a + len(part)
+                    rate = done / max(time.time() - start, 1e-9)
+                    print(
+                        "Embeddings: "
+                        + str(done)
+                        + " of "
+                        + str(len(order))
+                        + " ("
+                        + str(round(rate, 1))
+                        + " docs/s)"
+                    )
+        finally:
+            if pool is not None:
+                encoder.stop_multi_process_pool(pool)
+        return vectors
+
+    # Function: ANN Index over self.embds (IVF; New Documents are Inserted Incrementally; Persisted next to the Embedding Store)
+    def ann_index(self, n_lists=0, rebuild=False):
+        if isinstance(self.embds_model, int):
+            raise ValueError("No Document Embeddings: Run create_embeddings First")
+        model, quantize, cache_dir, _ = self.embds_model
+        variant = model + "#" + quantize if quantize else model
+        path = ""
+        if cache_dir:
+            path = os.path.join(
+                os.path.expanduser(cache_dir),
+                "ann",
+                hashlib.sha1(variant.encode("utf-8")).hexdigest() + ".npz",
+            )
+        if not isinstance(self.ann, int) and not rebuild:
+            if self.ann[0] is self.embds:
+                return self.ann
+        index = -1
+        if not isinstance(self.ann, int) and self.ann[1] == path:
+            index = self.ann[2]
+        elif path and os.path.exists(path) and not rebuild:
+            index = ivf_index.load(path)
+        if isinstance(index, int) or rebuild:
+            index = ivf_index()
+            index.fit(self.embds, self.embds_keys, n_lists)
+            added = 1
+        else:
+            added = index.insert(self.embds, self.embds_keys)
+        if path and added > 0:
+            index.save(path)
+        lists = np.array(
+            [index.lists[key] for key in self.embds_keys], dtype=np.int64
+        )
+        order = np.argsort(lists, kind="stable")
+        offsets = np.searchsorted(
+            lists[order], np.arange(0, index.centroids.shape[0] + 1)
+        )
+        vectors = normalize_rows(self.embds)
+        self.ann = (self.embds, path, index, order, offsets, vectors)
+        return self.ann
+
+    # Function: ANN Search (Cosine Similarity; n_probe Lists are Scanned)
+    def __ann_search(self, query, k=10, n_probe=8, exclude=-1):
+        _, _, index, order, offsets, vectors = self.ann_index()
+        query = normalize_rows(np.asarray(query).reshape(1, -1))[0]
+        n_probe = max(1, min(n_probe, index.centroids.shape[0]))
+        probe = np.argsort(-(index.centroids @ query))[:n_probe]
+        cand = np.concatenate([order[offsets[c] : offsets[c + 1]] for c in probe])
+        cand = cand[cand != exclude]
+        sims = vectors[cand] @ query
+        top = np.argsort(-sims, kind="stable")[:k]
+        results = pd.DataFrame(
+            {
+                "ID": [str(i) for i in cand[top]],
+                "Similarity": sims[top],
+                "Document": [self.table_id_doc["Document"][i] for i in cand[top]],
+            }
+        )
+        return results
+
+    # Function: Similar Documents to a Document (Requires create_embeddings)
+    def similar_documents(self, doc_id, k=10, n_probe=8):
+        _, _, _, _, _, vectors = self.ann_index()
+        doc_id = int(doc_id)
+        return self.__ann_search(vectors[doc_id], k, n_probe, exclude=doc_id)
+
+    # Function: Near-Duplicate Abstracts (Pairs with Cosine Similarity >= cut_sim). Approximate: each Document is Compared with the Members of its n_probe Nearest IVF Lists (n_probe >= Number of Lists: Exact)
+    def duplicate_abstracts(self, cut_sim=0.95, n_probe=8, block_size=4096):
+        _, _, index, order, offsets, vectors = self.ann_index()
+        n = vectors.shape[0]
+        n_lists = index.centroids.shape[0]
+        n_probe = max(1, min(n_probe, n_lists))
+        probes = []
+        for a in range(0, n, block_size):
+            sims = vectors[a : a + block_size] @ index.centroids.T
+            if n_probe < n_lists:
+                sims = np.argpartition(-sims, n_probe - 1, axis=1)[:, :n_probe]
+            else:
+                sims = np.tile(np.arange(0, n_lists), (sims.shape[0], 1))
+            probes.append(sims)
+        probes = np.concatenate(probes).ravel()
+        queries = np.repeat(np.arange(0, n, dtype=np.int64), n_probe)
+        rank = np.argsort(probes, kind="stable")
+        q_order = queries[rank]
+        q_offsets = np.searchsorted(probes[rank], np.arange(0, n_lists + 1))
+        keys = [np.zeros(0, dtype=np.int64)]
+        sims = [np.zeros(0, dtype=np.float32)]
+        for c in range(0, n_lists):
+            members = order[offsets[c] : offsets[c + 1]]
+            probing = q_order[q_offsets[c] : q_offsets[c + 1]]
+            if members.shape[0] == 0:
+                continue
+            for a in range(0, probing.shape[0], block_size):
+                rows = probing[a : a + block_size]
+                block = vectors[rows] @ vectors[members].T
+                i, j = np.nonzero(block >= cut_sim)
+                i, j, sim = rows[i], members[j], block[i, j]
+                m = i < j
+                keys.append(i[m] * n + j[m])
+                sims.append(sim[m])
+        keys, first = np.unique(np.concatenate(keys), return_index=True)
+        sims = np.concatenate(sims)[first]
+        left, right = keys // n, keys % n
+        rank = np.lexsort((right, left, -sims))
+        results = pd.DataFrame(
+            {
+                "ID 1": [str(i) for i in left[rank]],
+                "ID 2": [str(j) for j in right[rank]],
+                "Similarity": sims[rank],
+            }
+        )
+        return results
+
+    # Function: Similar Documents to a Text Query (Requires create_embeddings)
+    def similar_to_text(self, query, k=10, n_probe=8):
+        if isinstance(self.embds_model, int):
+            raise ValueError("No Document Embeddings: Run create_embeddings First")
+        model, quantize, _, clean = self.embds_model
+        if clean is not None:
+            query = self.clear_text([query], **clean)[0]
+        kind = "sentence_" + quantize if quantize else "sentence"
+        vector = model_cache.get(kind, model).encode([query])
+        return self.__ann_search(vector, k, n_probe)
+
+    # Function: Sentence Embeddings # 'abs', 'title', 'kwa', 'kwp' (Cleaning Options are Kept with embds_model for Text Queries)
     def create_embeddings(
         self,
         stop_words=["en"],
         rmv_custom_words=[],
         corpus_type="abs",
         model="allenai/scibert_scivocab_uncased",
+        cache_dir="",
+        batch_size=32,
+        n_jobs=1,
+        quantize="",
+        verbose=False,
     ):
-        model = SentenceTransformer(model)
+        clean = {
+            "stop_words": stop_words,
+            "lowercase": True,
+            "rmv_accents": True,
+            "rmv_special_chars": True,
+            "rmv_numbers": True,
+            "rmv_custom_words": rmv_custom_words,
+        }
         if corpus_type == "abs":
             corpus = self.data["abstract"]
             corpus = corpus.tolist()
-            corpus = self.clear_text(
-                corpus,
-                stop_words=stop_words,
-                lowercase=True,
-                rmv_accents=True,
-                rmv_special_chars=True,
-                rmv_numbers=True,
-                rmv_custom_words=rmv_custom_words,
-            )
+            corpus = self.clear_text(corpus, **clean)
         elif corpus_type == "title":
             corpus = self.data["title"]
             corpus = corpus.tolist()
-            corpus = self.clear_text(
-                corpus,
-                stop_words=stop_words,
-                lowercase=True,
-                rmv_accents=True,
-                rmv_special_chars=True,
-                rmv_numbers=True,
-                rmv_custom_words=rmv_custom_words,
-            )
+            corpus = self.clear_text(corpus, **clean)
         elif corpus_type == "kwa":
             corpus = self.data["author_keywords"]
             corpus = corpus.tolist()
+            clean = None
         elif corpus_type == "kwp":
             corpus = self.data["keywords"]
             corpus = corpus.tolist()
-        self.embds = model.encode(corpus)
+            clean = None
+        self.embds = self.__embed(
+            corpus,
+            model,
+            cache_dir,
+            batch_size=batch_size,
+            n_jobs=n_jobs,
+            quantize=quantize,
+            verbose=verbose,
+            live=True,
+            clean=clean,
+        )
         return
 
     ############################################################################
@@ -9494,26 +11114,133 @@ class pbx_probe:
         rmv_custom_words=[],
         embeddings=False,
         model="allenai/scibert_scivocab_uncased",
+        cache_dir="",
+        online=False,
+        n_topics=10,
+        batch_size=1000,
     ):
-        umap_model = UMAP(
-            n_neighbors=15,
-            n_components=5,
-            min_dist=0.0,
-            metric="cosine",
-            random_state=1001,
-        )
-        if not embeddings:
+        self.topic_opts = {
+            "stop_words": stop_words,
+            "rmv_custom_words": rmv_custom_words,
+            "embeddings": embeddings,
+            "model": model,
+            "cache_dir": cache_dir,
+            "online": online,
+            "n_topics": n_topics,
+            "batch_size": batch_size,
+        }
+        sentence_model = None
+        if embeddings:
+            sentence_model = model_cache.get("sentence", model)
+        if online:
             self.topic_model = BERTopic(
-                umap_model=umap_model, calculate_probabilities=True
+                umap_model=IncrementalPCA(n_components=5),
+                hdbscan_model=MiniBatchKMeans(
+                    n_clusters=n_topics, n_init=3, random_state=1001
+                ),
+                vectorizer_model=OnlineCountVectorizer(decay=0.01),
+                embedding_model=sentence_model,
             )
         else:
-            sentence_model = SentenceTransformer(model)
+            if isinstance(self.topic_umap, int):
+                self.topic_umap = cached_umap(
+                    n_neighbors=15,
+                    n_components=5,
+                    min_dist=0.0,
+                    metric="cosine",
+                    random_state=1001,
+                )
             self.topic_model = BERTopic(
-                umap_model=umap_model,
+                umap_model=self.topic_umap,
                 calculate_probabilities=True,
                 embedding_model=sentence_model,
             )
-        self.topic_corpus = self.clear_text(
+        self.topic_corpus, self.topic_keys = self.__topic_text(
+            stop_words, rmv_custom_words
+        )
+        embds = None
+        if embeddings:
+            embds = self.__topic_embeddings(
+                self.topic_corpus, self.topic_keys, model, cache_dir
+            )
+        if online:
+            self.topics = self.__topics_partial_fit(
+                self.topic_corpus, embds, batch_size
+            )
+            self.probs = None
+        else:
+            self.topics, self.probs = self.topic_model.fit_transform(
+                self.topic_corpus, embeddings=embds
+            )
+        self.topic_dist = -1
+        self.topic_info = self.topic_model.get_topic_info()
+        print(self.topic_info)
+        return
+
+    # Function: Topics - Update after merge_database (New Documents: partial_fit if Online, else transform; Topic Sizes Follow Added and Removed Documents; refit or Too Many New Documents: Full Refit)
+    def topics_update(self, refit=False, refit_ratio=0.50):
+        if len(self.topic_opts) == 0:
+            raise ValueError(
+                "No Topic Model Options: Run topics_creation First (or Load a topics_save_file Model)"
+            )
+        opts = self.topic_opts
+        corpus, keys = self.__topic_text(opts["stop_words"], opts["rmv_custom_words"])
+        old = {key: i for i, key in enumerate(self.topic_keys)}
+        new = [i for i, key in enumerate(keys) if key not in old]
+        if refit or len(new) > refit_ratio * len(self.topic_keys):
+            self.topics_creation(**opts)
+            return
+        unmatched = defaultdict(list)
+        for i in range(len(self.topic_keys) - 1, -1, -1):
+            unmatched[self.topic_keys[i]].append(i)
+        matched = [unmatched[key].pop() if unmatched.get(key) else -1 for key in keys]
+        removed = [self.topics[i] for idx in unmatched.values() for i in idx]
+        topics = [self.topics[old[key]] if key in old else -1 for key in keys]
+        new_probs = None
+        if len(new) > 0:
+            docs = [corpus[i] for i in new]
+            embds = None
+            if opts["embeddings"]:
+                embds = self.__topic_embeddings(
+                    docs, [keys[i] for i in new], opts["model"], opts["cache_dir"]
+                )
+            if opts["online"]:
+                new_topics = self.__topics_partial_fit(
+                    docs, embds, opts["batch_size"]
+                )
+            else:
+                new_topics, new_probs = self.topic_model.transform(
+                    docs, embeddings=embds
+                )
+            for i, topic in zip(new, new_topics):
+                topics[i] = int(topic)
+        added = [
+            topics[j]
+            for j in range(0, len(keys))
+            if matched[j] < 0 and not (opts["online"] and keys[j] not in old)
+        ]
+        probs = None
+        if self.probs is not None:
+            probs = np.zeros((len(keys),) + self.probs.shape[1:])
+            for i, key in enumerate(keys):
+                if key in old:
+                    probs[i] = self.probs[old[key]]
+            if len(new) > 0 and new_probs is not None:
+                probs[new] = new_probs
+        print("Topics Updated: " + str(len(new)) + " New Documents")
+        self.topics = topics
+        self.probs = probs
+        self.topic_corpus = corpus
+        self.topic_keys = keys
+        self.__topics_resize(added, removed)
+        self.topic_dist = -1
+        self.topic_info = self.topic_model.get_topic_info()
+        print(self.topic_info)
+        return
+
+    # Function: Topics - Cleaned Abstracts and their Text Keys
+    def __topic_text(self, stop_words=["en"], rmv_custom_words=[]):
+        corpus = self.clear_text(
             self.data["abstract"],
             stop_words=stop_words,
             lowercase=True,
@@ -9523,44 +11250,105 @@ class pbx_probe:
             rmv_custom_words=rmv_custom_words,
             verbose=False,
         )
-        self.topics, self.probs = self.topic_model.fit_transform(self.topic_corpus)
-        self.topic_info = self.topic_model.get_topic_info()
-        print(self.topic_info)
+        keys = [hashlib.sha1(str(text).encode("utf-8")).hexdigest() for text in corpus]
+        return corpus, keys
+
+    # Function: Topics - Document Embeddings (self.embds if it Matches the Corpus, else the Embedding Store)
+    def __topic_embeddings(self, corpus, keys, model, cache_dir):
+        if isinstance(self.embds_model, int):
+            return self.__embed(corpus, model, cache_dir)
+        if self.embds_keys == keys and self.embds_model[0] == model:
+            return self.embds
+        return self.__embed(corpus, model, cache_dir)
+
+    # Function: Topics - Online Fit in Batches (IncrementalPCA, MiniBatchKMeans, Decayed c-TF-IDF)
+    def __topics_partial_fit(self, corpus, embds, batch_size=1000):
+        topics = []
+        n_batches = max(1, len(corpus) // batch_size)
+        for idx in np.array_split(np.arange(0, len(corpus)), n_batches):
+            docs = [corpus[i] for i in idx]
+            if embds is None:
+                self.topic_model.partial_fit(docs)
+            else:
+                self.topic_model.partial_fit(docs, embeddings=embds[idx])
+            topics.extend(int(topic) for topic in self.topic_model.topics_)
+        return topics
+
+    # Function: Topics - Topic Sizes after an Update (Added and Removed Documents only; Representations are Refreshed by a Refit)
+    def __topics_resize(self, added, removed):
+        if len(added) == 0 and len(removed) == 0:
+            return
+        sizes = dict(self.topic_model.topic_sizes_)
+        for topic, count in Counter(added).items():
+            sizes[topic] = sizes.get(topic, 0) + count
+        for topic, count in Counter(removed).items():
+            sizes[topic] = max(0, sizes.get(topic, 0) - count)
+        self.topic_model.topic_sizes_ = sizes
         return
 
-    # Function: Topics - Load
+    # Function: Topics - Save (BERTopic Model; Fit Options, Corpus, Text Keys and Assignments in saved_file.pbx.json; Probabilities in saved_file.pbx.npy)
+    def topics_save_file(self, saved_file="my_topic_model"):
+        self.topic_model.save(saved_file)
+        state = {
+            "opts": self.topic_opts,
+            "topics": [int(topic) for topic in self.topics],
+            "keys": self.topic_keys,
+            "corpus": list(self.topic_corpus),
+        }
+        with open(saved_file + ".pbx.json", "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        if self.probs is not None:
+            np.save(saved_file + ".pbx.npy", self.probs)
+        return
+
+    # Function: Topics - Load (Models Saved without topics_save_file cannot be Updated with topics_update)
     def topics_load_file(self, saved_file="my_topic_model"):
         self.topic_model = BERTopic.load(saved_file)
-        self.topic_corpus = self.clear_text(
-            self.data["abstract"],
-            stop_words=[],
-            lowercase=True,
-            rmv_accents=True,
-            rmv_special_chars=True,
-            rmv_numbers=True,
-            rmv_custom_words=[],
-            verbose=False,
-        )
-        self.topics = self.topic_model.topics_
-        self.probs = self.topic_model.probabilities_
+        self.topic_dist = -1
+        if os.path.exists(saved_file + ".pbx.json"):
+            with open(saved_file + ".pbx.json", "r", encoding="utf-8") as file:
+                state = json.load(file)
+            self.topic_opts = state["opts"]
+            self.topics = state["topics"]
+            self.topic_keys = state["keys"]
+            self.topic_corpus = state["corpus"]
+            self.probs = None
+            if os.path.exists(saved_file + ".pbx.npy"):
+                self.probs = np.load(saved_file + ".pbx.npy")
+        else:
+            self.topic_corpus, self.topic_keys = self.__topic_text([], [])
+            self.topic_opts = {}
+            self.topics = self.topic_model.topics_
+            self.probs = self.topic_model.probabilities_
         self.topic_info = self.topic_model.get_topic_info()
         print(self.topic_info)
         return
 
+    # Function: Topics - Text Key -> Document Indices of the Topic Corpus
+    def __topic_doc_index(self):
+        if isinstance(self.topic_idx, int) or self.topic_idx[0] is not self.topic_keys:
+            index = defaultdict(list)
+            for i, key in enumerate(self.topic_keys):
+                index[key].append(i)
+            self.topic_idx = (self.topic_keys, dict(index))
+        return self.topic_idx[1]
+
     # Function: Topics - Main Representatives
     def topics_representatives(self):
-        docs = [[] for _ in range(0, self.topic_info.shape[0])]
+        doc_index = self.__topic_doc_index()
         papers = self.topic_model.get_representative_docs()
-        self.df_rep = pd.DataFrame(
-            np.zeros((self.topic_info.shape[0], 2)), columns=["Topic", "Docs"]
-        )
-        for i in range(0, self.topic_info.shape[0]):
-            if self.topic_info.iloc[i, 0] != -1:
-                paper = papers[self.topic_info.iloc[i, 0]]
-                for item in paper:
-                    docs[i].append(self.topic_corpus.index(item))
-            self.df_rep.iloc[i, 0] = self.topic_info.iloc[i, 0]
-            self.df_rep.iloc[i, 1] = "; ".join(map(str, docs[i]))
+        topics = self.topic_info.iloc[:, 0].tolist()
+        docs = []
+        for topic in topics:
+            found = []
+            if topic != -1:
+                for item in papers[topic]:
+                    key = hashlib.sha1(str(item).encode("utf-8")).hexdigest()
+                    idx = [i for i in doc_index.get(key, []) if i not in found]
+                    same = [i for i in idx if self.topics[i] == topic]
+                    found.extend((same or idx)[:1])
+            docs.append("; ".join(map(str, found)))
+        self.df_rep = pd.DataFrame({"Topic": topics, "Docs": docs})
         return self.df_rep
 
     # Function: Topics - Reduce
@@ -9568,6 +11356,7 @@ class pbx_probe:
         self.topics, self.probs = self.topic_model.reduce_topics(
             docs=self.topic_corpus, nr_topics=topicsn - 1
         )
+        self.topic_dist = -1
         self.topic_info = self.topic_model.get_topic_info()
         print(self.topic_info)
         return
@@ -9832,56 +11621,63 @@ class pbx_probe:
         fig.show()
         return
 
-    # Function: Topics - Doc Words Distribution
+    # Function: Topics - Doc Words Distribution (Memoized per Topic Model; doc_id: int or list)
     def topics_words(self, doc_id=0):
+        if isinstance(self.topic_dist, int):
+            self.topic_dist = (self.topic_model, {})
+        elif self.topic_dist[0] is not self.topic_model:
+            self.topic_dist = (self.topic_model, {})
+        memo = self.topic_dist[1]
+        doc_ids = [doc_id] if isinstance(doc_id, (int, np.integer)) else list(doc_id)
         abstracts = self.data["abstract"]
-        topic, token = self.topic_model.approximate_distribution(
-            abstracts, calculate_tokens=True
-        )
-        df = self.topic_model.visualize_approximate_distribution(
-            abstracts[doc_id], token[doc_id]
-        )
-        df = df.data.T
-        df.columns = [
-            f"Topic {col.split('_')[0]}" if col.split("_")[0].isdigit() else col
-            for col in df.columns
-        ]
-        return df
+        new = [i for i in dict.fromkeys(doc_ids) if i not in memo]
+        if len(new) > 0:
+            topic, token = self.topic_model.approximate_distribution(
+                [abstracts[i] for i in new], calculate_tokens=True
+            )
+            for j, i in enumerate(new):
+                df = self.topic_model.visualize_approximate_distribution(
+                    abstracts[i], token[j]
+                )
+                df = df.data.T
+                df.columns = [
+                    f"Topic {col.split('_')[0]}" if col.split("_")[0].isdigit() else col
+                    for col in df.columns
+                ]
+                memo[i] = df
+        if isinstance(doc_id, (int, np.integer)):
+            return memo[doc_id]
+        return [memo[i] for i in doc_ids]
 
-    # Function: Topics - Topics Collab
+    # Function: Topics - Topics Collab (Author x Document Incidence @ Document x Topic; topn = -1: All Authors)
     def topics_authors(self, topn=15):
-        self.__adjacency_matrix_aut(0)
-        collab_data = self.matrix_a.copy(deep=True)
-        collab_data = collab_data.reset_index(drop=True)
-        targets = [item for item in self.u_aut]
-        sizes = self.doc_aut
-        idx = sorted(range(len(sizes)), key=sizes.__getitem__)
-        idx.reverse()
-        targets = [targets[i] for i in idx]
-        targets = targets[:topn]
-        doc_id = self.table_id_doc.copy(deep=True)
-        doc_id["Document"] = doc_id["Document"].str.lower()
-        doc_id["Topics"] = self.topics
-        doc_id["Author"] = doc_id["Document"].apply(
-            lambda x: [author for author in targets if author in x]
-        )
-        doc_id = doc_id[doc_id["Author"].apply(len) > 0]
-        unique_topics = sorted(set(topic for topic in self.topics))
-        summary = pd.DataFrame(index=targets, columns=unique_topics + ["Total"]).fillna(
-            0
-        )
-        for author in targets:
-            author_docs = doc_id[doc_id["Document"].str.contains(author)]
-            for topic in self.topics:
-                topic_count = author_docs[author_docs["Topics"] == topic].shape[0]
-                summary.at[author, topic] = topic_count
-        summary["Total"] = summary.sum(axis=1)
-        summary = summary.sort_values(by="Total", ascending=False)
+        aut_index = self.__entity_index("aut")
+        topics = np.asarray(self.topics)
+        unique_topics, labels = np.unique(topics, return_inverse=True)
+        n = topics.shape[0]
+        docs = [aut_index.get(author, []) for author in self.u_aut]
+        sizes = np.array([len(item) for item in docs], dtype=np.int64)
+        rows = np.repeat(np.arange(0, len(docs)), sizes)
+        cols = np.array([i for item in docs for i in item], dtype=np.int64)
+        incidence = csr_matrix(
+            (np.ones(rows.shape[0], dtype=np.int32), (rows, cols)),
+            shape=(len(docs), n),
+        )
+        doc_topic = csr_matrix(
+            (np.ones(n, dtype=np.int32), (np.arange(0, n), labels)),
+            shape=(n, unique_topics.shape[0]),
+        )
+        counts = (incidence @ doc_topic).toarray()
+        summary = pd.DataFrame(counts, index=self.u_aut, columns=unique_topics.tolist())
+        summary["Total"] = counts.sum(axis=1)
+        summary = summary.sort_values(by="Total", ascending=False, kind="stable")
+        if topn > 0:
+            summary = summary.iloc[:topn, :]
         return summary
 
     ############################################################################
 
-    # Function: W2V
+    # Function: W2V (Corpus Streamed from a Line File; with a cache_dir the Model is Persisted by Corpus Hash and Hyperparameters, otherwise the Line File is Temporary)
     def word_embeddings(
         self,
         stop_words=["en"],
@@ -9894,6 +11690,9 @@ class pbx_probe:
         window=5,
         min_count=1,
         epochs=10,
+        workers=3,
+        cache_dir="",
+        chunk_size=10000,
     ):
         # ----------------------------------------------------------------------
 
@@ -9902,39 +11701,79 @@ class pbx_probe:
 
         # ----------------------------------------------------------------------
 
-        corpus = self.data["abstract"].tolist()
-        corpus = self.clear_text(
-            corpus,
-            stop_words=stop_words,
-            lowercase=lowercase,
-            rmv_accents=rmv_accents,
-            rmv_special_chars=rmv_special_chars,
-            rmv_numbers=rmv_numbers,
-            rmv_custom_words=rmv_custom_words,
-            verbose=False,
-        )
-        corpus = [tokenize(doc) for doc in corpus]
-        model = FastText(
-            sentences=corpus,
-            vector_size=vector_size,
-            window=window,
-            min_count=min_count,
-            epochs=epochs,
-        )
-
+        if cache_dir:
+            path = os.path.expanduser(cache_dir)
+            os.makedirs(path, exist_ok=True)
+        else:
+            path = tempfile.mkdtemp(prefix="pybibx_")
+        abstracts = self.data["abstract"]
+        digest = hashlib.sha1()
+        tmp_file = os.path.join(path, "corpus_" + str(os.getpid()) + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            for a in range(0, abstracts.shape[0], chunk_size):
+                corpus = self.clear_text(
+                    abstracts.iloc[a : a + chunk_size].tolist(),
+                    stop_words=stop_words,
+                    lowercase=lowercase,
+                    rmv_accents=rmv_accents,
+                    rmv_special_chars=rmv_special_chars,
+                    rmv_numbers=rmv_numbers,
+                    rmv_custom_words=rmv_custom_words,
+                    verbose=False,
+                )
+                for doc in corpus:
+                    line = " ".join(tokenize(doc)) + "\n"
+                    digest.update(line.encode("utf-8"))
+                    f.write(line)
+        corpus_key = digest.hexdigest()
+        params = (vector_size, window, min_count, epochs)
+        model_key = hashlib.sha1((corpus_key + str(params)).encode("utf-8"))
+        corpus_file = os.path.join(path, corpus_key + ".txt")
+        model_file = os.path.join(path, model_key.hexdigest() + ".model")
+        os.replace(tmp_file, corpus_file)
+        corpus = token_stream(corpus_file)
+        if not cache_dir:
+            weakref.finalize(corpus, shutil.rmtree, path, True)
+        if os.path.exists(model_file):
+            model = FastText.load(model_file)
+        else:
+            model = FastText(
+                corpus_file=corpus_file,
+                vector_size=vector_size,
+                window=window,
+                min_count=min_count,
+                epochs=epochs,
+                workers=workers,
+            )
+            if cache_dir:
+                model.save(model_file)
         w_emb = [model.wv[word] for word in corpus[0] if word in model.wv]
         vocab = model.wv.index_to_key
         return model, corpus, w_emb, vocab
 
+    # Function: Token -> Document Indices of a Tokenized Corpus
+    def __word_index(self, corpus):
+        if isinstance(self.word_idx, int) or self.word_idx[0] is not corpus:
+            index = defaultdict(list)
+            for i, tokens in enumerate(corpus):
+                for token in dict.fromkeys(tokens):
+                    index[token].append(i)
+            self.word_idx = (corpus, dict(index))
+        return self.word_idx[1]
+
     # Function: Find Documents that have the Target Words
     def word_embeddings_find_doc(self, corpus, target_words=[]):
-        results = []
-        i = -1
         original = self.data["abstract"].tolist()
-        for tokens in corpus:
-            i = i + 1
-            if set(target_words).issubset(tokens):
-                results.append((i, original[i]))
+        if len(target_words) == 0:
+            return [(i, original[i]) for i in range(0, len(original))]
+        index = self.__word_index(corpus)
+        postings = sorted(
+            (index.get(word, []) for word in set(target_words)), key=len
+        )
+        docs = set(postings[0])
+        for item in postings[1:]:
+            docs.intersection_update(item)
+        results = [(i, original[i]) for i in sorted(docs)]
         return results
 
     # Function: Words Similarity
@@ -10088,8 +11927,7 @@ class pbx_probe:
             print("Total Number of Valid Abstracts: ", len(corpus))
             print("")
             corpus = " ".join(corpus)
-            tokenizer = PegasusTokenizer.from_pretrained(model_name)
-            pegasus = PegasusForConditionalGeneration.from_pretrained(model_name)
+            tokenizer, pegasus = model_cache.get("pegasus", model_name)
             tokens = tokenizer.encode(
                 corpus, return_tensors="pt", max_length=max_L, truncation=True
             )
@@ -10265,7 +12103,7 @@ class pbx_probe:
             print("Total Number of Valid Abstracts: ", len(corpus))
             print("")
             corpus = " ".join(corpus)
-            bert_model = Summarizer()
+            bert_model = model_cache.get("bert_sum", "default")
             summary = "".join(bert_model(corpus, min_length=5))
         else:
             summary = "No abstracts were found in the selected set of documents"
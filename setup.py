@@ -16,7 +16,6 @@ setup(
     install_requires=[
         'bertopic',
         'bert-extractive-summarizer',
-        'chardet',
         'google-generativeai',
         'gensim',
         'llmx',
@@ -0,0 +1,97 @@
+import os
+
+import numpy as np
+import pytest
+
+from pybibx.base import pbx
+from pybibx.base.pbx import ivf_index, normalize_rows, pbx_probe
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+@pytest.fixture(scope="module")
+def probe():
+    probe = pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+    n = probe.data.shape[0]
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(12, 32))
+    vectors = centers[rng.integers(0, 12, n)] + 0.6 * rng.normal(size=(n, 32))
+    vectors[10] = vectors[3] + 0.001 * rng.normal(size=32)
+    vectors[200] = vectors[50] + 0.001 * rng.normal(size=32)
+    probe.embds = vectors.astype(np.float32)
+    probe.embds_keys = ["%040x" % i for i in range(0, n)]
+    probe.embds_model = ("test", "", "", None)
+    return probe
+
+
+def brute_top(vectors, i, k):
+    sims = vectors @ vectors[i]
+    sims[i] = -np.inf
+    return set(np.argsort(-sims, kind="stable")[:k].tolist())
+
+
+def test_ann_requires_embeddings():
+    probe = pbx_probe.__new__(pbx_probe)
+    probe.embds_model = -1
+    with pytest.raises(ValueError):
+        probe.ann_index()
+    with pytest.raises(ValueError):
+        probe.similar_to_text("graph")
+
+
+def test_similar_documents_recall_against_brute_force(probe):
+    vectors = normalize_rows(probe.embds)
+    n_lists = probe.ann_index(rebuild=True)[2].centroids.shape[0]
+    hits = 0
+    for i in range(0, 100):
+        found = probe.similar_documents(i, k=5, n_probe=4)["ID"].astype(int)
+        hits = hits + len(brute_top(vectors, i, 5) & set(found))
+        exact = probe.similar_documents(i, k=5, n_probe=n_lists)["ID"].astype(int)
+        assert set(exact) == brute_top(vectors, i, 5)
+    assert hits / 500 >= 0.9
+
+
+def test_duplicate_abstracts_probe_all_lists_is_exact(probe):
+    vectors = normalize_rows(probe.embds)
+    n_lists = probe.ann_index()[2].centroids.shape[0]
+    sims = np.triu(vectors @ vectors.T, k=1)
+    brute = set(zip(*[v.tolist() for v in np.nonzero(sims >= 0.8)]))
+    found = probe.duplicate_abstracts(cut_sim=0.8, n_probe=n_lists)
+    assert set(zip(found["ID 1"].astype(int), found["ID 2"].astype(int))) == brute
+    assert np.all(np.diff(found["Similarity"].to_numpy()) <= 0)
+    planted = probe.duplicate_abstracts(cut_sim=0.99, n_probe=1)
+    pairs = set(zip(planted["ID 1"].astype(int), planted["ID 2"].astype(int)))
+    assert {(3, 10), (50, 200)} <= pairs
+
+
+def test_similar_to_text_cleans_the_query_like_the_corpus(probe, monkeypatch):
+    seen = []
+
+    class encoder:
+        def encode(self, texts):
+            seen.extend(texts)
+            return probe.embds[:1]
+
+    monkeypatch.setattr(pbx.model_cache, "get", lambda kind, name: encoder())
+    clean = {"stop_words": ["en"], "rmv_custom_words": ["model"]}
+    monkeypatch.setattr(probe, "embds_model", ("test", "", "", clean))
+    query = "The Model of 12 Networks, in Brazil!"
+    results = probe.similar_to_text(query, k=3)
+    assert seen == probe.clear_text([query], **clean)
+    assert seen == ["networks brazil"]
+    assert results.shape[0] == 3
+
+
+def test_ivf_index_inserts_new_keys_and_round_trips(tmp_path):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(200, 16)).astype(np.float32)
+    keys = ["%040x" % (i * 0x100) for i in range(0, 200)]
+    index = ivf_index()
+    index.fit(vectors[:150], keys[:150], n_lists=8)
+    assert index.insert(vectors, keys) == 50
+    assert index.insert(vectors, keys) == 0
+    path = str(tmp_path / "ann" / "index.npz")
+    index.save(path)
+    loaded = ivf_index.load(path)
+    assert loaded.lists == index.lists
+    assert np.array_equal(loaded.centroids, index.centroids)
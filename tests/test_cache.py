@@ -0,0 +1,118 @@
+import os
+
+import numpy as np
+
+from pybibx.base import pbx
+from pybibx.base.pbx import embedding_store, pbx_probe
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+class encoder:
+    def __init__(self):
+        self.seen = []
+
+    def get_sentence_embedding_dimension(self):
+        return 4
+
+    def encode(self, texts, batch_size=32):
+        self.seen.extend(texts)
+        return np.array([[len(text), 1, 2, 3] for text in texts], dtype=np.float32)
+
+
+def files(path):
+    return sorted(
+        os.path.relpath(os.path.join(root, name), path)
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def embedding_stores_path(cache_dir):
+    return next(
+        store.path for key, store in pbx.embedding_stores.items() if key[0] == cache_dir
+    )
+
+
+def test_embeddings_write_nothing_without_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    model = encoder()
+    monkeypatch.setattr(pbx.model_cache, "get", lambda kind, name: model)
+    probe = pbx_probe.__new__(pbx_probe)
+    vectors = probe._pbx_probe__embed(["a b", "c"], "test")
+    assert vectors[:, 0].tolist() == [3, 1]
+    assert files(str(tmp_path)) == []
+
+
+def test_cache_clear_caps_size_oldest_chunks_first(monkeypatch, tmp_path):
+    model = encoder()
+    monkeypatch.setattr(pbx.model_cache, "get", lambda kind, name: model)
+    probe = pbx_probe.__new__(pbx_probe)
+    cache_dir = str(tmp_path)
+    for i, text in enumerate(["a", "bb", "ccc"]):
+        probe._pbx_probe__embed([text], "test", cache_dir)
+        for name in files(cache_dir):
+            if "chunk_" + str(i).zfill(6) in name:
+                os.utime(os.path.join(cache_dir, name), (i, i))
+    store = embedding_stores_path(cache_dir)
+    chunk = sum(
+        os.path.getsize(os.path.join(store, name))
+        for name in os.listdir(store)
+        if name.startswith("chunk_000002")
+    )
+    removed = probe.cache_clear(cache_dir, max_mb=2.5 * chunk / (1024 * 1024))
+    assert removed > 0
+    names = sorted(os.listdir(store))
+    assert "chunk_000000.npy" not in names
+    assert "chunk_000002.npy" in names and "chunk_000002.keys.npy" in names
+    assert pbx.embedding_stores == {}
+    model.seen = []
+    probe._pbx_probe__embed(["a", "bb", "ccc"], "test", cache_dir)
+    assert model.seen == ["a"]
+    assert len(embedding_store(cache_dir, "test").chunks) == len(
+        [name for name in os.listdir(store) if name.endswith(".keys.npy")]
+    )
+
+
+def test_cache_clear_removes_everything(monkeypatch, tmp_path):
+    model = encoder()
+    monkeypatch.setattr(pbx.model_cache, "get", lambda kind, name: model)
+    probe = pbx_probe.__new__(pbx_probe)
+    probe._pbx_probe__embed(["a", "bb"], "test", str(tmp_path))
+    assert files(str(tmp_path)) != []
+    assert probe.cache_clear(str(tmp_path)) > 0
+    assert os.listdir(str(tmp_path)) == []
+    assert probe.cache_clear(str(tmp_path / "missing")) == 0
+    model.seen = []
+    probe._pbx_probe__embed(["a", "bb"], "test", str(tmp_path))
+    assert model.seen == ["bb", "a"]
+
+
+class fasttext:
+    saved = []
+
+    def __init__(self, corpus_file, **params):
+        words = open(corpus_file, encoding="utf-8").read().split()
+        self.wv = {word: np.ones(3) for word in words}
+        self.wv = type("wv", (dict,), {"index_to_key": list(self.wv)})(self.wv)
+
+    def save(self, path):
+        fasttext.saved.append(path)
+
+
+def test_word_embeddings_use_a_temporary_corpus_without_cache_dir(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(pbx, "FastText", fasttext)
+    fasttext.saved = []
+    probe = pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+    model, corpus, w_emb, vocab = probe.word_embeddings()
+    path = os.path.dirname(corpus.path)
+    assert os.path.exists(corpus.path)
+    assert len(corpus) == probe.data.shape[0]
+    assert len(w_emb) == len(corpus[0])
+    assert fasttext.saved == []
+    assert files(str(tmp_path)) == []
+    del corpus
+    assert not os.path.exists(path)
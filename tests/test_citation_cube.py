@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+import pytest
+
+from pybibx.base.pbx import pbx_probe, sleeping_beauty_coefficients
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+@pytest.fixture(scope="module")
+def probe():
+    return pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+
+
+def scalar_coefficients(citations):
+    c0, cm = citations[0], max(citations)
+    t_m = citations.index(cm)
+    if t_m == 0:
+        return 0.0, 0.0, 0, c0, cm, 0
+    B, d_values = 0.0, []
+    denom = np.sqrt((cm - c0) ** 2 + t_m**2)
+    for t, c in enumerate(citations[: t_m + 1]):
+        B = B + (((cm - c0) / t_m) * t + c0 - c) / max(1, c)
+        d_values.append(abs((cm - c0) * t - t_m * c + t_m * c0) / max(1, denom))
+    return B, B / denom, int(np.argmax(d_values)), c0, cm, t_m
+
+
+def test_sleeping_beauty_coefficients_match_scalar_formulas():
+    rng = np.random.default_rng(3)
+    counts = rng.poisson(1.5, size=(200, 15))
+    counts[:20, :] = 0
+    counts[:20, -1] = 9
+    B, SBI, t_a, c0, cm, t_m = sleeping_beauty_coefficients(counts)
+    for i in range(0, counts.shape[0]):
+        ref = scalar_coefficients(counts[i].tolist())
+        assert np.isclose(B[i], ref[0])
+        assert np.isclose(SBI[i], ref[1])
+        assert (t_a[i], c0[i], cm[i], t_m[i]) == ref[2:]
+
+
+def test_citation_cube_counts_citing_years(probe):
+    cube, x_range = probe._pbx_probe__citation_cube()
+    assert cube.shape == (len(probe.u_ref_id), len(x_range))
+    dense = cube.toarray()
+    for k in range(0, len(probe.u_ref_id), 25):
+        ref = probe.u_ref_id[k]
+        for year in set(int(y) for y in probe.dy if y != -1):
+            count = sum(
+                1
+                for i, refs in enumerate(probe.ref_id)
+                if probe.dy[i] == year
+                for r in refs
+                if r == ref
+            )
+            assert dense[k, year - x_range[0]] == count
+    assert probe._pbx_probe__citation_cube()[0] is cube
+
+
+def test_detect_sleeping_beauties_ranks_cube_rows(probe):
+    cube, _ = probe._pbx_probe__citation_cube()
+    metrics = probe.detect_sleeping_beauties(topn=1000, min_count=2)
+    totals = np.asarray(cube.sum(axis=1)).ravel()
+    expected = {}
+    for k in np.where(totals >= 2)[0]:
+        B = scalar_coefficients(cube[k].toarray().ravel().tolist())[0]
+        if B > 0:
+            expected[probe.u_ref_id[k]] = B
+    assert len(expected) > 0
+    assert set(metrics["ref"]) == set(expected)
+    assert np.allclose(metrics["B"], [expected[r] for r in metrics["ref"]])
+    assert metrics["B"].is_monotonic_decreasing
+
+
+def test_detect_sleeping_beauties_in_blocks_matches_single_pass(probe):
+    single = probe.detect_sleeping_beauties(topn=50, min_count=2, block_size=10**6)
+    for block_size in [1, 7]:
+        blocks = probe.detect_sleeping_beauties(50, 2, block_size=block_size)
+        assert blocks.equals(single)
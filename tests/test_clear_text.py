@@ -0,0 +1,83 @@
+import os
+import re
+import unicodedata
+
+import pytest
+
+from pybibx.base import pbx
+from pybibx.base.pbx import pbx_probe, stopword_set
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+OPTIONS = [
+    {},
+    {"stop_words": ["en", "pt-br"], "rmv_custom_words": ["model", "data"]},
+    {"lowercase": False, "rmv_special_chars": False},
+    {"rmv_accents": False, "rmv_numbers": False, "stop_words": []},
+]
+
+EXTRA = [
+    "Análise Multicritério de 12 Decisões — “ELECTRE” vs. PROMETHEE’s",
+    "Ça coûte 3,5 € à l'école; naïve Zoë",
+    "the MODEL of the data",
+    "",
+]
+
+
+def multi_pass(
+    corpus,
+    stop_words=["en"],
+    lowercase=True,
+    rmv_accents=True,
+    rmv_special_chars=True,
+    rmv_numbers=True,
+    rmv_custom_words=[],
+):
+    corpus = [str(x) for x in corpus]
+    if lowercase:
+        corpus = [x.lower().replace("’", "'") for x in corpus]
+    if rmv_special_chars:
+        corpus = [re.sub(r"[^a-zA-Z0-9']+", " ", x) for x in corpus]
+    words = set(rmv_custom_words)
+    for sw_ in stop_words:
+        words.update(stopword_set(sw_))
+    corpus = [" ".join(w for w in x.split() if w not in words) for x in corpus]
+    if rmv_accents:
+        corpus = [
+            unicodedata.normalize("NFD", x).encode("ascii", "ignore").decode("utf-8")
+            for x in corpus
+        ]
+    if rmv_numbers:
+        corpus = [re.sub("[0-9]", " ", x) for x in corpus]
+    return [" ".join(x.split()) for x in corpus]
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    probe = pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+    return probe.data["abstract"].tolist() + probe.data["title"].tolist() + EXTRA
+
+
+@pytest.mark.parametrize("options", OPTIONS)
+def test_clear_text_matches_multi_pass_reference(corpus, options):
+    probe = pbx_probe.__new__(pbx_probe)
+    assert probe.clear_text(corpus, **options) == multi_pass(corpus, **options)
+
+
+def test_clear_text_pool_matches_single_process(corpus, monkeypatch):
+    probe = pbx_probe.__new__(pbx_probe)
+    monkeypatch.setattr(pbx, "clean_worker_min", 100)
+    for options in OPTIONS:
+        assert probe.clear_text(corpus, n_jobs=2, **options) == probe.clear_text(
+            corpus, **options
+        )
+
+
+def test_clear_text_skips_the_pool_for_small_corpora(corpus, monkeypatch):
+    probe = pbx_probe.__new__(pbx_probe)
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(pbx, "ProcessPoolExecutor", no_pool)
+    assert probe.clear_text(corpus, n_jobs=4) == multi_pass(corpus)
@@ -0,0 +1,70 @@
+from collections import Counter
+from itertools import combinations
+
+import numpy as np
+
+from pybibx.base.pbx import (
+    cms_query,
+    cms_update,
+    co_occurrence_shard,
+    combination_counts,
+    combination_keys,
+    combination_members,
+)
+
+
+def random_docs(n_docs, vocab, seed):
+    rng = np.random.default_rng(seed)
+    docs = [
+        np.sort(rng.choice(vocab, rng.integers(0, 12), replace=False))
+        for _ in range(0, n_docs)
+    ]
+    indptr = np.r_[0, np.cumsum([len(d) for d in docs])].astype(np.int64)
+    ids = np.concatenate(docs).astype(np.int64)
+    return docs, indptr, ids
+
+
+def brute_counts(docs, group):
+    counts = Counter()
+    for d in docs:
+        counts.update(combinations(d.tolist(), group))
+    return counts
+
+
+def decode(key, group, base):
+    combo = []
+    for _ in range(0, group):
+        key, code = divmod(int(key), base)
+        combo.append(code)
+    return tuple(reversed(combo))
+
+
+def test_exact_packed_counts_match_brute_force():
+    docs, indptr, ids = random_docs(400, 60, 0)
+    for group in [2, 3]:
+        keys, counts, _ = co_occurrence_shard(indptr, ids, group, 60, max_keys=500)
+        found = {decode(k, group, 60): c for k, c in zip(keys, counts)}
+        assert found == dict(brute_counts(docs, group))
+
+
+def test_hashed_keys_resolve_to_exact_member_counts():
+    docs, indptr, ids = random_docs(400, 60, 1)
+    total = int(combination_counts(indptr, 3).sum())
+    keys = combination_keys(indptr, ids, 3, 60, total, True)
+    targets = np.unique(keys)
+    found, members = combination_members(indptr, ids, 3, targets)
+    assert found.shape[0] == total
+    assert Counter(map(tuple, members.tolist())) == brute_counts(docs, 3)
+    assert targets.shape[0] == len(brute_counts(docs, 3))
+
+
+def test_count_min_never_underestimates():
+    docs, indptr, ids = random_docs(400, 60, 2)
+    keys, counts, _ = co_occurrence_shard(indptr, ids, 2, 60)
+    seeds = np.arange(1, 5, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    small = np.zeros((4, 64), dtype=np.int64)
+    cms_update(small, keys, counts, seeds)
+    assert np.all(cms_query(small, keys, seeds) >= counts)
+    large = np.zeros((4, 2**16), dtype=np.int64)
+    cms_update(large, keys, counts, seeds)
+    assert np.array_equal(cms_query(large, keys, seeds), counts)
@@ -0,0 +1,73 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+from pybibx.base.pbx import community_labels
+
+
+def make_graph(n, edges):
+    rows = [u for u, v in edges] + [v for u, v in edges]
+    cols = [v for u, v in edges] + [u for u, v in edges]
+    return csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+
+
+def modularity(adjacency, labels):
+    a = adjacency.toarray()
+    k = a.sum(axis=1)
+    m2 = a.sum()
+    same = labels[:, None] == labels[None, :]
+    return ((a - np.outer(k, k) / m2) * same).sum() / m2
+
+
+def set_partitions(n):
+    if n == 0:
+        yield []
+        return
+    for part in set_partitions(n - 1):
+        for c in range(0, max(part, default=-1) + 2):
+            yield part + [c]
+
+
+def two_cliques():
+    edges = [(i, j) for i in range(0, 4) for j in range(i + 1, 4)]
+    edges += [(i, j) for i in range(4, 8) for j in range(i + 1, 8)]
+    edges += [(3, 4)]
+    return make_graph(8, edges)
+
+
+def test_louvain_reaches_brute_force_modularity():
+    adjacency = two_cliques()
+    best = max(
+        modularity(adjacency, np.array(part)) for part in set_partitions(8)
+    )
+    labels = community_labels(adjacency, method="louvain")
+    assert np.isclose(modularity(adjacency, labels), best)
+    assert len(set(labels[:4])) == 1 and len(set(labels[4:])) == 1
+    assert labels[0] != labels[4]
+
+
+def test_louvain_is_deterministic_for_a_seed():
+    adjacency = two_cliques()
+    a = community_labels(adjacency, method="louvain", seed=7)
+    b = community_labels(adjacency, method="louvain", seed=7)
+    assert np.array_equal(a, b)
+
+
+def test_label_propagation_matches_components_of_disjoint_cliques():
+    edges = []
+    for start, size in [(0, 5), (5, 3), (8, 4)]:
+        nodes = range(start, start + size)
+        edges += [(i, j) for i in nodes for j in nodes if i < j]
+    adjacency = make_graph(12, edges)
+    labels = community_labels(adjacency, method="lpa")
+    _, components = connected_components(adjacency, directed=False)
+    for i in range(0, 12):
+        for j in range(0, 12):
+            assert (labels[i] == labels[j]) == (components[i] == components[j])
+
+
+def test_labels_are_ranked_by_community_size():
+    edges = [(i, j) for i in range(0, 3) for j in range(i + 1, 3)]
+    edges += [(i, j) for i in range(3, 8) for j in range(i + 1, 8)]
+    labels = community_labels(make_graph(8, edges), method="louvain")
+    assert np.all(labels[3:] == 0) and np.all(labels[:3] == 1)
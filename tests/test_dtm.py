@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+from scipy.sparse import issparse
+from sklearn.decomposition import TruncatedSVD
+
+from pybibx.base.pbx import pbx_probe
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+@pytest.fixture(scope="module")
+def probe():
+    return pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+
+
+def test_dtm_tf_idf_is_sparse_and_matches_the_dense_frame(probe):
+    corpus = probe.clear_text(probe.data["abstract"].tolist())
+    dtm, tokens = probe.dtm_tf_idf(corpus)
+    assert issparse(dtm) and dtm.format == "csr"
+    assert dtm.shape == (len(corpus), len(tokens))
+    dense = probe.dtm_tf_idf(corpus, dense=True)
+    assert list(dense.columns) == tokens
+    assert np.allclose(dense.to_numpy(), dtm.toarray())
+    assert np.allclose(np.asarray(dtm.multiply(dtm).sum(axis=1)).ravel(), 1)
+
+
+def test_docs_projection_reduces_the_sparse_matrix(probe, monkeypatch):
+    monkeypatch.setattr(go.Figure, "show", lambda self, *args, **kwargs: None)
+    transformed, labels = probe.docs_projection(view="notebook", n_clusters=4)
+    corpus = probe.clear_text(probe.data["abstract"].tolist())
+    dense = probe.dtm_tf_idf(corpus, dense=True).to_numpy()
+    expected = TruncatedSVD(n_components=2, random_state=1001).fit_transform(dense)
+    assert np.allclose(np.abs(transformed), np.abs(expected), atol=1e-6)
+    assert len(labels) == probe.data.shape[0]
+    assert len(set(labels.tolist())) == 4
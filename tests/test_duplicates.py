@@ -0,0 +1,72 @@
+import numpy as np
+
+from pybibx.base.pbx import duplicate_records, normalize_dois, normalize_titles
+
+
+def brute_keep(dois, titles):
+    d_key = normalize_dois(dois).tolist()
+    t_key = normalize_titles(titles).tolist()
+    keep = list(range(0, len(dois)))
+    for i in range(0, len(dois)):
+        for key in [t_key, d_key]:
+            if key[i] == "":
+                continue
+            first = min(j for j in range(0, i + 1) if key[j] == key[i])
+            if first < i:
+                keep[i] = first
+    changed = True
+    while changed:
+        changed = False
+        for i in range(0, len(keep)):
+            if keep[keep[i]] != keep[i]:
+                keep[i] = keep[keep[i]]
+                changed = True
+    return keep
+
+
+def test_exact_duplicates_match_brute_force():
+    dois = [
+        "10.1/A",
+        "https://doi.org/10.1/a",
+        "",
+        "doi: 10.2/b",
+        "10.2/B",
+        "UNKNOWN",
+        "10.3/c",
+        "10.3/c",
+    ]
+    titles = [
+        "Graph Theory",
+        "Something Else",
+        "Graph theory!",
+        "Networks",
+        "Other",
+        "Networks 2",
+        "Unknown",
+        "Graph Theory",
+    ]
+    keep, rule = duplicate_records(dois, titles)
+    assert keep.tolist() == brute_keep(dois, titles)
+    assert rule.tolist() == ["", "doi", "title", "", "doi", "title", "", "doi"]
+
+
+def test_random_records_match_brute_force():
+    rng = np.random.default_rng(0)
+    dois = [str(v) if v > 0 else "" for v in rng.integers(0, 15, 200)]
+    titles = ["title " + "abcdefghij"[v] for v in rng.integers(0, 10, 200)]
+    keep, _ = duplicate_records(dois, titles)
+    assert keep.tolist() == brute_keep(dois, titles)
+
+
+def test_near_duplicate_titles():
+    dois = ["", "", ""]
+    titles = [
+        "A Survey of Multi Criteria Decision Analysis Methods",
+        "A Survey of Multi-Criteria Decision Analysis Method",
+        "Deep Learning for Image Segmentation",
+    ]
+    keep, rule = duplicate_records(dois, titles)
+    assert keep.tolist() == [0, 1, 2]
+    keep, rule = duplicate_records(dois, titles, near_dupl=True)
+    assert keep.tolist() == [0, 0, 2]
+    assert rule.tolist() == ["", "near", ""]
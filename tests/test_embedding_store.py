@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from pybibx.base import pbx
+from pybibx.base.pbx import pbx_probe
+
+
+class encoder:
+    def __init__(self):
+        self.seen = []
+
+    def get_sentence_embedding_dimension(self):
+        return 3
+
+    def encode(self, texts, batch_size=32):
+        self.seen.extend(texts)
+        return np.array([vector(text) for text in texts], dtype=np.float32)
+
+
+def vector(text):
+    return [len(text), text.count("a"), sum(map(ord, text)) % 97]
+
+
+@pytest.fixture()
+def model(monkeypatch):
+    model = encoder()
+    monkeypatch.setattr(pbx.model_cache, "get", lambda kind, name: model)
+    monkeypatch.setattr(pbx, "embedding_stores", {})
+    return model
+
+
+def test_embed_encodes_only_texts_missing_from_the_store(model, tmp_path):
+    probe = pbx_probe.__new__(pbx_probe)
+    corpus = ["graph data", "banana", "graph data", "a"]
+    vectors = probe._pbx_probe__embed(corpus, "m1", str(tmp_path))
+    assert vectors.tolist() == [vector(text) for text in corpus]
+    assert sorted(model.seen) == ["a", "banana", "graph data"]
+    model.seen = []
+    vectors = probe._pbx_probe__embed(corpus + ["new text"], "m1", str(tmp_path))
+    assert model.seen == ["new text"]
+    assert vectors.tolist() == [vector(text) for text in corpus + ["new text"]]
+
+
+def test_embedding_store_is_reloaded_from_disk_per_model(model, tmp_path, monkeypatch):
+    probe = pbx_probe.__new__(pbx_probe)
+    corpus = ["alpha", "beta", "gamma"]
+    probe._pbx_probe__embed(corpus, "m1", str(tmp_path))
+    monkeypatch.setattr(pbx, "embedding_stores", {})
+    model.seen = []
+    vectors = probe._pbx_probe__embed(corpus[::-1], "m1", str(tmp_path))
+    assert model.seen == []
+    assert vectors.tolist() == [vector(text) for text in corpus[::-1]]
+    probe._pbx_probe__embed(corpus, "m2", str(tmp_path))
+    assert sorted(model.seen) == sorted(corpus)
+
+
+def test_embed_without_cache_dir_always_encodes(model, tmp_path):
+    probe = pbx_probe.__new__(pbx_probe)
+    probe._pbx_probe__embed(["alpha", "beta"], "m1", "")
+    probe._pbx_probe__embed(["alpha", "beta"], "m1", "")
+    assert sorted(model.seen) == ["alpha", "alpha", "beta", "beta"]
+    assert pbx.embedding_stores == {}
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from pybibx.base import pbx
+from pybibx.base.pbx import pbx_probe
+
+
+class encoder:
+    def __init__(self):
+        self.calls = []
+        self.pools = []
+
+    def get_sentence_embedding_dimension(self):
+        return 2
+
+    def encode(self, texts, batch_size=32):
+        self.calls.append((list(texts), batch_size))
+        return np.array([[len(text), 1] for text in texts], dtype=np.float32)
+
+    def start_multi_process_pool(self, target_devices):
+        self.pools.append(("start", target_devices))
+        return "pool"
+
+    def encode_multi_process(self, texts, pool, batch_size=32):
+        self.pools.append(("encode", len(texts)))
+        return self.encode(texts, batch_size)
+
+    def stop_multi_process_pool(self, pool):
+        self.pools.append(("stop", pool))
+
+
+@pytest.fixture()
+def model(monkeypatch):
+    model = encoder()
+    monkeypatch.setattr(pbx.model_cache, "get", lambda kind, name: model)
+    monkeypatch.setattr(pbx, "embedding_stores", {})
+    return model
+
+
+def corpus(n):
+    return ["w" * (1 + (i * 37) % 150) + str(i) for i in range(0, n)]
+
+
+def test_embed_encodes_longest_first_in_blocks(model, tmp_path, capsys):
+    probe = pbx_probe.__new__(pbx_probe)
+    texts = corpus(150)
+    vectors = probe._pbx_probe__embed(
+        texts, "m1", str(tmp_path), batch_size=1, verbose=True
+    )
+    assert [len(call[0]) for call in model.calls] == [64, 64, 22]
+    assert all(call[1] == 1 for call in model.calls)
+    encoded = [text for call in model.calls for text in call[0]]
+    assert [len(t) for t in encoded] == sorted((len(t) for t in texts), reverse=True)
+    assert vectors[:, 0].tolist() == [len(text) for text in texts]
+    assert capsys.readouterr().out.count("Embeddings: ") == 3
+    store = next(iter(pbx.embedding_stores.values()))
+    assert len(store.chunks) == 3
+
+
+def test_embed_fills_self_embds_while_encoding(model):
+    probe = pbx_probe.__new__(pbx_probe)
+    seen = []
+    encode = model.encode
+
+    def watch(texts, batch_size=32):
+        seen.append(np.count_nonzero(probe.embds[:, 1]))
+        return encode(texts, batch_size)
+
+    model.encode = watch
+    vectors = probe._pbx_probe__embed(corpus(100), "m1", "", batch_size=1, live=True)
+    assert seen == [0, 64]
+    assert probe.embds is vectors
+
+
+def test_embed_multi_process_pool_is_stopped(model):
+    probe = pbx_probe.__new__(pbx_probe)
+    vectors = probe._pbx_probe__embed(corpus(10), "m1", "", n_jobs=3)
+    assert model.pools == [("start", ["cpu"] * 3), ("encode", 10), ("stop", "pool")]
+    assert vectors[:, 0].tolist() == [len(text) for text in corpus(10)]
@@ -0,0 +1,45 @@
+import os
+
+import pytest
+
+from pybibx.base.pbx import pbx_probe
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+FIELDS = ["aut", "ctr", "uni", "jou", "kid", "auk", "lan", "ref", "ref_id"]
+
+
+@pytest.fixture()
+def probe():
+    return pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+
+
+def scan(items):
+    return {
+        entity: [i for i, row in enumerate(items) if entity in row]
+        for row in items
+        for entity in row
+    }
+
+
+def test_entity_index_matches_document_scan(probe):
+    for field in FIELDS:
+        index = probe._pbx_probe__entity_index(field)
+        assert index == scan(getattr(probe, field)), field
+        assert probe._pbx_probe__entity_index(field) is index
+
+
+def test_filter_bib_by_sources_and_countries_matches_scan(probe):
+    sources = [probe.u_jou[0], probe.u_jou[3]]
+    keep = [i for i, row in enumerate(probe.jou) if row[0] in sources]
+    titles = probe.data["title"].iloc[keep].tolist()
+    index = probe._pbx_probe__entity_index("jou")
+    probe.filter_bib(sources=sources)
+    assert sorted(probe.data["title"]) == sorted(titles)
+    assert probe._pbx_probe__entity_index("jou") is not index
+    assert probe._pbx_probe__entity_index("jou") == scan(probe.jou)
+    country = [probe.u_ctr[0], "Nowhere"]
+    keep = [i for i, row in enumerate(probe.ctr) if any(x in country for x in row)]
+    titles = probe.data["title"].iloc[keep].tolist()
+    probe.filter_bib(country=country)
+    assert probe.data["title"].tolist() == titles
@@ -0,0 +1,85 @@
+from difflib import SequenceMatcher
+from itertools import combinations
+
+import numpy as np
+
+from pybibx.base.pbx import (
+    encode_strings,
+    fuzzy_candidates,
+    indel_ratios,
+    minhash_signatures,
+)
+
+
+def lcs(a, b):
+    table = np.zeros((len(a) + 1, len(b) + 1), dtype=int)
+    for i in range(0, len(a)):
+        for j in range(0, len(b)):
+            if a[i] == b[j]:
+                table[i + 1, j + 1] = table[i, j] + 1
+            else:
+                table[i + 1, j + 1] = max(table[i, j + 1], table[i + 1, j])
+    return table[-1, -1]
+
+
+NAMES = [
+    "pereira v",
+    "pereira, v.",
+    "perreira v",
+    "smith j",
+    "smyth j",
+    "",
+    "müller k",
+    "muller k",
+    "zhang wei",
+]
+
+
+def test_indel_ratios_match_lcs_reference():
+    chars, offsets = encode_strings(NAMES)
+    left, right = np.triu_indices(len(NAMES), k=1)
+    ratios = indel_ratios(chars, offsets, left, right, 0.0)
+    for p, (i, j) in enumerate(zip(left, right)):
+        a, b = NAMES[i], NAMES[j]
+        ref = 1.0 if len(a) + len(b) == 0 else 2 * lcs(a, b) / (len(a) + len(b))
+        assert np.isclose(ratios[p], ref)
+
+
+def test_indel_ratios_length_prefilter_skips_only_hopeless_pairs():
+    chars, offsets = encode_strings(["ab", "abcdefghij"])
+    ratio = indel_ratios(chars, offsets, np.array([0]), np.array([1]), 0.8)
+    assert ratio[0] == 0.0
+    assert 2 * lcs("ab", "abcdefghij") / 12 < 0.8
+
+
+def test_minhash_signatures_are_equal_for_equal_strings():
+    chars, offsets = encode_strings(["graph theory", "graph theory", "network"])
+    seeds = np.arange(1, 17, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    sig = minhash_signatures(chars, offsets, 2, seeds)
+    assert np.array_equal(sig[0], sig[1])
+    assert not np.array_equal(sig[0], sig[2])
+
+
+def test_unblocked_candidates_are_all_pairs():
+    left, right = fuzzy_candidates(NAMES, blocking="none")
+    assert set(zip(left.tolist(), right.tolist())) == set(
+        combinations(range(0, len(NAMES)), 2)
+    )
+
+
+def test_lsh_candidates_keep_close_pairs():
+    rng = np.random.default_rng(0)
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    base = ["".join(rng.choice(letters, 14)) for _ in range(0, 200)]
+    typos = [s[:5] + "x" + s[6:] for s in base]
+    strings = base + typos
+    left, right = fuzzy_candidates(strings, blocking="lsh")
+    pairs = set(zip(left.tolist(), right.tolist()))
+    close = [
+        (i, i + 200)
+        for i in range(0, 200)
+        if SequenceMatcher(None, base[i], typos[i]).ratio() >= 0.9
+    ]
+    recall = sum(pair in pairs for pair in close) / len(close)
+    assert recall >= 0.95
+    assert len(pairs) < len(strings) * (len(strings) - 1) // 2
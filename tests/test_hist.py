@@ -0,0 +1,90 @@
+import os
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from pybibx.base.pbx import (
+    citation_dag,
+    k_core_numbers,
+    pbx_probe,
+    ranked_main_paths,
+    search_path_counts,
+)
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+@pytest.fixture(scope="module")
+def probe():
+    return pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+
+
+def local_links(probe):
+    links = {}
+    for i, refs in enumerate(probe.ref_id):
+        links[i] = {int(r) for r in refs if r.isdigit()}
+    return links
+
+
+def test_k_core_numbers_match_networkx():
+    graph = nx.gnp_random_graph(60, 0.1, seed=7)
+    adjacency = nx.to_scipy_sparse_array(graph, format="csr")
+    adjacency.sort_indices()
+    core = k_core_numbers(adjacency.indptr, adjacency.indices, 60)
+    assert core.tolist() == [nx.core_number(graph)[v] for v in range(0, 60)]
+
+
+def test_hist_graph_keeps_seeds_and_their_references(probe):
+    links = local_links(probe)
+    for min_links in [0, 1, 3]:
+        nodes, edges = probe.hist_graph(min_links=min_links)
+        seeds = {i for i, refs in links.items() if len(refs) >= min_links}
+        held = set(seeds)
+        for i in seeds:
+            held.update(links[i])
+        if min_links == 0:
+            held = set(links)
+        assert set(nodes["id"].tolist()) == held
+        assert set(nodes["id"][nodes["n_m"]].tolist()) == seeds & held
+        pairs = {(u, v) for u in held for v in links[u] if v in held and u != v}
+        years = probe.dy.to_numpy().astype(int)
+        assert np.all(years[edges[:, 0]] >= years[edges[:, 1]])
+        assert {tuple(sorted(e)) for e in edges.tolist()} == {
+            tuple(sorted(e)) for e in pairs
+        }
+
+
+def test_hist_graph_lays_out_each_year_as_a_column(probe):
+    nodes, _ = probe.hist_graph(min_links=1, dist=2.0)
+    for year, group in nodes.groupby("year"):
+        assert group["id"].is_monotonic_increasing
+        assert group["y_pos"].tolist() == [2.0 * i for i in range(0, group.shape[0])]
+
+
+def test_hist_graph_main_path_keeps_only_path_nodes(probe):
+    nodes, edges = probe.hist_graph(main_path=2)
+    assert 0 < len(probe.hist_paths) <= 2
+    on_path = {v for path in probe.hist_paths for v in path}
+    assert set(nodes["id"].tolist()) <= on_path
+    for path in probe.hist_paths:
+        assert set(path) <= set(nodes["id"].tolist())
+    assert set(edges.ravel().tolist()) <= on_path
+
+
+def test_ranked_main_paths_are_ordered_by_best_path_weight():
+    rng = np.random.default_rng(5)
+    n = 40
+    src, tgt = np.nonzero(np.triu(rng.random((n, n)) < 0.08, k=1))
+    dag, order = citation_dag(src, tgt, n)
+    spc, _ = search_path_counts(dag.indptr, dag.indices, order)
+    weight = {}
+    for u in range(0, n):
+        for p in range(dag.indptr[u], dag.indptr[u + 1]):
+            weight[(u, int(dag.indices[p]))] = spc[p]
+    paths = ranked_main_paths(dag, order, spc, 2, -1)
+    totals = [sum(weight[e] for e in zip(p[:-1], p[1:])) for p in paths]
+    assert len(paths) > 1
+    assert totals == sorted(totals, reverse=True)
+    assert all(len(p) >= 2 for p in paths)
+    assert len(ranked_main_paths(dag, order, spc, 2, 1)) == 1
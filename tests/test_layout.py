@@ -0,0 +1,47 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from pybibx.base.pbx import bh_quadtree, bh_repulsion, force_layout
+
+
+def brute_repulsion(pos, k2):
+    dx = pos[:, None, 0] - pos[None, :, 0]
+    dy = pos[:, None, 1] - pos[None, :, 1]
+    d2 = dx * dx + dy * dy
+    np.fill_diagonal(d2, np.inf)
+    return np.column_stack([(dx * k2 / d2).sum(axis=1), (dy * k2 / d2).sum(axis=1)])
+
+
+def test_exact_barnes_hut_matches_brute_force_repulsion():
+    pos = np.random.default_rng(0).random((60, 2))
+    children, leaf, mass, com, half = bh_quadtree(pos, 32)
+    disp = bh_repulsion(pos, children, leaf, mass, com, half, 0.01, 0.0)
+    assert np.allclose(disp, brute_repulsion(pos, 0.01))
+
+
+def test_approximate_barnes_hut_stays_close_to_brute_force():
+    pos = np.random.default_rng(1).random((300, 2))
+    children, leaf, mass, com, half = bh_quadtree(pos, 32)
+    disp = bh_repulsion(pos, children, leaf, mass, com, half, 0.01, 0.5)
+    exact = brute_repulsion(pos, 0.01)
+    error = np.linalg.norm(disp - exact, axis=1) / np.linalg.norm(exact, axis=1)
+    assert np.median(error) < 0.05
+
+
+def test_quadtree_mass_and_center_of_mass():
+    pos = np.random.default_rng(2).random((40, 2))
+    _, _, mass, com, _ = bh_quadtree(pos, 32)
+    assert mass[0] == 40
+    assert np.allclose(com[0], pos.mean(axis=0))
+
+
+def test_force_layout_is_seeded_and_scaled():
+    edges = [(i, (i + 1) % 10) for i in range(0, 10)]
+    rows = [u for u, v in edges]
+    cols = [v for u, v in edges]
+    adjacency = csr_matrix((np.ones(10), (rows, cols)), shape=(10, 10))
+    a = force_layout(adjacency, seed=3, scale=2)
+    b = force_layout(adjacency, seed=3, scale=2)
+    assert np.array_equal(a, b)
+    assert np.isclose(np.abs(a).max(), 2)
+    assert np.allclose(a.mean(axis=0), 0)
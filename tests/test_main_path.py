@@ -0,0 +1,85 @@
+import numpy as np
+
+from pybibx.base.pbx import citation_dag, ranked_main_paths, search_path_counts
+
+
+def random_dag(n, p, seed):
+    rng = np.random.default_rng(seed)
+    src, tgt = [], []
+    for u in range(0, n):
+        for v in range(u + 1, n):
+            if rng.random() < p:
+                src.append(u)
+                tgt.append(v)
+    return np.array(src), np.array(tgt)
+
+
+def all_paths(succ, start):
+    stack = [[start]]
+    while stack:
+        path = stack.pop()
+        nexts = succ.get(path[-1], [])
+        if not nexts:
+            yield path
+        for v in nexts:
+            stack.append(path + [v])
+
+
+def brute_counts(src, tgt, n):
+    succ, indeg = {}, np.zeros(n, dtype=int)
+    for u, v in zip(src.tolist(), tgt.tolist()):
+        succ.setdefault(u, []).append(v)
+        indeg[v] = indeg[v] + 1
+    spc, splc = {}, {}
+    for start in range(0, n):
+        for path in all_paths(succ, start):
+            for edge in zip(path[:-1], path[1:]):
+                splc[edge] = splc.get(edge, 0) + 1
+                if indeg[start] == 0:
+                    spc[edge] = spc.get(edge, 0) + 1
+    return spc, splc
+
+
+def test_search_path_counts_match_path_enumeration():
+    n = 12
+    src, tgt = random_dag(n, 0.3, 0)
+    dag, order = citation_dag(src, tgt, n)
+    spc, splc = search_path_counts(dag.indptr, dag.indices, order)
+    spc_ref, splc_ref = brute_counts(src, tgt, n)
+    for u in range(0, n):
+        for p in range(dag.indptr[u], dag.indptr[u + 1]):
+            edge = (u, int(dag.indices[p]))
+            assert spc[p] == spc_ref.get(edge, 0)
+            assert splc[p] == splc_ref[edge]
+
+
+def test_citation_dag_drops_cycles_and_self_loops():
+    dag, order = citation_dag([0, 1, 2, 2], [1, 2, 0, 2], 3)
+    rank = np.empty(3, dtype=np.int64)
+    rank[order] = np.arange(0, 3)
+    coo = dag.tocoo()
+    assert coo.nnz == 2
+    assert np.all(rank[coo.row] < rank[coo.col])
+
+
+def test_main_path_is_the_heaviest_source_to_sink_path():
+    n = 10
+    src, tgt = random_dag(n, 0.35, 3)
+    dag, order = citation_dag(src, tgt, n)
+    spc, _ = search_path_counts(dag.indptr, dag.indices, order)
+    paths = ranked_main_paths(dag, order, spc, 2, 1)
+    weight = {}
+    for u in range(0, n):
+        for p in range(dag.indptr[u], dag.indptr[u + 1]):
+            weight[(u, int(dag.indices[p]))] = spc[p]
+    succ = {}
+    for (u, v) in weight:
+        succ.setdefault(u, []).append(v)
+    sources = set(succ) - {v for vs in succ.values() for v in vs}
+    best = max(
+        sum(weight[e] for e in zip(path[:-1], path[1:]))
+        for s in sources
+        for path in all_paths(succ, s)
+    )
+    found = sum(weight[e] for e in zip(paths[0][:-1], paths[0][1:]))
+    assert np.isclose(found, best)
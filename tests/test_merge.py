@@ -0,0 +1,138 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pybibx.base.pbx import pbx_probe
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+# Built in Row Order; Country and Institution Vocabularies come from Sets (Order Free)
+ORDERED = [
+    "data",
+    "dy",
+    "date_str",
+    "date_end",
+    "doc_types",
+    "av_d_year",
+    "citation",
+    "av_c_doc",
+    "ref",
+    "u_ref",
+    "aut",
+    "u_aut",
+    "aut_h",
+    "aut_g",
+    "aut_e",
+    "aut_docs",
+    "aut_single",
+    "aut_multi",
+    "aut_cit",
+    "author_to_papers",
+    "kid",
+    "u_kid",
+    "kid_count",
+    "auk",
+    "u_auk",
+    "auk_count",
+    "jou",
+    "u_jou",
+    "jou_count",
+    "jou_cit",
+    "lan",
+    "u_lan",
+    "lan_count",
+    "ctr",
+    "uni",
+    "author_country_map",
+    "corr_a_country_map",
+    "frst_a_country_map",
+    "doc_aut",
+    "av_doc_aut",
+    "t_c",
+    "s_c",
+    "r_c",
+    "dy_c_year",
+    "dy_ref",
+    "u_ref_id",
+    "ref_id",
+    "table_id_doc",
+    "dict_id_doc",
+    "dict_id_aut",
+    "dict_id_jou",
+    "dict_id_kwa",
+    "dict_id_kwp",
+]
+
+
+def same(x, y):
+    if isinstance(x, (pd.DataFrame, pd.Series)):
+        return x.equals(y)
+    return bool(np.all(x == y)) if isinstance(x, np.ndarray) else x == y
+
+
+def merged(incremental, near_dupl=False):
+    probe = pbx_probe(
+        os.path.join(BIBS, "scopus.bib"), db="scopus", near_dupl=near_dupl
+    )
+    probe.merge_database(
+        os.path.join(BIBS, "mcda_scopus.bib"), "scopus", True, near_dupl, incremental
+    )
+    probe.merge_database(
+        os.path.join(BIBS, "wos.bib"), "wos", True, near_dupl, incremental
+    )
+    return probe
+
+
+@pytest.fixture(scope="module")
+def probes():
+    return merged(True), merged(False)
+
+
+def test_incremental_merge_matches_full_merge(probes):
+    inc, full = probes
+    for name in ORDERED:
+        assert same(getattr(inc, name), getattr(full, name)), name
+    for name in ["author_inst_map", "corr_a_inst_map", "frst_a_inst_map"]:
+        a, b = getattr(inc, name), getattr(full, name)
+        assert {k: sorted(v) for k, v in a.items()} == {
+            k: sorted(v) for k, v in b.items()
+        }, name
+    for field in ["ctr", "uni"]:
+        u_a, u_b = getattr(inc, "u_" + field), getattr(full, "u_" + field)
+        assert sorted(u_a) == sorted(u_b)
+        for stat in ["_count", "_cit"]:
+            a = dict(zip(u_a, getattr(inc, field + stat)))
+            b = dict(zip(u_b, getattr(full, field + stat)))
+            assert a == b, field + stat
+
+
+def test_incremental_merge_keeps_entity_index_current(probes):
+    inc, full = probes
+    for field in ["aut", "jou", "ctr"]:
+        index = inc._pbx_probe__entity_index(field)
+        assert index == full._pbx_probe__entity_index(field)
+    inc.merge_database(os.path.join(BIBS, "scopus_m.bib"), "scopus", True, False, True)
+    full.merge_database(
+        os.path.join(BIBS, "scopus_m.bib"), "scopus", True, False, False
+    )
+    for field in ["aut", "jou", "ctr"]:
+        index = inc._pbx_probe__entity_index(field)
+        assert index == full._pbx_probe__entity_index(field)
+
+
+def test_incremental_merge_of_known_records_adds_nothing():
+    probe = pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+    u_aut = list(probe.u_aut)
+    size = probe.data.shape[0]
+    probe.merge_database(os.path.join(BIBS, "scopus.bib"), "scopus", True, False, True)
+    assert probe.data.shape[0] == size
+    assert probe.dupl_report.shape[0] == size
+    assert probe.u_aut == u_aut
+
+
+def test_incremental_near_duplicates_match_full_merge():
+    inc, full = merged(True, near_dupl=True), merged(False, near_dupl=True)
+    assert inc.data.equals(full.data)
+    assert inc.u_aut == full.u_aut
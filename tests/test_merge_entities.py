@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+from pybibx.base.pbx import pbx_probe
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+@pytest.fixture()
+def probe():
+    return pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+
+
+def replace_rows(column, get, replace_for):
+    column = column.tolist()
+    for name in get:
+        for i in range(0, len(column)):
+            target = column[i].lower()
+            if name.lower() in target:
+                column[i] = target.replace(name.lower(), replace_for)
+    return column
+
+
+def test_merge_author_matches_row_by_row_replacement(probe):
+    get = [probe.u_aut[0].upper(), probe.u_aut[5]]
+    expected = replace_rows(probe.data["author"], get, "merged, a.")
+    probe.merge_author(get, "merged, a.")
+    assert probe.data["author"].tolist() == expected
+    assert "merged, a." in probe.u_aut
+    assert all(name.lower() not in probe.u_aut for name in get)
+
+
+def test_merge_country_pools_counts_into_the_target(probe):
+    counts = dict(zip(probe.u_ctr, probe.ctr_count))
+    expected = replace_rows(probe.data["affiliation"], ["France"], "italy")
+    probe.merge_country(["France"], "italy")
+    assert probe.data["affiliation"].tolist() == expected
+    assert "France" not in probe.u_ctr
+    merged = dict(zip(probe.u_ctr, probe.ctr_count))
+    assert merged["Italy"] == counts["Italy"] + counts["France"]
+
+
+def test_merge_entities_accepts_fuzzy_matcher_groups(probe):
+    a, b, c = probe.u_jou[0], probe.u_jou[1], probe.u_jou[2]
+    counts = dict(zip(probe.u_jou, probe.jou_count))
+    probe.merge_entities({a: [b], b: [c]}, entity="jou")
+    merged = dict(zip(probe.u_jou, probe.jou_count))
+    assert b not in merged and c not in merged
+    assert merged[a] == counts[a] + counts[b] + counts[c]
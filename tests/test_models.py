@@ -0,0 +1,87 @@
+import pytest
+
+from pybibx.base import pbx
+from pybibx.base.pbx import model_registry, model_size_mb, pbx_probe
+
+
+class tensor:
+    def __init__(self, mb):
+        self.mb = mb
+
+    def numel(self):
+        return self.mb * 2**18
+
+    def element_size(self):
+        return 4
+
+
+class network:
+    def __init__(self, name, mb):
+        self.name = name
+        self.mb = mb
+
+    def parameters(self):
+        return [tensor(self.mb)]
+
+
+@pytest.fixture()
+def loads(monkeypatch):
+    loads = []
+    sizes = {"a": 100, "b": 200, "c": 300}
+
+    def load(name):
+        loads.append(name)
+        return network(name, sizes[name])
+
+    monkeypatch.setitem(pbx.model_loaders, "sentence", load)
+    monkeypatch.setitem(
+        pbx.model_loaders, "pegasus", lambda name: (load(name), load(name))
+    )
+    return loads
+
+
+def test_model_size_mb_reads_parameters_tuples_and_wrappers():
+    assert model_size_mb(network("a", 100)) == 100
+    assert model_size_mb((network("a", 100), network("b", 50))) == 150
+    wrapper = type("wrapper", (), {"model": network("c", 30)})()
+    assert model_size_mb(wrapper) == 30
+    assert model_size_mb(object()) == 0.0
+
+
+def test_registry_loads_each_model_once(loads):
+    registry = model_registry(budget_mb=1000)
+    first = registry.get("sentence", "a")
+    assert registry.get("sentence", "a") is first
+    assert loads == ["a"]
+    tokenizer, model = registry.get("pegasus", "b")
+    assert registry.get("pegasus", "b")[1] is model
+    assert loads == ["a", "b", "b"]
+    assert registry.total_mb() == 500
+
+
+def test_registry_evicts_least_recently_used_beyond_budget(loads):
+    registry = model_registry(budget_mb=450)
+    registry.get("sentence", "a")
+    registry.get("sentence", "b")
+    registry.get("sentence", "a")
+    registry.get("sentence", "c")
+    assert list(registry.models) == [("sentence", "a"), ("sentence", "c")]
+    registry.get("sentence", "b")
+    assert list(registry.models) == [("sentence", "b")]
+    registry.budget_mb = 100
+    registry.get("sentence", "c")
+    assert list(registry.models) == [("sentence", "c")]
+    assert loads == ["a", "b", "c", "b", "c"]
+
+
+def test_models_warmup_and_release(loads, monkeypatch):
+    registry = model_registry(budget_mb=1000)
+    monkeypatch.setattr(pbx, "model_cache", registry)
+    probe = pbx_probe.__new__(pbx_probe)
+    probe.models_warmup([("sentence", "a"), ("sentence", "b")], budget_mb=250)
+    assert list(registry.models) == [("sentence", "b")]
+    probe.models_warmup([("sentence", "a")])
+    probe.models_release("sentence", "b")
+    assert list(registry.models) == [("sentence", "a")]
+    probe.models_release()
+    assert len(registry.models) == 0
@@ -1,5 +1,5 @@
 import pytest
-from pybibx.pybibx.base.pbx import pbx_probe
+from pybibx.base.pbx import pbx_probe
 
 def test_pbx_probe_initialization():
     # This is a basic smoke test to ensure the class can be instantiated.
@@ -0,0 +1,51 @@
+import os
+
+import pandas as pd
+import pytest
+
+from pybibx.base.pbx import pbx_probe
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+@pytest.fixture(scope="module")
+def probe():
+    return pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+
+
+def scan_princes(probe, metrics):
+    results = []
+    for sb_id in metrics["ref"]:
+        citers = [
+            i
+            for i, refs in enumerate(probe.ref_id)
+            if sb_id in refs and probe.dy[i] != -1
+        ]
+        counts = {
+            str(c): sum(1 for i in citers if str(c) in probe.ref_id[i]) for c in citers
+        }
+        if counts:
+            prince = max(counts, key=counts.get)
+            results.append(
+                (sb_id, prince, int(probe.dy[int(prince)]), counts[prince])
+            )
+        else:
+            results.append((sb_id, None, None, 0))
+    return results
+
+
+def test_detect_princes_matches_citer_scan(probe):
+    metrics = probe.detect_sleeping_beauties(topn=30, min_count=2)
+    metrics = pd.concat([metrics, pd.DataFrame({"ref": ["r_missing"]})])
+    princes = probe.detect_princes(metrics)
+    found = [
+        (
+            row["SB_id"],
+            None if pd.isna(row["PR_id"]) else row["PR_id"],
+            None if pd.isna(row["PR_pub_year"]) else int(row["PR_pub_year"]),
+            int(row["co_citation_count"]),
+        )
+        for _, row in princes.iterrows()
+    ]
+    assert found == scan_princes(probe, metrics)
+    assert any(row[3] > 0 for row in found)
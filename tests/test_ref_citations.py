@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from pybibx.base.pbx import pbx_probe
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+@pytest.fixture(scope="module")
+def probe():
+    return pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+
+
+def scan_citations(probe, date_start=None, date_end=None, tgt_ref_id=[]):
+    ref_year = dict(zip(probe.u_ref, probe.dy_ref))
+    found = {}
+    for i, year in enumerate(probe.dy):
+        year = int(year)
+        if (date_start is not None and year < date_start) or (
+            date_end is not None and year > date_end
+        ):
+            continue
+        for name, ref_id in zip(probe.ref[i], probe.ref_id[i]):
+            if name.lower() == "unknown" or (tgt_ref_id and ref_id not in tgt_ref_id):
+                continue
+            entry = found.setdefault(name, (ref_id, ref_year[name], set()))
+            entry[2].add((i, year))
+    return {name: (r, y, sorted(c)) for name, (r, y, c) in found.items()}
+
+
+def as_dict(table):
+    return {
+        row["Reference"]: (
+            row["Reference ID"],
+            row["Reference Year"],
+            sorted(row["Citing Articles"]),
+        )
+        for _, row in table.iterrows()
+    }
+
+
+@pytest.mark.parametrize(
+    "date_start, date_end", [(None, None), (2015, None), (None, 2012), (2010, 2016)]
+)
+def test_ref_citation_matrix_matches_row_scan(probe, date_start, date_end):
+    table = probe.ref_citation_matrix(date_start=date_start, date_end=date_end)
+    assert as_dict(table) == scan_citations(probe, date_start, date_end)
+
+
+def test_ref_citation_matrix_filters_target_references(probe):
+    targets = probe.u_ref_id[:5]
+    table = probe.ref_citation_matrix(tgt_ref_id=targets, date_start=2012)
+    assert set(table["Reference ID"]) <= set(targets)
+    assert as_dict(table) == scan_citations(probe, 2012, None, targets)
@@ -0,0 +1,51 @@
+import os
+
+import pandas as pd
+import pytest
+
+from pybibx.base.pbx import pbx_probe
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+class topic_model:
+    def __init__(self, papers):
+        self.papers = papers
+
+    def get_representative_docs(self):
+        return self.papers
+
+
+@pytest.fixture(scope="module")
+def probe():
+    return pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+
+
+def test_topics_representatives_resolve_duplicate_texts_by_topic(probe):
+    corpus, keys = probe._pbx_probe__topic_text(["en"], [])
+    rows = [0, 1, 2, 0, 3]
+    probe.topic_corpus = [corpus[i] for i in rows]
+    probe.topic_keys = [keys[i] for i in rows]
+    probe.topics = [1, 0, 0, 0, 1]
+    probe.topic_info = pd.DataFrame({"Topic": [-1, 0, 1], "Count": [0, 3, 2]})
+    probe.topic_model = topic_model(
+        {
+            -1: [corpus[2]],
+            0: [corpus[1], corpus[0], corpus[0]],
+            1: [corpus[0], corpus[3], "not in the corpus"],
+        }
+    )
+    table = probe.topics_representatives()
+    assert table["Topic"].tolist() == [-1, 0, 1]
+    assert table["Docs"].tolist() == ["", "1; 3; 0", "0; 4"]
+
+
+def test_topic_doc_index_follows_new_topic_keys(probe):
+    corpus, keys = probe._pbx_probe__topic_text(["en"], [])
+    probe.topic_keys = keys[:10]
+    probe.topics = [0] * 10
+    probe.topic_info = pd.DataFrame({"Topic": [0], "Count": [10]})
+    probe.topic_model = topic_model({0: [corpus[12], corpus[4]]})
+    assert probe.topics_representatives()["Docs"].tolist() == ["4"]
+    probe.topic_keys = keys[10:20]
+    assert probe.topics_representatives()["Docs"].tolist() == ["2"]
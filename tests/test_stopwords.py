@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from pybibx.base import stws
+from pybibx.base.pbx import pbx_probe, stopword_alias, stopword_files, stopword_set
+
+
+def stopword_alias_of(name):
+    return next(alias for alias, value in stopword_alias.items() if value[0] == name)
+
+
+def test_every_shipped_stopword_file_is_registered():
+    folder = os.path.dirname(stws.__file__)
+    shipped = {name for name in os.listdir(folder) if name.endswith(".txt")}
+    assert {name for name, _ in stopword_files.values()} == shipped
+
+
+def test_stopword_files_decode_with_their_encodings():
+    folder = os.path.dirname(stws.__file__)
+    for name, encoding in stopword_files.values():
+        with open(os.path.join(folder, name), "rb") as file:
+            lines = file.read().decode(encoding).split("\n")
+        words = {line.rstrip("\r") for line in lines} - {""}
+        assert stopword_set(stopword_alias_of(name)) == words, name
+
+
+def test_aliases_share_one_cached_set():
+    english = stopword_set("en")
+    assert "the" in english
+    assert stopword_set("eng") is english and stopword_set("english") is english
+    assert stopword_set("hindi") is stopword_set("hi")
+    with pytest.raises(ValueError):
+        stopword_set("klingon")
+
+
+def test_clear_text_drops_registry_and_custom_words():
+    probe = pbx_probe.__new__(pbx_probe)
+    corpus = ["The analysis of the DATA und der Modelle", "a model for data"]
+    cleaned = probe.clear_text(corpus, stop_words=["en", "de"])
+    assert cleaned == ["analysis data modelle", "model data"]
+    cleaned = probe.clear_text(corpus, stop_words=[], rmv_custom_words=["data"])
+    assert cleaned == ["the analysis of the und der modelle", "a model for"]
@@ -0,0 +1,119 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pybibx.base import pbx
+from pybibx.base.pbx import cached_umap, pbx_probe
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+class umap:
+    fits = 0
+
+    def __init__(self, **params):
+        self.params = params
+
+    def fit_transform(self, X, y=None):
+        umap.fits = umap.fits + 1
+        return np.asarray(X)[:, :2] * 2
+
+    def transform(self, X):
+        return np.asarray(X)[:, :2] * 3
+
+
+class encoder:
+    def __init__(self):
+        self.seen = []
+
+    def get_sentence_embedding_dimension(self):
+        return 4
+
+    def encode(self, texts, batch_size=32):
+        self.seen.extend(texts)
+        return np.array([[len(t), 1, 2, 3] for t in texts], dtype=np.float32)
+
+
+class bertopic:
+    def __init__(self, umap_model=None, embedding_model=None, **params):
+        self.umap_model = umap_model
+        self.embeddings = None
+        self.calls = 0
+
+    def fit_transform(self, docs, embeddings=None):
+        self.embeddings = embeddings
+        return [0] * len(docs), np.ones((len(docs), 1))
+
+    def get_topic_info(self):
+        return pd.DataFrame({"Topic": [0], "Count": [1]})
+
+    def approximate_distribution(self, docs, calculate_tokens=True):
+        self.calls = self.calls + len(docs)
+        return None, [[doc] for doc in docs]
+
+    def visualize_approximate_distribution(self, doc, token):
+        data = pd.DataFrame({"a": [len(doc)]}, index=["0_a"])
+        return type("styler", (), {"data": data})()
+
+
+@pytest.fixture(scope="module")
+def probe():
+    return pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+
+
+def test_cached_umap_refits_only_on_new_embeddings(monkeypatch):
+    monkeypatch.setattr(pbx, "UMAP", umap)
+    umap.fits = 0
+    X = np.arange(0, 30, dtype=np.float64).reshape(10, 3)
+    reducer = cached_umap(n_components=2)
+    first = reducer.fit(X).reduced
+    assert reducer.fit(X.copy()).reduced is first
+    assert umap.fits == 1
+    assert reducer.transform(X) is first
+    assert np.array_equal(reducer.transform(X[:4]), X[:4, :2] * 3)
+    reducer.fit(X, y=np.zeros(10))
+    reducer.fit(X + 1)
+    assert umap.fits == 3
+
+
+def test_topics_creation_reuses_create_embeddings(probe, monkeypatch, tmp_path):
+    model = encoder()
+    monkeypatch.setattr(pbx.model_cache, "get", lambda kind, name: model)
+    monkeypatch.setattr(pbx, "embedding_stores", {})
+    monkeypatch.setattr(pbx, "BERTopic", bertopic)
+    monkeypatch.setattr(pbx, "UMAP", umap)
+    probe.create_embeddings(model="m", cache_dir=str(tmp_path))
+    assert len(model.seen) > 0
+    model.seen = []
+    probe.topics_creation(embeddings=True, model="m", cache_dir=str(tmp_path))
+    assert model.seen == []
+    assert probe.topic_model.embeddings is probe.embds
+    probe.topics_creation(
+        rmv_custom_words=["model"], embeddings=True, model="m", cache_dir=""
+    )
+    assert len(model.seen) > 0
+    assert probe.topic_model.embeddings is not probe.embds
+
+
+def test_topics_words_memoizes_per_document(probe, monkeypatch):
+    probe.topic_model = bertopic()
+    first = probe.topics_words(3)
+    assert probe.topic_model.calls == 1
+    tables = probe.topics_words([3, 5, 5, 7])
+    assert probe.topic_model.calls == 3
+    assert tables[0] is first
+    assert list(first.columns) == ["Topic 0"]
+    probe.topic_model = bertopic()
+    probe.topics_words(3)
+    assert probe.topic_model.calls == 1
+
+
+def test_topics_words_memo_is_cleared_when_the_database_is_rebuilt():
+    probe = pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+    probe.topic_model = bertopic()
+    probe.topics_words(3)
+    probe.filter_bib(year_str=2015)
+    probe.topics_words(3)
+    assert probe.topic_model.calls == 2
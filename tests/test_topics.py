@@ -0,0 +1,119 @@
+import os
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pybibx.base import pbx
+from pybibx.base.pbx import pbx_probe
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+class topic_model:
+    def __init__(self, sizes):
+        self.topic_sizes_ = dict(sizes)
+        self.calls = []
+
+    def transform(self, docs, embeddings=None):
+        self.calls.append(("transform", len(docs)))
+        topics = [len(doc) % 3 for doc in docs]
+        return topics, np.full((len(docs), 3), 0.5)
+
+    def partial_fit(self, docs, embeddings=None):
+        self.calls.append(("partial_fit", len(docs)))
+        self.topics_ = [len(doc) % 3 for doc in docs]
+        for topic, count in Counter(self.topics_).items():
+            self.topic_sizes_[topic] = self.topic_sizes_.get(topic, 0) + count
+        return self
+
+    def get_topic_info(self):
+        sizes = sorted(self.topic_sizes_.items())
+        return pd.DataFrame(sizes, columns=["Topic", "Count"])
+
+    def save(self, path):
+        self.calls.append(("save", path))
+
+
+def fitted(probe, rows, online=False):
+    corpus, keys = probe._pbx_probe__topic_text(["en"], [])
+    probe.topic_opts = {
+        "stop_words": ["en"],
+        "rmv_custom_words": [],
+        "embeddings": False,
+        "model": "",
+        "cache_dir": "",
+        "online": online,
+        "n_topics": 3,
+        "batch_size": 100,
+    }
+    probe.topic_corpus = [corpus[i] for i in rows]
+    probe.topic_keys = [keys[i] for i in rows]
+    probe.topics = [i % 3 for i in rows]
+    probe.probs = None if online else np.full((len(rows), 3), 0.25)
+    probe.topic_model = topic_model(Counter(probe.topics))
+    return probe
+
+
+@pytest.fixture
+def probe():
+    return pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+
+
+def test_topics_update_without_options_raises(probe):
+    with pytest.raises(ValueError):
+        probe.topics_update()
+
+
+def test_topics_update_without_new_documents_is_a_no_op(probe):
+    fitted(probe, list(range(0, probe.data.shape[0])))
+    topics, probs = list(probe.topics), probe.probs.copy()
+    sizes = dict(probe.topic_model.topic_sizes_)
+    probe.topics_update()
+    assert probe.topic_model.calls == []
+    assert probe.topics == topics
+    assert np.array_equal(probe.probs, probs)
+    assert probe.topic_model.topic_sizes_ == sizes
+
+
+@pytest.mark.parametrize("online", [False, True])
+def test_topics_update_assigns_only_new_documents(probe, online):
+    n = probe.data.shape[0]
+    fitted(probe, list(range(0, n - 20)), online)
+    old = list(probe.topics)
+    probe.topics_update()
+    kind = "partial_fit" if online else "transform"
+    assert [call[0] for call in probe.topic_model.calls] == [kind]
+    assert 0 < probe.topic_model.calls[0][1] <= 20
+    assert len(probe.topics) == n
+    assert probe.topics[: n - 20] == old
+    assert probe.topic_model.topic_sizes_ == Counter(probe.topics)
+    if not online:
+        assert probe.probs.shape == (n, 3)
+
+
+def test_topics_update_shrinks_sizes_of_removed_documents(probe):
+    n = probe.data.shape[0]
+    fitted(probe, list(range(0, n)))
+    probe.filter_bib(documents=list(range(0, n - 30)))
+    probe.topics_update()
+    assert probe.topic_model.calls == []
+    assert len(probe.topics) == n - 30
+    sizes = {k: v for k, v in probe.topic_model.topic_sizes_.items() if v > 0}
+    assert sizes == Counter(probe.topics)
+
+
+def test_topics_save_and_load_restore_update_state(probe, tmp_path, monkeypatch):
+    fitted(probe, list(range(0, probe.data.shape[0] - 10)))
+    model = probe.topic_model
+    path = str(tmp_path / "model")
+    probe.topics_save_file(path)
+    state = (dict(probe.topic_opts), list(probe.topics), list(probe.topic_keys))
+    probe.topic_opts, probe.topics, probe.topic_keys = {}, [], []
+    monkeypatch.setattr(pbx.BERTopic, "load", lambda saved_file: model, raising=False)
+    probe.topics_load_file(path)
+    assert (probe.topic_opts, probe.topics, probe.topic_keys) == state
+    assert probe.probs.shape == (len(state[1]), 3)
+    probe.topics_update()
+    assert [call[0] for call in model.calls] == ["save", "transform"]
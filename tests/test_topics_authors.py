@@ -0,0 +1,37 @@
+import os
+
+import numpy as np
+import pytest
+
+from pybibx.base.pbx import pbx_probe
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+@pytest.fixture(scope="module")
+def probe():
+    probe = pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+    probe.topics = [(i * 7) % 5 - 1 for i in range(0, probe.data.shape[0])]
+    return probe
+
+
+def test_topics_authors_counts_each_author_document_once(probe):
+    summary = probe.topics_authors(topn=-1)
+    assert summary.shape == (len(probe.u_aut), 6)
+    assert list(summary.columns) == [-1, 0, 1, 2, 3, "Total"]
+    for author in probe.u_aut[::10]:
+        docs = [i for i, row in enumerate(probe.aut) if author in row]
+        for topic in [-1, 0, 1, 2, 3]:
+            count = sum(1 for i in docs if probe.topics[i] == topic)
+            assert summary.loc[author, topic] == count
+        assert summary.loc[author, "Total"] == len(docs)
+    assert summary["Total"].is_monotonic_decreasing
+
+
+def test_topics_authors_keeps_the_top_authors(probe):
+    summary = probe.topics_authors(topn=15)
+    full = probe.topics_authors(topn=-1)
+    assert summary.shape[0] == 15
+    assert summary.equals(full.iloc[:15, :])
+    totals = np.sort(np.asarray(probe.doc_aut))[::-1][:15]
+    assert summary["Total"].tolist() == totals.tolist()
@@ -0,0 +1,104 @@
+import os
+import re
+
+import numpy as np
+import pytest
+
+from pybibx.base import pbx
+from pybibx.base.pbx import pbx_probe, token_stream
+
+BIBS = os.path.join(os.path.dirname(__file__), "..", "assets", "bibs")
+
+
+class fasttext:
+    calls = []
+
+    def __init__(self, corpus_file, **params):
+        fasttext.calls.append(("train", corpus_file))
+        with open(corpus_file, encoding="utf-8") as f:
+            words = dict.fromkeys(f.read().split())
+        self.wv = type("wv", (dict,), {"index_to_key": list(words)})(
+            {word: np.ones(3) for word in words}
+        )
+
+    def save(self, path):
+        fasttext.calls.append(("save", path))
+        with open(path, "w") as f:
+            f.write(" ".join(self.wv.index_to_key))
+
+    @staticmethod
+    def load(path):
+        fasttext.calls.append(("load", path))
+        model = fasttext.__new__(fasttext)
+        with open(path) as f:
+            words = f.read().split()
+        model.wv = type("wv", (dict,), {"index_to_key": words})(
+            {word: np.ones(3) for word in words}
+        )
+        return model
+
+
+@pytest.fixture(scope="module")
+def probe():
+    return pbx_probe(os.path.join(BIBS, "scopus.bib"), db="scopus")
+
+
+def tokens(probe):
+    corpus = probe.clear_text(probe.data["abstract"].tolist(), rmv_special_chars=False)
+    return [re.findall(r"\b\w+\b", doc) for doc in corpus]
+
+
+def test_token_stream_is_restartable_and_indexable(tmp_path):
+    path = str(tmp_path / "corpus.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("a b c\n\nção d\ne\n")
+    stream = token_stream(path)
+    expected = [["a", "b", "c"], [], ["ção", "d"], ["e"]]
+    assert list(stream) == expected
+    assert list(stream) == expected
+    assert len(stream) == 4
+    assert stream[2] == ["ção", "d"] and stream[-1] == ["e"]
+    with pytest.raises(IndexError):
+        stream[4]
+
+
+def test_word_embeddings_stream_the_corpus_and_reuse_the_model(
+    probe, monkeypatch, tmp_path
+):
+    monkeypatch.setattr(pbx, "FastText", fasttext)
+    fasttext.calls = []
+    model, corpus, w_emb, vocab = probe.word_embeddings(cache_dir=str(tmp_path))
+    assert isinstance(corpus, token_stream)
+    assert list(corpus) == tokens(probe)
+    assert len(w_emb) == len(corpus[0])
+    assert [call[0] for call in fasttext.calls] == ["train", "save"]
+    _, again, _, vocab_again = probe.word_embeddings(cache_dir=str(tmp_path))
+    assert [call[0] for call in fasttext.calls] == ["train", "save", "load"]
+    assert again.path == corpus.path and vocab_again == vocab
+    probe.word_embeddings(cache_dir=str(tmp_path), epochs=3)
+    assert [call[0] for call in fasttext.calls][-2:] == ["train", "save"]
+
+
+def test_word_embeddings_find_doc_intersects_postings(probe, tmp_path):
+    path = str(tmp_path / "corpus.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(" ".join(doc) + "\n" for doc in tokens(probe))
+    corpus = token_stream(path)
+    abstracts = probe.data["abstract"].tolist()
+    for words in [["decision"], ["decision", "criteria"], ["criteria", "zzzz"]]:
+        found = probe.word_embeddings_find_doc(corpus, words)
+        docs = [i for i, doc in enumerate(corpus) if all(w in doc for w in words)]
+        assert found == [(i, abstracts[i]) for i in docs]
+    assert len(probe.word_embeddings_find_doc(corpus, ["decision"])) > 0
+    assert len(probe.word_embeddings_find_doc(corpus)) == len(abstracts)
+
+
+def test_word_embeddings_corpus_file_does_not_depend_on_chunk_size(
+    probe, monkeypatch, tmp_path
+):
+    monkeypatch.setattr(pbx, "FastText", fasttext)
+    _, corpus, _, _ = probe.word_embeddings(cache_dir=str(tmp_path))
+    _, chunked, _, _ = probe.word_embeddings(cache_dir=str(tmp_path), chunk_size=7)
+    assert chunked.path == corpus.path
+    assert list(chunked) == tokens(probe)
+    assert not any(name.endswith(".tmp") for name in os.listdir(str(tmp_path)))